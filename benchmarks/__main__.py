@@ -0,0 +1,5 @@
+import sys
+from benchmarks.run import main
+
+# Run the benchmarks
+sys.exit(main())
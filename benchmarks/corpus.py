@@ -0,0 +1,162 @@
+import os
+import random
+import zlib
+from mido import Message, MetaMessage, MidiFile, MidiTrack
+
+# The ticks per beat of every generated song
+TICKS_PER_BEAT = 480
+
+# Create a track from a list of (absolute time, message)
+def create_track(events, name=None):
+	# Create the track
+	track = MidiTrack()
+	# If it has a name
+	if(name != None):
+		# Add it at the beginning
+		track.append(MetaMessage("track_name", name=name, time=0))
+	# Sort the messages by time(keeping the order of messages at the same time)
+	events.sort(key=lambda event: event[0])
+	# Create a variable to store the time of the last message
+	last_time = 0
+	# Loop through the messages
+	for time, msg in events:
+		# Add the message with the time since the last message
+		track.append(msg.copy(time=time - last_time))
+		last_time = time
+	# Return the track
+	return track
+
+# Create the messages of a note
+def note_events(start, end, pitch, velocity, channel=0):
+	return [(start, Message("note_on", note=pitch, velocity=velocity, channel=channel)), (end, Message("note_off", note=pitch, velocity=0, channel=channel))]
+
+# Piano music with chords, runs, sustain and sostenuto pedalling
+def dense_piano(rng, size):
+	# Create lists for the messages
+	events = []
+	# Create a variable to store the number of notes added
+	count = 0
+	# Create a variable to store the current bar
+	bar = 0
+	# Add bars until there are enough notes
+	while count < size:
+		# Get the time of the bar
+		time = bar * 4 * TICKS_PER_BEAT
+		# Press the sustain pedal just after the bar starts and release it just before it ends
+		events.append((time + 10, Message("control_change", control=64, value=127)))
+		events.append((time + 4 * TICKS_PER_BEAT - 10, Message("control_change", control=64, value=0)))
+		# Every 4 bars, hold a bass note with the sostenuto pedal
+		if(bar % 4 == 0):
+			events += note_events(time, time + TICKS_PER_BEAT, rng.randrange(28, 40), rng.randrange(60, 100))
+			events.append((time + 20, Message("control_change", control=66, value=127)))
+			events.append((time + 16 * TICKS_PER_BEAT - 30, Message("control_change", control=66, value=0)))
+			count += 1
+		# Add a chord on every beat
+		for beat in range(4):
+			root = rng.randrange(48, 60)
+			for interval in (0, 4, 7, 11)[:rng.randrange(3, 5)]:
+				events += note_events(time + beat * TICKS_PER_BEAT, time + (beat + 1) * TICKS_PER_BEAT - rng.randrange(0, 40), root + interval, rng.randrange(40, 90))
+				count += 1
+		# Add a run of sixteenth notes
+		pitch = rng.randrange(60, 84)
+		for step in range(16):
+			pitch = min(max(pitch + rng.choice((-2, -1, 1, 2)), 36), 100)
+			events += note_events(time + step * TICKS_PER_BEAT // 4, time + (step + 1) * TICKS_PER_BEAT // 4, pitch, rng.randrange(50, 110))
+			count += 1
+		bar += 1
+	# Return the song as a single piano track
+	return 1, [create_track(events, "Piano")]
+
+# A format 0 dump of 16 channels
+def format0_channels(rng, size):
+	# Create a list for the messages
+	events = [(0, MetaMessage("set_tempo", tempo=500000))]
+	# Loop through the channels
+	for channel in range(16):
+		# Give each channel a patch
+		events.append((0, Message("program_change", channel=channel, program=(channel * 8) % 128)))
+		# Add the channel's share of the notes
+		time = 0
+		for j in range(size // 16):
+			time += rng.choice((0, TICKS_PER_BEAT // 4, TICKS_PER_BEAT // 2))
+			events += note_events(time, time + rng.choice((TICKS_PER_BEAT // 4, TICKS_PER_BEAT // 2, TICKS_PER_BEAT, 2 * TICKS_PER_BEAT)), rng.randrange(36, 96), rng.randrange(30, 127), channel)
+	# Return the song as a single track
+	return 0, [create_track(events)]
+
+# A song with a tempo change every few ticks
+def tempo_changes(rng, size):
+	# Create a track with a tempo change every eighth note
+	tempo_events = [(j * TICKS_PER_BEAT // 2, MetaMessage("set_tempo", tempo=rng.randrange(300000, 900000))) for j in range(size)]
+	# Create a melody with two notes for every tempo change
+	note_list = []
+	for j in range(2 * size):
+		start = j * TICKS_PER_BEAT // 4 + rng.randrange(0, 20)
+		note_list += note_events(start, start + rng.choice((TICKS_PER_BEAT // 4, TICKS_PER_BEAT // 2, TICKS_PER_BEAT)), rng.randrange(48, 84), rng.randrange(40, 110))
+	# Return the song with a tempo track and a melody track
+	return 1, [create_track(tempo_events, "Tempo"), create_track(note_list, "Rubato")]
+
+# Several tracks that change their patch every few notes
+def program_changes(rng, size):
+	# Create a list for the tracks
+	tracks = []
+	# Loop through the tracks
+	for channel in range(4):
+		# Create a list for the messages
+		events = []
+		time = 0
+		# Add the track's share of the notes
+		for j in range(size // 4):
+			# Change the patch every 4 notes
+			if(j % 4 == 0):
+				events.append((time, Message("program_change", channel=channel, program=rng.randrange(128))))
+			events += note_events(time, time + TICKS_PER_BEAT // 2, rng.randrange(40, 90), rng.randrange(40, 110), channel)
+			time += rng.choice((TICKS_PER_BEAT // 8, TICKS_PER_BEAT // 4, TICKS_PER_BEAT // 2))
+		tracks.append(create_track(events, "Automation " + str(channel + 1)))
+	# Return the song
+	return 1, tracks
+
+# Black MIDI, with a huge number of short overlapping notes
+def black_midi(rng, size):
+	# Create a list for the tracks
+	tracks = []
+	# Loop through the tracks
+	for channel in range(16):
+		# Create a list for the messages
+		events = []
+		# Add the track's share of the notes
+		for j in range(size // 16):
+			start = j // 8 * 15 + rng.randrange(0, 30)
+			events += note_events(start, start + rng.randrange(5, 120), rng.randrange(128), rng.randrange(1, 128), channel)
+		tracks.append(create_track(events, "Black " + str(channel + 1)))
+	# Return the song
+	return 1, tracks
+
+# The cases to generate with the number of notes(or tempo changes for tempo_changes) of each size
+CASES = {
+	"dense_piano": (dense_piano, (1000, 10000, 100000)),
+	"format0_channels": (format0_channels, (1000, 10000, 100000)),
+	"tempo_changes": (tempo_changes, (1000, 5000, 20000)),
+	"program_changes": (program_changes, (1000, 10000, 100000)),
+	"black_midi": (black_midi, (100000, 300000, 1000000)),
+}
+
+# Generate a song of a case and size, returning its path(songs that were already generated are reused)
+def generate(directory, case, size):
+	# Get the path of the song
+	path = os.path.join(directory, case + "_" + str(size) + ".mid")
+	# If it was already generated
+	if(os.path.isfile(path)):
+		# Use it
+		return path
+	# Seed the random numbers with the case and size so the song is always the same
+	rng = random.Random(zlib.crc32((case + "_" + str(size)).encode()))
+	# Create the tracks
+	song_type, tracks = CASES[case][0](rng, size)
+	# Save the song(to a temporary file first so an interrupted run doesn't leave a broken song)
+	song = MidiFile(type=song_type, ticks_per_beat=TICKS_PER_BEAT)
+	song.tracks.extend(tracks)
+	os.makedirs(directory, exist_ok=True)
+	song.save(path + ".tmp")
+	os.replace(path + ".tmp", path)
+	# Return the path
+	return path
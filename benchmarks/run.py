@@ -0,0 +1,211 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from array import array
+import midi_parser as mp
+import smf
+from benchmarks import corpus
+
+# The number of lookups timed for get_tempo and get_patch
+TEMPO_LOOKUPS = 100
+PATCH_LOOKUPS = 100000
+
+# The most notes get_track_index is timed with(it is much slower than assign_track_indices)
+TRACK_INDEX_NOTES = 2000
+
+# Create the parser for the command line arguments
+def create_argument_parser():
+	# Create the parser
+	parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Time midi_parser on generated MIDI files of increasing size.")
+	parser.add_argument("-o", "--output", default="benchmark_results.json", help="JSON file to write the results to(default: %(default)s)")
+	parser.add_argument("--corpus", default=os.path.join(tempfile.gettempdir(), "midisplitter_benchmarks"), help="directory to generate the songs in(default: %(default)s)")
+	parser.add_argument("--cases", nargs="+", choices=list(corpus.CASES), default=list(corpus.CASES), help="cases to run(default: all)")
+	parser.add_argument("--sizes", nargs="+", type=int, default=None, help="sizes to run every case at instead of their own sizes")
+	parser.add_argument("--quick", action="store_true", help="only run the smallest two sizes of each case")
+	parser.add_argument("--repeat", type=int, default=1, help="number of times to time each function, the fastest time is kept(default: %(default)s)")
+	parser.add_argument("--workers", type=int, default=1, help="workers to pass to parse(default: %(default)s)")
+	parser.add_argument("--no-memory", action="store_true", help="don't measure the peak memory(it runs everything a second time)")
+	return parser
+
+# Time a function and measure its peak memory, returning (fastest seconds, peak bytes or None, result of the fastest run)
+def measure(function, setup, repeat, memory):
+	# Create variables to store the fastest time and its result
+	best_time = None
+	best_result = None
+	# Loop through the runs
+	for j in range(max(repeat, 1)):
+		# Get fresh arguments
+		arguments = setup()
+		# Time the function
+		start_time = time.perf_counter()
+		result = function(*arguments)
+		elapsed = time.perf_counter() - start_time
+		# If this is the fastest run, keep it
+		if(best_time == None or elapsed < best_time):
+			best_time = elapsed
+			best_result = result
+	# Create a variable to store the peak memory
+	peak = None
+	# If the memory should be measured
+	if(memory):
+		# Run the function again while tracing the memory it allocates(this slows it down, so it isn't timed)
+		arguments = setup()
+		tracemalloc.start()
+		function(*arguments)
+		peak = tracemalloc.get_traced_memory()[1]
+		tracemalloc.stop()
+	# Return the time, memory and result
+	return best_time, peak, best_result
+
+# Load the tempo map, patch map and the notes of the largest track of a song the same way parse does
+def load_song(path):
+	# Load the song
+	song = smf.MidiReader(path)
+	# Collect the tempo and patch changes, counting the messages of each track
+	tempo_dict = {}
+	patch_map = mp.PatchMap()
+	sizes = []
+	for track in song.tracks:
+		sizes.append(0)
+		for tick_time, status, data1, data2 in track:
+			sizes[-1] += 1
+			if(status == smf.META and data1 == smf.SET_TEMPO):
+				tempo_dict[tick_time] = int.from_bytes(data2, "big")
+			if(status < 0xF0 and status & 0xF0 == 0xC0):
+				patch_map.add_patch(status & 0x0F, tick_time, data1)
+	tempo_map = mp.TempoMap(tempo_dict, song.ticks_per_beat)
+	# Get the notes of the track with the most messages(without aligning them)
+	track = song.tracks[sizes.index(max(sizes))]
+	notes = mp.process_track(track, tempo_map, tempo_map, 0, patch_map)[0]
+	# Return the maps and notes
+	return tempo_map, patch_map, notes
+
+# Copy a note table
+def copy_notes(notes, rows=None):
+	# Create the table
+	copy = mp.NoteTable()
+	# Copy every field(or only the first rows)
+	for field in copy.__slots__:
+		column = getattr(notes, field)
+		setattr(copy, field, array(column.typecode, column if rows == None else column[:rows]))
+	# Forget the track indices
+	copy.track_indices = array("i", [-1]) * len(copy.track_indices)
+	# Return the copy
+	return copy
+
+# Call get_track_index on every note of a list
+def index_all(notes):
+	for note in notes:
+		mp.get_track_index(note, notes)
+
+# Look up the tempo at a list of times
+def tempo_lookups(tempo_dict, times, ticks_per_beat, seconds):
+	for time in times:
+		mp.get_tempo(tempo_dict, time, ticks_per_beat, seconds)
+
+# Look up the patch of a list of (channel, time)
+def patch_lookups(patch_map, lookups):
+	for channel, time in lookups:
+		mp.get_patch(patch_map, channel, time)
+
+# Run the benchmarks of a song and return a list of results
+def run_song(case, size, path, arguments, output_file):
+	# Create a list for the results
+	results = []
+
+	# Add a result and print it
+	def record(function, seconds, peak, **extra):
+		result = {"case": case, "size": size, "function": function, "seconds": seconds, "peak_memory": peak}
+		result.update(extra)
+		results.append(result)
+		print("%-18s %8d  %-32s %9.4fs %s" % (case, size, function, seconds, "" if peak == None else "%8.1f MB" % (peak / 1000000)))
+		sys.stdout.flush()
+
+	memory = not arguments.no_memory
+
+	# Time parse, keeping the stats of each stage
+	seconds, peak, stats = measure(lambda stats: (mp.parse(path, output_file, "", "0.01", True, "", True, True, workers=arguments.workers, stats=stats), stats)[1], lambda: (mp.ParseStats(),), arguments.repeat, memory)
+	record("parse", seconds, peak, stats=stats.as_dict())
+
+	# Load the song for the other functions
+	tempo_map, patch_map, notes = load_song(path)
+	tempo_dict = dict(tempo_map.changes)
+
+	# Time converting the note times to seconds and back
+	seconds, peak, result = measure(mp.convert_note_time, lambda: (copy_notes(notes), tempo_map, True), arguments.repeat, memory)
+	record("convert_note_time(to_second)", seconds, peak, notes=len(notes))
+	seconds_notes = copy_notes(notes)
+	mp.convert_note_time(seconds_notes, tempo_map, True)
+	seconds, peak, result = measure(mp.convert_note_time, lambda: (copy_notes(seconds_notes), tempo_map, False), arguments.repeat, memory)
+	record("convert_note_time(to_tick)", seconds, peak, notes=len(notes))
+
+	# Time splitting the notes into tracks with assign_track_indices and get_track_index
+	seconds, peak, result = measure(mp.assign_track_indices, lambda: (copy_notes(notes),), arguments.repeat, memory)
+	record("assign_track_indices", seconds, peak, notes=len(notes))
+	count = min(len(notes), TRACK_INDEX_NOTES)
+	seconds, peak, result = measure(index_all, lambda: ([copy_notes(notes, count).note(j) for j in range(count)],), arguments.repeat, memory)
+	record("get_track_index", seconds, peak, notes=count)
+
+	# Time looking up tempos in ticks and seconds
+	last_tick = max(notes.ends) if len(notes) > 0 else 0
+	times = [last_tick * j // TEMPO_LOOKUPS for j in range(TEMPO_LOOKUPS)]
+	seconds, peak, result = measure(tempo_lookups, lambda: (tempo_dict, times, tempo_map.ticks_per_beat, False), arguments.repeat, memory)
+	record("get_tempo(ticks)", seconds, peak, calls=TEMPO_LOOKUPS, tempo_changes=len(tempo_dict))
+	times = [float(tempo_map.tick2second(time)) for time in times]
+	seconds, peak, result = measure(tempo_lookups, lambda: (tempo_dict, times, tempo_map.ticks_per_beat, True), arguments.repeat, memory)
+	record("get_tempo(seconds)", seconds, peak, calls=TEMPO_LOOKUPS, tempo_changes=len(tempo_dict))
+
+	# Time looking up patches
+	lookups = [(j % 16, last_tick * j // PATCH_LOOKUPS) for j in range(PATCH_LOOKUPS)]
+	seconds, peak, result = measure(patch_lookups, lambda: (patch_map, lookups), arguments.repeat, memory)
+	record("get_patch", seconds, peak, calls=PATCH_LOOKUPS)
+
+	# Return the results
+	return results
+
+# Run the benchmarks and return the exit code
+def main(args=None):
+	# Parse the arguments
+	arguments = create_argument_parser().parse_args(args)
+
+	# Create a list for the results
+	results = []
+	# Create a temporary file for parse to write to
+	output_file = os.path.join(tempfile.gettempdir(), "midisplitter_benchmark_output.mid")
+
+	# Loop through the cases
+	for case in arguments.cases:
+		# Get the sizes to run
+		sizes = arguments.sizes if arguments.sizes != None else corpus.CASES[case][1]
+		if(arguments.quick):
+			sizes = sizes[:2]
+		# Loop through the sizes
+		for size in sizes:
+			# Generate the song
+			path = corpus.generate(arguments.corpus, case, size)
+			# Run the benchmarks
+			results += run_song(case, size, path, arguments, output_file)
+
+	# Remove the output of parse
+	if(os.path.isfile(output_file)):
+		os.remove(output_file)
+
+	# Save the results with the environment they were measured in
+	with open(arguments.output, "w") as file:
+		json.dump({
+			"python": platform.python_version(),
+			"platform": platform.platform(),
+			"numpy": mp.np != None,
+			"repeat": arguments.repeat,
+			"workers": arguments.workers,
+			"results": results,
+		}, file, indent=1)
+	print("Saved results to " + arguments.output)
+
+	# Succeed
+	return 0
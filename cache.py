@@ -0,0 +1,101 @@
+import hashlib
+import os
+import tempfile
+import constants as c
+
+# A directory of converted files that can be reused when the same file is converted again with the same options
+class ConversionCache:
+	"""Converted files stored by a hash of their input file, options and the parser version
+
+	get returns the bytes of a converted file if it is in the cache and put adds one. Each file's
+	modification time is the last time it was used, and when the files add up to more than max_size bytes the
+	least recently used ones are removed. hits and misses count the lookups made with this object.
+	"""
+	def __init__(self, directory=None, max_size=c.CACHE_MAX_SIZE):
+		# Store the directory and the most bytes it can hold
+		self.directory = directory if directory != None else c.CACHE_DIRECTORY
+		self.max_size = max_size
+		# Create the counters
+		self.hits = 0
+		self.misses = 0
+
+	# Get the key of an input file(as bytes or a memory map) converted with some normalized options
+	def key(self, data, options):
+		# Hash the parser version and the options, then the input file
+		digest = hashlib.sha256(repr((c.PARSER_VERSION, tuple(options))).encode())
+		digest.update(data)
+		# Return the hash as text
+		return digest.hexdigest()
+
+	# Get the path of the file stored under a key
+	def path(self, key):
+		return os.path.join(self.directory, key + ".mid")
+
+	# Get the bytes of the file stored under a key, or None if it isn't stored
+	def get(self, key):
+		try:
+			# Read the file
+			with open(self.path(key), "rb") as file:
+				data = file.read()
+			# Mark it as just used
+			os.utime(self.path(key))
+		except OSError:
+			# If it isn't in the cache(or another process removed it), it is a miss
+			self.misses += 1
+			return None
+		# Count the hit
+		self.hits += 1
+		return data
+
+	# Store the bytes of a converted file under a key
+	def put(self, key, data):
+		try:
+			# Create the directory if it doesn't exist
+			os.makedirs(self.directory, exist_ok=True)
+			# Write to a temporary file first so other processes never see part of it
+			handle, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+			try:
+				with os.fdopen(handle, "wb") as file:
+					file.write(data)
+				os.replace(temporary_path, self.path(key))
+			except OSError:
+				os.remove(temporary_path)
+				raise
+			# Keep the cache under its size
+			self.evict()
+		except OSError:
+			# The conversion still worked, it just isn't cached
+			pass
+
+	# Remove the least recently used files until the cache fits in max_size
+	def evict(self):
+		# Get the (last use time, size, path) of every file
+		entries = []
+		for entry in os.scandir(self.directory):
+			# Only look at stored files
+			if(entry.is_file() and entry.name.endswith(".mid")):
+				status = entry.stat()
+				entries.append((status.st_mtime, status.st_size, entry.path))
+		# Get the total size
+		total_size = sum(entry[1] for entry in entries)
+		# Loop through the files from the least recently used
+		for last_use, size, path in sorted(entries):
+			# If the cache fits, stop
+			if(total_size <= self.max_size):
+				break
+			# Remove the file(another process may have already removed it)
+			try:
+				os.remove(path)
+			except FileNotFoundError:
+				pass
+			total_size -= size
+
+	# Remove every stored file
+	def clear(self):
+		# If there is no directory, there is nothing to remove
+		if(not os.path.isdir(self.directory)):
+			return
+		# Remove the stored files
+		for entry in os.scandir(self.directory):
+			if(entry.is_file() and entry.name.endswith(".mid")):
+				os.remove(entry.path)
@@ -0,0 +1,223 @@
+import argparse
+import glob
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import midi_parser as mp
+import constants as c
+from cache import ConversionCache
+
+# Create the parser for the command line arguments
+def create_argument_parser():
+	# Create the parser
+	parser = argparse.ArgumentParser(prog="main.py", description="Split the tracks of MIDI files without opening the interface.")
+	# Add the input and output arguments
+	parser.add_argument("inputs", nargs="+", help="MIDI files, directories or glob patterns to convert")
+	parser.add_argument("-o", "--output", default=None, help="directory to write the converted files to(defaults to next to each input file)")
+	parser.add_argument("-s", "--suffix", default="_split", help="text added to the name of each converted file(default: %(default)s)")
+	parser.add_argument("-r", "--recursive", action="store_true", help="also search the subdirectories of input directories")
+	# Add the options of parse
+	parser.add_argument("--velocity", default="", help="set the velocity of every note(1-127)")
+	parser.add_argument("--margin", default="", help="aligning margin in seconds")
+	parser.add_argument("--uncollated", action="store_true", help="output the split tracks of each track together instead of collated")
+	parser.add_argument("--tempo", default="", help="normalize the tempo to this BPM")
+	parser.add_argument("--no-channels", action="store_true", help="don't give each output track its own channel")
+	parser.add_argument("--no-index-patches", action="store_true", help="don't give each output track its own patch")
+	# Add the memory option
+	parser.add_argument("--low-memory", action="store_true", help="split one track at a time and keep finished tracks in a temporary file instead of memory(slower, not cached)")
+	# Add the stats option
+	parser.add_argument("--stats", action="store_true", help="print the time taken by each stage, counts of the notes and the peak memory of each file")
+	# Add the cache options
+	parser.add_argument("--cache", nargs="?", const=c.CACHE_DIRECTORY, default=None, metavar="DIRECTORY", help="reuse the output of files that were converted before with the same options(default directory: %(const)s)")
+	parser.add_argument("--cache-size", type=float, default=c.CACHE_MAX_SIZE / 1000000, help="most megabytes the cache can take up(default: %(default)s)")
+	# Add the number of processes
+	parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="number of files to convert at once, or of processes to split a single file with(default: %(default)s)")
+	# Return the parser
+	return parser
+
+# Check if a path is a MIDI file
+def is_midi_file(filepath):
+	return os.path.isfile(filepath) and os.path.splitext(filepath)[-1].lower() in (".mid", ".midi")
+
+# Find the files to convert as a list of (input path, path relative to the output directory)
+def find_inputs(inputs, suffix, recursive):
+	# Create a list to store the files
+	files = []
+	# Loop through the inputs
+	for pattern in inputs:
+		# If the input is a directory
+		if(os.path.isdir(pattern)):
+			# Loop through the files in it
+			for root, directories, filenames in os.walk(pattern):
+				# Loop through the files in order
+				for filename in sorted(filenames):
+					# Get the path of the file
+					filepath = os.path.join(root, filename)
+					# Skip files that aren't MIDI files or were converted before
+					if(not is_midi_file(filepath) or os.path.splitext(filename)[0].endswith(suffix)):
+						continue
+					# Keep the path inside the directory
+					files.append((filepath, os.path.relpath(filepath, pattern)))
+				# If we shouldn't search the subdirectories
+				if(not recursive):
+					# Stop after the top directory
+					break
+		# If the input is a file
+		elif(os.path.isfile(pattern)):
+			# Add it
+			files.append((pattern, os.path.basename(pattern)))
+		# Otherwise it is a glob pattern
+		else:
+			# Get the files that match it
+			matches = sorted(glob.glob(pattern, recursive=True))
+			# If nothing matches
+			if(len(matches) == 0):
+				# Warn about it
+				print("Warning: %s doesn't match any files" % pattern, file=sys.stderr)
+			# Loop through the files that match it
+			for filepath in matches:
+				# If it is a MIDI file
+				if(is_midi_file(filepath)):
+					# Add it
+					files.append((filepath, os.path.basename(filepath)))
+	# Create a set to store the files that have been added
+	seen = set()
+	# Create a list for the files without duplicates
+	unique_files = []
+	# Loop through the files
+	for filepath, relative_path in files:
+		# If the file has already been added
+		if(os.path.abspath(filepath) in seen):
+			# Skip it
+			continue
+		# Remember and keep the file
+		seen.add(os.path.abspath(filepath))
+		unique_files.append((filepath, relative_path))
+	# Return the files
+	return unique_files
+
+# Get the path a converted file is written to
+def output_path(filepath, relative_path, output, suffix):
+	# Add the suffix to the name of the file
+	name, extension = os.path.splitext(relative_path if output != None else filepath)
+	# If there is no output directory, put it next to the input
+	if(output == None):
+		return name + suffix + extension
+	# Otherwise put it in the output directory
+	return os.path.join(output, name + suffix + extension)
+
+# Convert a single file and return (error message or None, seconds taken, stats or None, whether it was copied from the cache)
+def convert_file(input_file, output_file, options, record_stats=False, cache_directory=None, cache_size=c.CACHE_MAX_SIZE, low_memory=False, workers=1):
+	# Create an object to record the stats of the conversion if they are wanted
+	stats = mp.ParseStats() if record_stats else None
+	# Open the cache if there is one
+	cache = ConversionCache(cache_directory, cache_size) if cache_directory != None else None
+	# Store the time the conversion started
+	start_time = time.perf_counter()
+	try:
+		# Create the directory of the output file if it doesn't exist
+		os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+		# Convert the file
+		mp.convert_path(input_file, output_file, *options, workers=workers, stats=stats, cache=cache, low_memory=low_memory)
+		result = None
+	except mp.ConversionError as err:
+		# Use the error that stopped the conversion as the result
+		result = err
+	except Exception as err:
+		# Print the error
+		traceback.print_tb(err.__traceback__)
+		# Use the error as the result
+		result = err
+	# Return the error message if it failed, the time taken and the stats
+	return (str(result) if isinstance(result, Exception) else None, time.perf_counter() - start_time, stats, cache != None and cache.hits > 0)
+
+# Format a number of bytes
+def format_size(size):
+	# Return the size in megabytes
+	return "%.2f MB" % (size / 1000000)
+
+# Run the command line interface and return the exit code
+def main(args=None):
+	# Parse the arguments
+	arguments = create_argument_parser().parse_args(args)
+
+	# Find the files to convert
+	files = find_inputs(arguments.inputs, arguments.suffix, arguments.recursive)
+	# If there aren't any
+	if(len(files) == 0):
+		# Report it and fail
+		print("No MIDI files found", file=sys.stderr)
+		return 2
+
+	# Get the options of parse in order
+	options = (arguments.velocity, arguments.margin, not arguments.uncollated, arguments.tempo, not arguments.no_channels, not (arguments.no_channels or arguments.no_index_patches))
+
+	# Create a list of (size, input, output) for each file
+	jobs = [(os.path.getsize(filepath), filepath, output_path(filepath, relative_path, arguments.output, arguments.suffix)) for filepath, relative_path in files]
+	# Convert the largest files first so they don't hold up the end of the run
+	jobs.sort(key=lambda job: job[0], reverse=True)
+
+	# Get the arguments of convert_file after the file names
+	convert_arguments = (options, arguments.stats, arguments.cache, int(arguments.cache_size * 1000000), arguments.low_memory)
+
+	# Create variables to store the number of failed files, cached files and the total size converted
+	failed = 0
+	cached = 0
+	total_size = 0
+	# Store the time the run started
+	start_time = time.perf_counter()
+
+	# Report the result of a file
+	def report(job, error, seconds, stats, hit):
+		size, input_file, output_file = job
+		if(error == None):
+			print("OK    %s -> %s (%s in %.2fs, %s/s%s)" % (input_file, output_file, format_size(size), seconds, format_size(size / seconds if seconds > 0 else 0), ", cached" if hit else ""))
+		else:
+			print("FAIL  %s: %s" % (input_file, error))
+		# If there are stats, print them
+		if(stats != None and error == None):
+			print(stats.summary())
+		sys.stdout.flush()
+
+	# If only one file should be converted at a time
+	if(arguments.jobs <= 1 or len(jobs) == 1):
+		# Convert the files in this process(a single file can use the processes to split its tracks)
+		results = ((job, convert_file(job[1], job[2], *convert_arguments, workers=arguments.jobs)) for job in jobs)
+		executor = None
+	# Otherwise
+	else:
+		# Send the files to a pool of processes
+		executor = ProcessPoolExecutor(min(arguments.jobs, len(jobs)))
+		futures = {executor.submit(convert_file, job[1], job[2], *convert_arguments): job for job in jobs}
+		# Get the results as they finish
+		results = ((futures[future], future.result()) for future in as_completed(futures))
+
+	try:
+		# Loop through the results
+		for job, (error, seconds, stats, hit) in results:
+			# Report the result
+			report(job, error, seconds, stats, hit)
+			# Count it
+			if(error == None):
+				total_size += job[0]
+				cached += hit
+			else:
+				failed += 1
+	finally:
+		# If there is a pool of processes
+		if(executor != None):
+			# Stop it
+			executor.shutdown()
+
+	# Get the time the run took
+	elapsed = time.perf_counter() - start_time
+	# Report the totals
+	print("%d converted, %d failed in %.2fs (%.2f files/s, %s/s)" % (len(jobs) - failed, failed, elapsed, len(jobs) / elapsed if elapsed > 0 else 0, format_size(total_size / elapsed if elapsed > 0 else 0)))
+	# If there is a cache, report how many files came from it
+	if(arguments.cache != None):
+		print("Cache: %d hits, %d misses" % (cached, len(jobs) - cached))
+
+	# Fail if any file failed
+	return 1 if failed > 0 else 0
@@ -1,3 +1,5 @@
+import os
+
 # =========================
 #      Global Constants
 # =========================
@@ -8,13 +10,15 @@
 # ------------------------
 
 MIN_WIDTH = 600
-MIN_HEIGHT = 370
+MIN_HEIGHT = 400
 
 MAX_WIDTH = 1800
 MAX_HEIGHT = 500
 
 DEFAULT_WIDTH = 1000
-DEFAULT_HEIGHT = 370
+DEFAULT_HEIGHT = 400
+
+CONVERT_HEIGHT = 110
 
 WINDOW_TITLE = "MIDI Splitter"
 
@@ -40,4 +44,50 @@ LARGE_FONT_WEIGHT = "normal"
 # -------------------------
 
 ICON_PATH = 'icon.ico'
-ICON_BASE64 = """AAABAAEAAAAAAAEAIADALAAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAJYAAACWAgGAAAAvmaY3AAAIABJREFUeJzt3Xu0pnVd///XwGgzgEBBCIaLlIVIS6DjFIpKcpJCTSwKLdNIDUUNJQ8ZqVl5CMWz9TXTdCFFaQct5Biah5jO4E8Jg2LJEkQoDgOM4sz8/vjcs4yR2bP3zL2v93V4PNa6lv/N9ZK9h8+Te9/7ulds2rQpAADMz07VAwAAxkZgAQDMmcACAJgzgQUAMGcCCwBgzgQWAMCcCSwAgDkTWAAAcyawAADmTGABAMyZwAIAmDOBBQAwZwILAGDOBBYAwJwJLACAORNYAABzJrAAAOZMYAEAzJnAAgCYM4EFADBnAgsAYM4EFgDAnAksAIA5E1gAAHO2snoAMDrfnWTvJHvNru+cXXsm2X12PSjJbrNrlySrk6yaXQ+cXQ9IsvPs2inJitmfvynJxiQbZte9Sb4xu9bPrnuS3J1k3ey6M8kds+u2JP87u26dXbck+drc/0kAk7Vi06ZN1RuAYdg7yUNn1/5JHjK79kuyb5IHJ9knLYiGaEOSm5N8NclNSW5M8pXZdUOSL8+uW6oGAsMhsIDNdk5yUJIDZ9fDkzxsdh2Q9soT7VWw65P81+y6Lsm1s+tLaaEGTJzAgul5UJLvm12PTHLw7Doow331qS82pEXWf8yuq5N8YXbdWbgL6JjAgnF7RJLDZtejZtdBpYum60tJPj+7rpxd15QuApaNwILxeESSH0ryg0l+IMn3p73JnP66Ncm/JfnXJP+S5J8jumAUBBYM0x5JfjTJmtn1w2lvNmf4bkzyT0nWzq4rktxeughYMoEFw7B/kkfPriPSoorpWJvkc0k+O7tuqJ0DbIvAgn7aL8njkjx2dh1WO4eeuTLJ38+uT6W96gX0iMCCfliV5Mdn1+PjFSqWZm2STyb5u9m1vnYOILCgzqOSHJPk6CRPSHuiOeyou5NcluTSJJek/dYi0DGBBd06PslxSY5NcmjxFqbhqiQXJ7koyYXFW2AyBBYsrz2TnJDkibNrn9o5TNzNST4xuy5I+1xGYBkILJi/fZKcmOQnk/xE2vuroG/WJ/nbJH+T5ONp8QXMicCC+dg7yZOTPGl2+cgZhmRDko/Nrr+OD7SGHSawYPutTvJTs+spSb6jdg7MxdeT/FWSv5xd99TOgWESWLB0T0xyUpKnpr1yBWN1S5K/SPLRtPdtAYsksGBxDkvy07PrkOItUOGLSf58dl1ZvAV6T2DB1u2W5OTZdXzxFuiTC5OcP7vWFW+BXhJY8O0eneTnkvxsPFYBFnJzkj9N8idpn5EIzAgsaHZJckqSp6c9VR1YmsuSfDjJeWlPk4dJE1hM3aFJnjG79i/eAmNwQ5JzZ9dVxVugjMBiqk5M8gtp768Clsf5ST6U9iBTmBSBxZSsSvLM2fWY4i0wJZ9J8sHZtb54C3RCYDEF+yd51uw6sHQJTNu1ST4wu24oXQLLTGAxZocmefbs2rN4C/AttyV5/+zyPi1GSWAxRkck+aUkpyZZUbwF2LpNSd6X5I+SfK54C8yVwGJMjkryy2m/EQgMy7lJ/jDJ5cU7YC4EFmNwTJLnxG8Ewhicn+S9SS6pHgI7QmAxZEcneV6Sn6keAszdnyX5gySXVg+B7SGwGKLHp4XVKdVDgGV3XlpofbJ6CCyFwGJI1iQ5Le1xC8C0fCDJe5KsLd4BiyKwGIJDkjx/du1UvAWoszHJu2fXF4u3wIIEFn22b5LTk7wgnmMFfMttSd6V5J1JbireAvdLYNFHK9PC6vR48jqwddemRdY7k3yzeAvch8Cib05J8sK0h4UCLMbnkrwj7Q3x0AsCi754XJIXJXla9RBgsD6S5O1JPlU9BAQW1Q5I8uLZ5Q3swI7amORts+v64i1MmMCi0gvTwsr7rIB5uzYtst5RPYRpElhUOD7JGbP/BVhOFyY5Z/a/0BmBRZcOSAurF1cPASbnbWmh5ceGdEJg0ZXnJHlJkkdWDwEm6+okb0n7MGlYVgKL5bYmyUuTnFw9BGDm/CRvjo/dYRkJLJbLyiRnzq69ircAbOnWJGfPLg8pZe4EFsvh6CS/Fm9iB/rvwiS/l+TS6iGMi8BinnZNC6uXJVldvAVgse5J8qa00LqreAsjIbCYl+PSwuro6iEA2+nStNC6qHoIwyew2FGrkrw8La52Kd4CsKPuTousNyZZX7yFARNY7IjHp8XVCdVDAObsgrTI+mT1EIZJYLG9zkyLq72rhwAsk1vSIuvs6iEMj8BiqQ5L8ookp1QPAejIeUnekOTK6iEMh8BiKX4xLa48jR2YmqvTIuuPq4cwDAKLxdg7ySvTPuoGYMrekuT1aT8+hK0SWGzLUUl+PcmxxTsA+uLiJL+b5PLiHfSYwGIhL0iLq4dUDwHoma+kRda7qofQTwKL+7NfklelBRYAW/euJL+T5MbqIfSLwGJLR6XF1THFOwCG4pK0yLq8eAc9IrD4v56TFlcHVA8BGJjr0yLrvdVD6AeBRZLsluQ30h4cCsD2e2OS306yrnoItQQWh6bF1cnVQwBG4vy0yLqqegh1BNa0nZjkrCRrqocAjMzaJK9L8vHqIdQQWNP1/LS42rd6CMBI3ZQWWe+uHkL3BNb0rE4Lq1dWDwGYiNenhdY91UPojsCalgOT/GaSZ1YPAZiYDyb5rSTXVg+hGwJrOo5Me+XquOohABN1UdorWZ+uHsLyE1jT8LS0uDq8egjAxP17WmR9pHoIy0tgjd+vpP1YcL/qIQAkaR+r81tJfr96CMtHYI3bq5K8OskDqocAcB/3Jnlt2tPfGSGBNU57pIXVGdVDAFjQOWmhdXv1EOZLYI3P96b9SPDZxTsAWJz3p/3I8L+LdzBHAmtcDkt75eqk6iEALMlH017JurJ6CPMhsMbjyLS4OqZ6CADb5ZK0yPIYhxEQWOPwxLS4+rHqIQDskH9Ii6xPVA9hxwis4TspLa4Oqx4CwFxcmRZZH60ewvYTWMP2jLS4Oqh6CABz9aW0yDq3egjbR2AN16lpcfXQ6iEALIsvp0XW+6qHsHQCa5hOS4urB1cPAWBZfTUtst5TPYSlEVjD86K0uPqu6iEAdOJ/0iLr7dVDWLydqgewJGekfUiouAKYju9K+3e/T+cYEIE1HC9Ne9Lv7tVDAOjc7mlnwEurh7A4AmsYzkzymiS7Fe8AoM5uaWfBmcU7WASB1X8vTXvPlbgCYLe0M8ErWT3nTe79dkbaS8LiqufWrVuXU089Nbfffnv1lF546lOfmuc973nVMxbtrrvuynOf+9zceuut1VN64SlPeUpOO+206hksbF2S30xyTvUQ7t/K6gFs1Yvix4KDsXHjxpx//vnVM3rjiCOOqJ6wJBs3bsyHP/zh6hm9sWbNmuoJbNvmHxduiN8u7CU/Iuynzc+58ob2gVixYkV+5Ed+pHpGb+y++7C+dVesWJHHPOYx1TN6Y2hfvwnbPe2s8HJjDwms/tn8hHaPYgBgW74r7cw4tXoI9yWw+mXzZwt6QjsAi/XgtLPjGdVD+BaB1R8nxWcLArB9Hpp2hpxUPYRGYPXDE9P+YhxUPQSAwToo7Sx5YvUQBFYfHJn2F+Kw6iEADN5haWfKkdVDpk5g1dr8F+HHqocAMBo/Fv/hXk5g1fnetL8AxxTvAGB8jkk7Y763eMdkCawae6Q9gdebEQFYLielnTV7VA+ZIoFV49VJnl09AoDRe3bamUPHBFb3XpX2GYMA0IUz0s4eOiSwuvUr8V8SAHTv1WlnEB0RWN15WtrPwh9QPQSAyXlA2hn0tOohUyGwunFkkrOS7Fc9BIDJ2i/tLPKMrA4IrOV3YNo39OHVQwCYvMPTzqQDq4eMncBaXqvTXpI9rnoIAMwcl3Y2ra4eMmYCa3mdleSZ1SMAYAvPTDujWCYCa/k8P8krq0cAwFa8Mu2sYhkIrOVxYvyXAQD9d1bamcWcCaz5OzTtG3bf6iEAsA37pp1Zh1YPGRuBNV+7JfmNJGuqhwDAIq1JO7t2qx4yJgJrvn4jycnVIwBgiU5OO8OYE4E1P89J8vLqEQCwnV6edpYxBwJrPo6KD9IEYPhelXamsYME1o7bL+0b8oDqIdRZvXp1dt555+oZvfHABz6wesKSrF69Ojvt5F+Hmw3t68dcHZB2pvlotx20snrACLwqyTHVI7Zl/fr12bBhg0NkGaxYsSJ33nlnvvGNb1RP6Y277ror99xzT/WMRVmxYkXWrVuXe++9t3pKbwzp6zckGzduzM4775xVq1ZVT9mWY9LOttOrhwzZik2bNlVvGLIXJHln9YjFeO1rX5uLL744u+3ml0TmbeXKlbnnnnvyj//4j7nzzjur5/TCwx/+8BxyyCHZuHFjNm7cWD1nQZu/fpdddln1lN54+MMfnoMPPjhJev/1G5J169bl2GOPzatf/erqKYt1epJ3VY8YKq9gbb+jkvx69YjF+sIXvpDPfOYz1TOYiOuuuy7XXXdd9Qy2k6/f8vme7/me6glL8etJ/r8klxfvGCQ/L9o+e6d94z2keshiPeQhg5kKMFoD+3fxQ9LOur2rhwyRwNo+r0xybPUIAFhmx8bn6m4XgbV0v5jkJdUjAKAjL0k7+1gCgbU0hyV5RfUIAOjYK9LOQBZJYC3NK5I8snoEAHTskfECw5IIrMU7M8kp1SMAoMgpaWchiyCwFufx8TmDAPDytDORbRBY27Yq7RvKr6kCMHV7p52JvX8cfTWBtW0vT3JC9QgA6IkT4qc62ySwFnZckpdVjwCAnnlZ2hnJVgisrds17Rtol+ohANAzu6SdkbtWD+krgbV1v5bk6OoRANBTR6edldwPgXX/jo4fDQLAtrwsXoy4XwLr261MK/LV1UMAoOdWp52ZK6uH9I3A+nZnJjm+egQADMTx8QDSbyOw7mtNfJMAwFKdmXaGMiOw7uulSfaqHgEAA7NX2hnKjJ+ZfstzkpxcPWIIzjrrrJxwwgn5xje+UT2lF1auXJk77rgjp59+eq677rrqOb1w2mmn5elPf3o2btyYTZs2Vc9Z0Oav35lnnpkvfOEL1XN64bnPfW5+/ud/Pps2ber912+5PfCBD8wFF1yQ173uddVThuDkJJckeW/1kD4QWM0BSV5SPWIo1qxZkyOOOKJ6Ru/ss88+Amvm8MMPz5FHHlk9Y0ne9KY3CayZww8/PI997GOrZ/TGrbfeWj1hSF6S5KIk11cPqeZHhM0ZSR5ZPWIo1q1bVz2hd9atW5cNGzZUz+iNu+++u3rCktx111259957q2f0xtC+fsvNv/OW5JFpZ+rkCaz22w8vrh7BsE39xyhD5+sHc/Xi+G18gRWlDQDzNvmzdeqB9cKobACYt+PTztjJmnJgHRA/GgSA5fLitLN2kqYcWC9OcmD1CAAYqQMz4RcyphpYj8uEv+gA0JEXp525kzPVwHpRpvv/HQC6slPamTs5U4yMU5I8rXoEAEzE09LO3kmZWmCtzMR/qwEACrwwE/v0mKkF1ulJfMYLAHTriLQzeDKmFFj7ZmJfXADokdPTzuJJmFJgnR6PZQCAKgdmQi90TCWwDknyguoRADBxL0g7k0dvKoH1/CR7Vo8AgInbM+1MHr0pBNaaTOSLCQAD8Py0s3nUphBYp2Ua/z8BYAh2SjubR23s4fH4JM+qHgEA3Mez0s7o0Rp7YD2vegAAcL9GfUaPObCOzgQfzQ8AA3FK2lk9SmMOrFGXMQCMwGjP6rEG1jFJfqZ6BACwoJ9JO7NHZ6yB9ZzqAQDAoozyzB5jYB2V5OTqEQDAopycdnaPyhgD65erBwAASzK6s3tsgXVEkmdUjwAAluQZaWf4aIwtsH6pegAAsF1GdYaPKbAOTXJq9QgAYLucmnaWj8KYAuvZSVZUjwAAtsuKtLN8FMYSWPtnRF8UAJioZ6ed6YM3lsB6VpI9q0cAADtkz7QzffDGEFirMpIvBgCQZ6Wd7YM2hsB6ZpIDq0cAAHNxYNrZPmhjCSwAYDwGf7YPPbBOTPKY6hEAwFw9Ju2MH6yhB9YvVA8AAJbFoM/4IQfWofGhzgAwVidnwA8eHXJg+cxBABi3wZ71Qw2sXTLgf+gAwKI8I+3MH5yhBtYpGcmTXgGArdo/7cwfnKEG1tOrBwAAnRjkmT/EwHp0kidUjwAAOvGEtLN/UIYYWD9XPQAA6NTgzv6hBdZuSX62egQA0KmfTWuAwRhaYJ2cZJ/qEQBAp/bJwJ59OcTAAgCmZ1ANMKTAOizJ8dUjAIASx6e1wCAMKbB+unoAAFBqMC0gsACAoRhMCwwlsJ6Y5JDqEQBAqUPSmqD3hhJYJ1UPAAB6YRBNMITAWp3kqdUjAIBeeGpaG/TaEALrp5LsXT0CAOiFvdPaoNeGElgAAJv1vg36Hlh7J3lK9QgAoFeekp7/dKvvgfXkJN9RPQIA6JXvSGuE3up7YD2pegAA0Eu9boQ+B9Y+6fk/PACgzJPSWqGX+hxYJybZuXoEANBLO6e1Qi/1ObB+snoAANBrvW2FvgbWnkl+onoEANBrP5HWDL3T18A6Icmq6hEAQK+tSmuG3ulrYA3igxwBgHK9bAaBBQAMWS+boY+BdXx6/GuXAECv7JPWDr3Sx8A6rnoAADAovWuHPgbWsdUDAIBB6V079C2wHpXk0OoRAMCgHJrWEL3Rt8A6pnoAADBIvWqIvgXW0dUDAIBB6lVD9CmwViV5QvUIAGCQnpAePaS8T4H140l2qR4BAAzSLmkt0Qt9CywAgO3Vm5boU2A9vnoAADBovWmJvgTWfknWVI8AAAZtTVpTlOtLYD2uegAAMAq9aIq+BNZjqwcAAKPQi6YQWADAmPSiKfoQWPsnOax6BAAwCoeltUWpPgTWo6sHAACjUt4WAgsAGJvytuhDYB1RPQAAGJXytqgOrD3i+VcAwHytSWuMMtWB9aPF9wcAxqm0MaoDy6tXAMByKG0MgQUAjNGkA+uHi+8PAIxTaWNUBtYj0pMPZAQARme/tNYoURlYP1R4bwBg/MpaozKwfrDw3gDA+JW1RmVg/UDhvQGA8StrjcrA+v7CewMA41fWGlWB9YgkexXdGwCYhr1S9Eb3qsA6rOi+AMC0lDSHwAIAxmxSgfWoovsCANNS0hwCCwAYs8kE1oOSHFRwXwBgeg5Ka49OVQTW9xXcEwCYrs7bQ2ABAGM3icB6ZME9AYDp6rw9KgLr4IJ7AgDT1Xl7CCwAYOxGH1g7x28QAgDdOiitQTrTdWB1/n8QAJi8zl/g6TqwDuz4fgAASccNIrAAgCkYdWA9vOP7AQAkHTdI14H1sI7vBwCQdNwgAgsAmIJRB9YBHd8PACDpuEG6DKy9k+ze4f0AADbbPa1FOtFlYD20w3sBAGypsxYRWADAVIwysPbv8F4AAFvqrEW6DKyHdHgvAIAtddYiAgsAmIpRBtZ+Hd4LAGBLnbVIl4G1b4f3AgDYUmct0mVgPbjDewEAbKmzFukysPbp8F4AAFvqrEW6CqzvTrJzR/cCALg/O6c1ybLrKrA6ezQ9AMACOmmSrgJrr47uAwCwkE6aRGABAFMyqsD6zo7uAwCwkE6aRGABAFMyqsDas6P7AAAspJMm6Sqwdu/oPgAAC+mkSQQWADAlowqsB3V0HwCAhXTSJF0F1m4d3QcAYCGdNInAAgCmZFSBtUtH9wEAWEgnTdJVYK3u6D4AAAvppEm6CqxVHd0HAGAhnTSJwAIApmRUgfXAju4DALCQTppEYAEAUzKqwHpAR/cBAFhIJ03SVWDt3NF9AAAW0kmTCCwAYEpGFVhd3QcAYCGdNElX4bOio/sAACykkybxyhIAwJx1FVibOroPAMBCOmmSrgJrY0f3AQBYSCdN0lVgbejoPgAAC+mkSQQWADAlowqsezu6DwDAQjppkq4C6xsd3QcAYCGdNInAAgCmZFSBtb6j+wAALKSTJhFYAMCUjCqw7unoPgAAC+mkSboKrLs7ug+UufHGG6sn9MY3v/nN6glL9rWvfa16Qm8M8esHS9BJk3QVWOs6ug+U2LRpU2644YbqGb1x1113VU9Ykk2bNuWaa66pntEbd955Z/UEWE6dNMnKLm4SgcXI7bLLLrnuuuuyYcOG7LTT8vx3y1lnnZUPf/jDc/mz3v72t+fEE0/Mpk3z/0iue++9N3vsscfc/9zl1MXX7zWveU0+9KEPzeXPeutb35onP/nJvn6wfUYVWP5ziFFbuXJlHvawhy3rPfbZZ5+5/VkPe9jDln3vkOy8887L/s9j3333nduf5esHO6STJunqR4R3dHQfGK2vf/3rc/uz7r7b2yK7tn79/H5xydcPdkgnTSKwAIApGVVg3dbRfQAAFtJJk3QVWP/b0X0AABbSSZMILABgSkYVWLd2dB8AgIV00iQCCwCYklEF1i0d3QcAYCGdNElXgfW1JBs6uhcAwP3ZkNYky66rwEqSmzu8FwDAljprkS4D66sd3gsAYEudtUiXgXVTh/cCANhSZy3SZWDd2OG9AAC21FmLdBlYX+nwXgAAW+qsRQQWADAVowysGzq8FwDAljprkS4D68sd3gsAYEudtYjAAgCmYpSBdUuSOzq8HwDAZnekw4/u6zKwkuT6ju8HAJB03CBdB9Z/dXw/AICk4wYRWADAFIw6sK7r+H4AAEnHDdJ1YF3b8f0AAJKOG0RgAQBTMOrA+lKSDR3fEwCYtg1pDdKZrgOr8/+DAMDkdf4CT9eBlST/UXBPAGC6Om8PgQUAjN0kAuvqgnsCANPVeXtUBNYXCu4JAExX5+0hsACAsZtEYN0Zv0kIAHTjS2nt0amKwEqSzxfdFwCYlpLmEFgAwJhNKrCuLLovADAtJc0hsACAMZtUYF2T5NaiewMA03BrWnN0riqwkuTfCu8NAIxfWWtUBta/Ft4bABi/staoDKx/Kbw3ADB+Za1RGVj/XHhvAGD8ylqjMrCuSXJj4f0BgPG6MUVvcE9qAytJ/qn4/gDAOJU2RnVgrS2+PwAwTqWNIbAAgDGadGBdUXx/AGCcShujOrBuj1exAID5WpvWGGWqAytJPlc9AAAYlfK26ENgfbZ6AAAwKuVtIbAAgLEpb4s+BNYNSa6sHgEAjMKVaW1Rqg+BlSR/Xz0AABiFXjSFwAIAxqQXTdGXwPpU9QAAYBR60RR9Cawb43lYAMCOWZvWFOX6ElhJ8snqAQDAoPWmJfoUWH9XPQAAGLTetETfAuvu6hEAwCDdHYF1v9Ynuax6BAAwSJeltUQv9CmwkuTS6gEAwCD1qiH6FliXVA8AAAapVw3Rt8D6fJKrqkcAAINyVVpD9EbfAitJLq4eAAAMSu/aoY+BdVH1AABgUHrXDn0MrAuT3Fw9AgAYhJvT2qFX+hhYSfKJ6gEAwCD0shkEFgAwZL1shr4G1gXp0cPCAIBeWp/WDL3T18C6LcnfVo8AAHrtb9OaoXf6GlhJ8jfVAwCAXuttK/Q5sD6eZEP1CACglzaktUIv9Tmwbk7yseoRAEAvfSw9fqxTnwMrEVgAwP3rdSP0PbD+OsnXq0cAAL3y9bRG6K2+B9YtSf6qegQA0Ct/ldYIvdX3wEqSv6weAAD0Su/bYCiB1etKBQA6c0sE1lzck+QvqkcAAL3wF2lt0GtDCKwk+Wj1AACgFwbRBEMJrE8k+WL1CACg1BfT0w933tJQAitJ/rx6AABQajAtILAAgKEYTAsMKbCuTHJh9QgAoMSFaS0wCEMKrCQ5v3oAAFBiUA0wxMDq7Qc7AgDL4uYIrGW1LsmfVo8AADr1p2kNMBhDC6wk+ZPqAQBApwZ39g8xsD6b5LLqEQBAJy5LO/sHZYiBlSQfrh4AAHRikGf+UAPrvCQ3VI8AAJbVDWln/uAMNbDuTnJu9QgAYFmdm3bmD85QAysRWAAwdoM964ccWFdlYM/EAAAW7fy0s36QhhxYSfKh6gEAwLIY9Bk/9MD6eJLPVI8AAObqM2ln/GANPbCS5IPVAwCAuRr82T6WwLq2egQAMBfXRmD1wvokH6geAQDMxQfSzvZBG0NgJe2LcVv1CABgh9yWkbxoMpbAuiHJ+6tHAAA75P0ZySe1jCWwkvZF2VQ9AgDYLpsyohdLxhRYVyV5X/UIAGC7vC8DfrDolsYUWEnyR9UDAIDtMqozfGyB9bkM+HOLAGCizk07w0djbIGVJH9YPQAAWJLRnd1jDKzL40OgAWAozk87u0dljIGVJO+tHgAALMooz+yxBtYlSf6segQAsKA/SzuzR2esgZUkf1A9AABY0GjP6jEH1qVJzqseAQDcr/PSzupRGnNgJSMuYwAYuFGf0WMPrE9mJB8aCQAj8oG0M3q0xh5YSfKeJBurRwAASdqZ/J7qEcttCoG1Nsm7q0cAAEnamby2esRym0JgJe2LeVv1CACYuNsykRc9phJYX0zyruoRADBx70o7k0dvKoGVJO9Mcm31CACYqGvTzuJJmFJg3ZQJfWEBoGfemXYWT8KUAitpX9zPVY8AgIn5XCb2IsfUAuubSd5RPQIAJuYdaWfwZEwtsJL2aP6PVI8AgIn4SCb40XVTDKwkeXs8fBQAltvGtDN3cqYaWJ9K8rbqEQAwcm9LO3MnZ6qBlbQvusc2AMDyuDYTfjFjyoF1fSb8hQeAZfa2tLN2kqYcWEn7rYYLq0cAwMhcmIn/1v7UAytJzqkeAAAjM/mzVWC1yvajQgCYj7fFT4cE1sw5Sa6uHgEAA3d1vHqVRGBtdn2St1SPAICBe0sm/Mb2/0tgfct7k5xfPQIABur8tLOUCKwtvTnJrdUjAGBgbk07Q5kRWPe1NsnZ1SP6brfddqueMEmrVq2a25/la9i9eX79dt1117n9WWybvy+LcnbaGcrMyuoBPXR2kqOSHF+8o7euuOKKPOhBD8qmTZuqp0zKf/7nf87tz7riiiuy6667+hp26Jprrpnbn7V27drsvvvuvn4dWLFiRa644orqGX13Ybw48W1W+At6v45O8rEkq6uHzMsZZ5yRt771rdUzACYh2yBSAAAMe0lEQVTtV3/1V3POOaP6Jbt7kjwpyaXVQ/rGjwjv36VJ3lQ9AgB67k0RV/dLYG3d78U3DQBszaVpZyX3Q2Bt3V1pZX539RAA6Jm7087Iu6qH9JXAWthF8aNCANjSm9LOSLZCYG3bG5NcUD0CAHrigrSzkQUIrG1bn/aNdEv1EAAodkvambi+ekjfCazF+WTUOgC8Me1MZBsE1uKdneS86hEAUOS8eKDoogmspXlDkqurRwBAx65OOwNZJIG1NFfGNxgA0/OGtDOQRRJYS/fHSd5SPQIAOvKWtLOPJRBY2+f1SS6uHgEAy+zitDOPJRJY2+eWJL+b5CvVQwBgmXwl7azzmKLtILC23+Vp33gAMEa/m3bWsR0E1o551+wCgDFxvu0ggbXjfifJJdUjAGBOLkk729gBAmvH3Zj2jXh99ZCF3HTTTdUTACZvAP8uvj7tTLuxesjQraweMBKXp31D/r/iHVt18MEH5/jjj6+eATBpBx98cPWEbfmdeN/VXKzYtGlT9YYxeUOSl1ePAIDt8MYkr6geMRYCa752S/K+JCdXDwGAJTg/yalJ1lUPGQvvwZqvdUl+O8na6iEAsEhr084ucTVHAmv+rkryuiS9fycjAJN3U9qZdVX1kLERWMvj42nfsADQZ69LO7OYM4G1fN4dn98EQH+9Pu2sYhl4k/vyWp3k95M8s3oIAPwfH0zyK0nuqR4yVl7BWl73JPmtJBdVDwGAmYvSziZxtYwE1vK7Nu1n3P9ePQSAyfv3tDPp2uohYyewuvHptG9oHz0AQJUb086iT1cPmQKB1Z2PpL0ke2/1EAAm5960M+gj1UOmQmB16/eTvLZ6BACT89q0M4iO+C3CGm9Jckb1CAAm4ZwkL6keMTVewarx2iTvrx4BwOi9P35yUkJg1bg97WfhH60eAsBofTTtrLm9esgUCaw6/532XxWXFO8AYHwuSTtj/rt4x2QJrFpXpv0F+IfqIQCMxj+knS1XVg+ZMoFV79PxFwGA+dj8H+6edVVMYPXDJ9L+QnypeggAg/WltLPkE9VDEFh98tG0vxhfrh4CwOB8Oe0M8ctTPSGw+uXctL8gX60eAsBgfDXt7Di3egjfIrD6531pf1H+p3oIAL33P2lnxvuqh3BfAquf3pP2F+aO6iEA9NYdaWfFe6qH8O0EVn+9Pclrkqwr3gFA/6xLOyPeXryDrRBY/XZORBYA97U5rs4p3sECBFb/vTntJWCRBcC6tDPhzdVDWJjAGoaz45UsgKnb/MrV2cU7WASBNRxvTvKb8cZ3gCm6I+0M8MrVQAisYTknyVnxCAeAKfmftH/3e8/VgKzYtGlT9QaW7rQkr07y4OohACyrzQ8R9SiGgRFYw3VqWmQ9tHoIAMti88ffeIjoAAmsYXtGWmQdVD0EgLna/MHNPv5moATW8J2UFlmHVQ8BYC6ujA9uHjyBNQ5PTIusH6seAsAO+Ye0uPpE9RB2jMAajyPTIuuY6iEAbJdL0uLq09VD2HECa1wOS4usk6qHALAkH02LqyurhzAfAmt8vjftYXTPLt4BwOK8P8lvJfnv4h3MkcAapz3SXsk6o3oIAAs6J+2Vq9urhzBfAmvcXpUWWg+oHgLAfdybFla/Uz2E5SGwxu9X0n5kuF/1EACSJDem/Ujw96uHsHwE1jQ8Le1zrA6vHgIwcf+e5HVJPlI9hOUlsKbjyLTIOq56CMBEXZQWVx7DMAECa1oOTPtx4TOrhwBMzAfTfix4bfUQuiGwpmd12itZr6weAjARr0975eqe6iF0R2BN1/PTQmvf6iEAI3VTWli9u3oI3RNY03ZiWmStqR4CMDJr0+Lq49VDqCGwODTJbyQ5uXoIwEicn+S3k1xVPYQ6Aosk2S0tsl5ePQRg4N6YFlfrqodQS2Dxfz0n7envB1QPARiY69Oeyv7e6iH0g8BiS0elRdYxxTsAhuKStLi6vHgHPSKwuD/7pUXWC6qHAPTcu9Li6sbqIfSLwGIhL0jy60keUj0EoGe+kuR30wILvo3AYluOSousY4t3APTFxWlxdXnxDnpMYLEYe6c9+f0l1UMAir0l7cnst1QPod8EFkvxi0lekeSR1UMAOnZ1kjck+ePqIQyDwGKpDkuLrFOqhwB05Ly0uLqyegjDIbDYXmemPZh07+ohAMvklrQHh55dPYThEVjsiMenRdYJ1UMA5uyCtLj6ZPUQhklgsaNWpUXWy5LsUrwFYEfdneRNaXG1vngLAyawmJfj0iLr6OohANvp0rS4uqh6CMMnsJinXZP8WlporS7eArBY96SF1e8luat4CyMhsFgOR6eF1vHVQwC24cK0sLq0egjjIrBYLivTftPwzCR7FW8B2NKtab8deHaSbxZvYYQEFsttTZKXJjm5egjAzPlJ3pxkbfUQxktg0ZXnpH3UjqfAA1WuTvuom/dWD2H8BBZdOiDJGUleXD0EmJy3JTknyfXVQ5gGgUWF49NCy5vggeV2YVpYXVg9hGkRWFR6YdqrWQdWDwFG59q0V63eUT2EaRJYVDsgLbJenGSn4i3A8G1MC6u3xY8DKSSw6IvHJXlRkqdVDwEG6yNJ3p7kU9VDQGDRN6ek/ejwiOohwGB8Lu1HgedVD4HNBBZ9tDLJ6bPL+7OArbk2yTtnl4eF0isCiz7bNy2yXpBkz+ItQH/cluRdaWF1U/EWuF8CiyE4JMnzZ5c3wsN0bUzy7tn1xeItsCCBxZCsSXJakmcV7wC694Ek74mPt2EgBBZD9Pgkz0t7Qzwwbucl+YMkn6weAkshsBiyo9NC62eqhwBz92dpYXVp9RDYHgKLMTgm7cOkT64eAuyw89M+jPmS6iGwIwQWY3JUkl9O8oziHcDSnZvkD5NcXrwD5kJgMUZHJPmlJKcmWVG8Bdi6TUnel+SP0h4WCqMhsBizQ5M8e3Z5jhb0x21J3j+7rireAstCYDEF+6c92uFZ8WR4qHRt2uMWPpDkhtIlsMwEFlOyKskzZ9djirfAlHwmyQdn1/riLdAJgcVUnZjkF+I3D2E5nZ/kQ0k+Xj0EuiawmLpD037r8BlpP0oEdswNab8ReG68v4oJE1jQ7JL2ZPinJ3lC8RYYosuSfDjtyet3F2+BcgILvt2jk/xckp9Nsk/xFuizm5P8aZI/SfLZ4i3QKwILtm63tPdonZzk+OIt0CcXpr2/6vwk64q3QC8JLFicw5L89Ow6pHgLVPhikj+fXVcWb4HeE1iwdE9MclKSpybZu3gLLKdbkvxFko8m+UTxFhgUgQXbb3WSn5pdT0nyHbVzYC6+nuSvkvzl7Lqndg4Mk8CC+dg7yZOTPGl27Vw7B5ZkQ5KPza6/TnvlCtgBAgvmb5+0B5n+ZJKfSHuCPPTN+iR/m+Rv0h4EenPtHBgXgQXLa88kJ6S9b+uJ8dgHat2c9l6qTyS5IO1Dl4FlILCgW8cnOS7JsWlPkYfldlWSi5NclPZ4BaADAgvqPCrJMUmOTnt6/C61cxiJu9Oeqn5pkkuSfL52DkyTwIJ+WJXkx2fX45OsqZ3DwKxN8skkfze71tfOAQQW9NN+SR6X5LGz67DaOfTMlUn+fnZ9KsmNtXOALQksGIb90z4j8dFJjohXuKZmbZLPpX3e32eT3FA7B9gWgQXDtEeSH00LrTVJfjjtVS+G78Yk/5QWVWuTXJHk9tJFwJIJLBiPRyT5oSQ/mOQHknx/kr1KF7Ettyb5tyT/muRfkvxzkmtKFwFzIbBg3B6R9v6tw9J+a/FRSQ4qXTRdX0r7jb7Pp72H6sqIKRgtgQXT86Ak3ze7Hpnk4Nl1UHzEz47akBZS/zG7rk7yhdl1Z+EuoGMCC9hs57TIOnB2PTzJw2bXAUl2r5vWK3ckuT7Jf82u65JcO7u+lBZZwMQJLGCx9k7y0Nm1f5KHzK79kuyb5MFpHwU01FfBNqR9lMxXk9yU9mbzr8yuG5J8eXb5IGRgmwQWMG/fnRZje82u75xde6a9CrZ72o8pd5tduyRZnfaw1VVJHji7HpAWazsn2SnJitmfvynJxrQg2pDk3iTfmF3rZ9c9aU80Xze77kx75emOtM/f+9/ZdevsuiXJ1+b+TwKYLIEFADBnO1UPAAAYG4EFADBnAgsAYM4EFgDAnAksAIA5E1gAAHMmsAAA5kxgAQDMmcACAJgzgQUAMGcCCwBgzgQWAMCcCSwAgDkTWAAAcyawAADmTGABAMyZwAIAmDOBBQAwZwILAGDOBBYAwJwJLACAORNYAABzJrAAAOZMYAEAzNn/D+jDOUzOkGEQAAAAAElFTkSuQmCC"""
\ No newline at end of file
+
+# The number of milliseconds between checks on a running conversion
+PROGRESS_POLL_INTERVAL = 100
+
+# The most tracks listed when the analysis of a file is shown
+ANALYSIS_MAX_TRACKS = 20
+ICON_BASE64 = """AAABAAEAAAAAAAEAIADALAAAFgAAAIlQTkcNChoKAAAADUlIRFIAAAJYAAACWAgGAAAAvmaY3AAAIABJREFUeJzt3Xu0pnVd///XwGgzgEBBCIaLlIVIS6DjFIpKcpJCTSwKLdNIDUUNJQ8ZqVl5CMWz9TXTdCFFaQct5Biah5jO4E8Jg2LJEkQoDgOM4sz8/vjcs4yR2bP3zL2v93V4PNa6lv/N9ZK9h8+Te9/7ulds2rQpAADMz07VAwAAxkZgAQDMmcACAJgzgQUAMGcCCwBgzgQWAMCcCSwAgDkTWAAAcyawAADmTGABAMyZwAIAmDOBBQAwZwILAGDOBBYAwJwJLACAORNYAABzJrAAAOZMYAEAzJnAAgCYM4EFADBnAgsAYM4EFgDAnAksAIA5E1gAAHO2snoAMDrfnWTvJHvNru+cXXsm2X12PSjJbrNrlySrk6yaXQ+cXQ9IsvPs2inJitmfvynJxiQbZte9Sb4xu9bPrnuS3J1k3ey6M8kds+u2JP87u26dXbck+drc/0kAk7Vi06ZN1RuAYdg7yUNn1/5JHjK79kuyb5IHJ9knLYiGaEOSm5N8NclNSW5M8pXZdUOSL8+uW6oGAsMhsIDNdk5yUJIDZ9fDkzxsdh2Q9soT7VWw65P81+y6Lsm1s+tLaaEGTJzAgul5UJLvm12PTHLw7Doow331qS82pEXWf8yuq5N8YXbdWbgL6JjAgnF7RJLDZtejZtdBpYum60tJPj+7rpxd15QuApaNwILxeESSH0ryg0l+IMn3p73JnP66Ncm/JfnXJP+S5J8jumAUBBYM0x5JfjTJmtn1w2lvNmf4bkzyT0nWzq4rktxeughYMoEFw7B/kkfPriPSoorpWJvkc0k+O7tuqJ0DbIvAgn7aL8njkjx2dh1WO4eeuTLJ38+uT6W96gX0iMCCfliV5Mdn1+PjFSqWZm2STyb5u9m1vnYOILCgzqOSHJPk6CRPSHuiOeyou5NcluTSJJek/dYi0DGBBd06PslxSY5NcmjxFqbhqiQXJ7koyYXFW2AyBBYsrz2TnJDkibNrn9o5TNzNST4xuy5I+1xGYBkILJi/fZKcmOQnk/xE2vuroG/WJ/nbJH+T5ONp8QXMicCC+dg7yZOTPGl2+cgZhmRDko/Nrr+OD7SGHSawYPutTvJTs+spSb6jdg7MxdeT/FWSv5xd99TOgWESWLB0T0xyUpKnpr1yBWN1S5K/SPLRtPdtAYsksGBxDkvy07PrkOItUOGLSf58dl1ZvAV6T2DB1u2W5OTZdXzxFuiTC5OcP7vWFW+BXhJY8O0eneTnkvxsPFYBFnJzkj9N8idpn5EIzAgsaHZJckqSp6c9VR1YmsuSfDjJeWlPk4dJE1hM3aFJnjG79i/eAmNwQ5JzZ9dVxVugjMBiqk5M8gtp768Clsf5ST6U9iBTmBSBxZSsSvLM2fWY4i0wJZ9J8sHZtb54C3RCYDEF+yd51uw6sHQJTNu1ST4wu24oXQLLTGAxZocmefbs2rN4C/AttyV5/+zyPi1GSWAxRkck+aUkpyZZUbwF2LpNSd6X5I+SfK54C8yVwGJMjkryy2m/EQgMy7lJ/jDJ5cU7YC4EFmNwTJLnxG8Ewhicn+S9SS6pHgI7QmAxZEcneV6Sn6keAszdnyX5gySXVg+B7SGwGKLHp4XVKdVDgGV3XlpofbJ6CCyFwGJI1iQ5Le1xC8C0fCDJe5KsLd4BiyKwGIJDkjx/du1UvAWoszHJu2fXF4u3wIIEFn22b5LTk7wgnmMFfMttSd6V5J1JbireAvdLYNFHK9PC6vR48jqwddemRdY7k3yzeAvch8Cib05J8sK0h4UCLMbnkrwj7Q3x0AsCi754XJIXJXla9RBgsD6S5O1JPlU9BAQW1Q5I8uLZ5Q3swI7amORts+v64i1MmMCi0gvTwsr7rIB5uzYtst5RPYRpElhUOD7JGbP/BVhOFyY5Z/a/0BmBRZcOSAurF1cPASbnbWmh5ceGdEJg0ZXnJHlJkkdWDwEm6+okb0n7MGlYVgKL5bYmyUuTnFw9BGDm/CRvjo/dYRkJLJbLyiRnzq69ircAbOnWJGfPLg8pZe4EFsvh6CS/Fm9iB/rvwiS/l+TS6iGMi8BinnZNC6uXJVldvAVgse5J8qa00LqreAsjIbCYl+PSwuro6iEA2+nStNC6qHoIwyew2FGrkrw8La52Kd4CsKPuTousNyZZX7yFARNY7IjHp8XVCdVDAObsgrTI+mT1EIZJYLG9zkyLq72rhwAsk1vSIuvs6iEMj8BiqQ5L8ookp1QPAejIeUnekOTK6iEMh8BiKX4xLa48jR2YmqvTIuuPq4cwDAKLxdg7ySvTPuoGYMrekuT1aT8+hK0SWGzLUUl+PcmxxTsA+uLiJL+b5PLiHfSYwGIhL0iLq4dUDwHoma+kRda7qofQTwKL+7NfklelBRYAW/euJL+T5MbqIfSLwGJLR6XF1THFOwCG4pK0yLq8eAc9IrD4v56TFlcHVA8BGJjr0yLrvdVD6AeBRZLsluQ30h4cCsD2e2OS306yrnoItQQWh6bF1cnVQwBG4vy0yLqqegh1BNa0nZjkrCRrqocAjMzaJK9L8vHqIdQQWNP1/LS42rd6CMBI3ZQWWe+uHkL3BNb0rE4Lq1dWDwGYiNenhdY91UPojsCalgOT/GaSZ1YPAZiYDyb5rSTXVg+hGwJrOo5Me+XquOohABN1UdorWZ+uHsLyE1jT8LS0uDq8egjAxP17WmR9pHoIy0tgjd+vpP1YcL/qIQAkaR+r81tJfr96CMtHYI3bq5K8OskDqocAcB/3Jnlt2tPfGSGBNU57pIXVGdVDAFjQOWmhdXv1EOZLYI3P96b9SPDZxTsAWJz3p/3I8L+LdzBHAmtcDkt75eqk6iEALMlH017JurJ6CPMhsMbjyLS4OqZ6CADb5ZK0yPIYhxEQWOPwxLS4+rHqIQDskH9Ii6xPVA9hxwis4TspLa4Oqx4CwFxcmRZZH60ewvYTWMP2jLS4Oqh6CABz9aW0yDq3egjbR2AN16lpcfXQ6iEALIsvp0XW+6qHsHQCa5hOS4urB1cPAWBZfTUtst5TPYSlEVjD86K0uPqu6iEAdOJ/0iLr7dVDWLydqgewJGekfUiouAKYju9K+3e/T+cYEIE1HC9Ne9Lv7tVDAOjc7mlnwEurh7A4AmsYzkzymiS7Fe8AoM5uaWfBmcU7WASB1X8vTXvPlbgCYLe0M8ErWT3nTe79dkbaS8LiqufWrVuXU089Nbfffnv1lF546lOfmuc973nVMxbtrrvuynOf+9zceuut1VN64SlPeUpOO+206hksbF2S30xyTvUQ7t/K6gFs1Yvix4KDsXHjxpx//vnVM3rjiCOOqJ6wJBs3bsyHP/zh6hm9sWbNmuoJbNvmHxduiN8u7CU/Iuynzc+58ob2gVixYkV+5Ed+pHpGb+y++7C+dVesWJHHPOYx1TN6Y2hfvwnbPe2s8HJjDwms/tn8hHaPYgBgW74r7cw4tXoI9yWw+mXzZwt6QjsAi/XgtLPjGdVD+BaB1R8nxWcLArB9Hpp2hpxUPYRGYPXDE9P+YhxUPQSAwToo7Sx5YvUQBFYfHJn2F+Kw6iEADN5haWfKkdVDpk5g1dr8F+HHqocAMBo/Fv/hXk5g1fnetL8AxxTvAGB8jkk7Y763eMdkCawae6Q9gdebEQFYLielnTV7VA+ZIoFV49VJnl09AoDRe3bamUPHBFb3XpX2GYMA0IUz0s4eOiSwuvUr8V8SAHTv1WlnEB0RWN15WtrPwh9QPQSAyXlA2hn0tOohUyGwunFkkrOS7Fc9BIDJ2i/tLPKMrA4IrOV3YNo39OHVQwCYvMPTzqQDq4eMncBaXqvTXpI9rnoIAMwcl3Y2ra4eMmYCa3mdleSZ1SMAYAvPTDujWCYCa/k8P8krq0cAwFa8Mu2sYhkIrOVxYvyXAQD9d1bamcWcCaz5OzTtG3bf6iEAsA37pp1Zh1YPGRuBNV+7JfmNJGuqhwDAIq1JO7t2qx4yJgJrvn4jycnVIwBgiU5OO8OYE4E1P89J8vLqEQCwnV6edpYxBwJrPo6KD9IEYPhelXamsYME1o7bL+0b8oDqIdRZvXp1dt555+oZvfHABz6wesKSrF69Ojvt5F+Hmw3t68dcHZB2pvlotx20snrACLwqyTHVI7Zl/fr12bBhg0NkGaxYsSJ33nlnvvGNb1RP6Y277ror99xzT/WMRVmxYkXWrVuXe++9t3pKbwzp6zckGzduzM4775xVq1ZVT9mWY9LOttOrhwzZik2bNlVvGLIXJHln9YjFeO1rX5uLL744u+3ml0TmbeXKlbnnnnvyj//4j7nzzjur5/TCwx/+8BxyyCHZuHFjNm7cWD1nQZu/fpdddln1lN54+MMfnoMPPjhJev/1G5J169bl2GOPzatf/erqKYt1epJ3VY8YKq9gbb+jkvx69YjF+sIXvpDPfOYz1TOYiOuuuy7XXXdd9Qy2k6/f8vme7/me6glL8etJ/r8klxfvGCQ/L9o+e6d94z2keshiPeQhg5kKMFoD+3fxQ9LOur2rhwyRwNo+r0xybPUIAFhmx8bn6m4XgbV0v5jkJdUjAKAjL0k7+1gCgbU0hyV5RfUIAOjYK9LOQBZJYC3NK5I8snoEAHTskfECw5IIrMU7M8kp1SMAoMgpaWchiyCwFufx8TmDAPDytDORbRBY27Yq7RvKr6kCMHV7p52JvX8cfTWBtW0vT3JC9QgA6IkT4qc62ySwFnZckpdVjwCAnnlZ2hnJVgisrds17Rtol+ohANAzu6SdkbtWD+krgbV1v5bk6OoRANBTR6edldwPgXX/jo4fDQLAtrwsXoy4XwLr261MK/LV1UMAoOdWp52ZK6uH9I3A+nZnJjm+egQADMTx8QDSbyOw7mtNfJMAwFKdmXaGMiOw7uulSfaqHgEAA7NX2hnKjJ+ZfstzkpxcPWIIzjrrrJxwwgn5xje+UT2lF1auXJk77rgjp59+eq677rrqOb1w2mmn5elPf3o2btyYTZs2Vc9Z0Oav35lnnpkvfOEL1XN64bnPfW5+/ud/Pps2ber912+5PfCBD8wFF1yQ173uddVThuDkJJckeW/1kD4QWM0BSV5SPWIo1qxZkyOOOKJ6Ru/ss88+Amvm8MMPz5FHHlk9Y0ne9KY3CayZww8/PI997GOrZ/TGrbfeWj1hSF6S5KIk11cPqeZHhM0ZSR5ZPWIo1q1bVz2hd9atW5cNGzZUz+iNu+++u3rCktx111259957q2f0xtC+fsvNv/OW5JFpZ+rkCaz22w8vrh7BsE39xyhD5+sHc/Xi+G18gRWlDQDzNvmzdeqB9cKobACYt+PTztjJmnJgHRA/GgSA5fLitLN2kqYcWC9OcmD1CAAYqQMz4RcyphpYj8uEv+gA0JEXp525kzPVwHpRpvv/HQC6slPamTs5U4yMU5I8rXoEAEzE09LO3kmZWmCtzMR/qwEACrwwE/v0mKkF1ulJfMYLAHTriLQzeDKmFFj7ZmJfXADokdPTzuJJmFJgnR6PZQCAKgdmQi90TCWwDknyguoRADBxL0g7k0dvKoH1/CR7Vo8AgInbM+1MHr0pBNaaTOSLCQAD8Py0s3nUphBYp2Ua/z8BYAh2SjubR23s4fH4JM+qHgEA3Mez0s7o0Rp7YD2vegAAcL9GfUaPObCOzgQfzQ8AA3FK2lk9SmMOrFGXMQCMwGjP6rEG1jFJfqZ6BACwoJ9JO7NHZ6yB9ZzqAQDAoozyzB5jYB2V5OTqEQDAopycdnaPyhgD65erBwAASzK6s3tsgXVEkmdUjwAAluQZaWf4aIwtsH6pegAAsF1GdYaPKbAOTXJq9QgAYLucmnaWj8KYAuvZSVZUjwAAtsuKtLN8FMYSWPtnRF8UAJioZ6ed6YM3lsB6VpI9q0cAADtkz7QzffDGEFirMpIvBgCQZ6Wd7YM2hsB6ZpIDq0cAAHNxYNrZPmhjCSwAYDwGf7YPPbBOTPKY6hEAwFw9Ju2MH6yhB9YvVA8AAJbFoM/4IQfWofGhzgAwVidnwA8eHXJg+cxBABi3wZ71Qw2sXTLgf+gAwKI8I+3MH5yhBtYpGcmTXgGArdo/7cwfnKEG1tOrBwAAnRjkmT/EwHp0kidUjwAAOvGEtLN/UIYYWD9XPQAA6NTgzv6hBdZuSX62egQA0KmfTWuAwRhaYJ2cZJ/qEQBAp/bJwJ59OcTAAgCmZ1ANMKTAOizJ8dUjAIASx6e1wCAMKbB+unoAAFBqMC0gsACAoRhMCwwlsJ6Y5JDqEQBAqUPSmqD3hhJYJ1UPAAB6YRBNMITAWp3kqdUjAIBeeGpaG/TaEALrp5LsXT0CAOiFvdPaoNeGElgAAJv1vg36Hlh7J3lK9QgAoFeekp7/dKvvgfXkJN9RPQIA6JXvSGuE3up7YD2pegAA0Eu9boQ+B9Y+6fk/PACgzJPSWqGX+hxYJybZuXoEANBLO6e1Qi/1ObB+snoAANBrvW2FvgbWnkl+onoEANBrP5HWDL3T18A6Icmq6hEAQK+tSmuG3ulrYA3igxwBgHK9bAaBBQAMWS+boY+BdXx6/GuXAECv7JPWDr3Sx8A6rnoAADAovWuHPgbWsdUDAIBB6V079C2wHpXk0OoRAMCgHJrWEL3Rt8A6pnoAADBIvWqIvgXW0dUDAIBB6lVD9CmwViV5QvUIAGCQnpAePaS8T4H140l2qR4BAAzSLmkt0Qt9CywAgO3Vm5boU2A9vnoAADBovWmJvgTWfknWVI8AAAZtTVpTlOtLYD2uegAAMAq9aIq+BNZjqwcAAKPQi6YQWADAmPSiKfoQWPsnOax6BAAwCoeltUWpPgTWo6sHAACjUt4WAgsAGJvytuhDYB1RPQAAGJXytqgOrD3i+VcAwHytSWuMMtWB9aPF9wcAxqm0MaoDy6tXAMByKG0MgQUAjNGkA+uHi+8PAIxTaWNUBtYj0pMPZAQARme/tNYoURlYP1R4bwBg/MpaozKwfrDw3gDA+JW1RmVg/UDhvQGA8StrjcrA+v7CewMA41fWGlWB9YgkexXdGwCYhr1S9Eb3qsA6rOi+AMC0lDSHwAIAxmxSgfWoovsCANNS0hwCCwAYs8kE1oOSHFRwXwBgeg5Ka49OVQTW9xXcEwCYrs7bQ2ABAGM3icB6ZME9AYDp6rw9KgLr4IJ7AgDT1Xl7CCwAYOxGH1g7x28QAgDdOiitQTrTdWB1/n8QAJi8zl/g6TqwDuz4fgAASccNIrAAgCkYdWA9vOP7AQAkHTdI14H1sI7vBwCQdNwgAgsAmIJRB9YBHd8PACDpuEG6DKy9k+ze4f0AADbbPa1FOtFlYD20w3sBAGypsxYRWADAVIwysPbv8F4AAFvqrEW6DKyHdHgvAIAtddYiAgsAmIpRBtZ+Hd4LAGBLnbVIl4G1b4f3AgDYUmct0mVgPbjDewEAbKmzFukysPbp8F4AAFvqrEW6CqzvTrJzR/cCALg/O6c1ybLrKrA6ezQ9AMACOmmSrgJrr47uAwCwkE6aRGABAFMyqsD6zo7uAwCwkE6aRGABAFMyqsDas6P7AAAspJMm6Sqwdu/oPgAAC+mkSQQWADAlowqsB3V0HwCAhXTSJF0F1m4d3QcAYCGdNInAAgCmZFSBtUtH9wEAWEgnTdJVYK3u6D4AAAvppEm6CqxVHd0HAGAhnTSJwAIApmRUgfXAju4DALCQTppEYAEAUzKqwHpAR/cBAFhIJ03SVWDt3NF9AAAW0kmTCCwAYEpGFVhd3QcAYCGdNElX4bOio/sAACykkybxyhIAwJx1FVibOroPAMBCOmmSrgJrY0f3AQBYSCdN0lVgbejoPgAAC+mkSQQWADAlowqsezu6DwDAQjppkq4C6xsd3QcAYCGdNInAAgCmZFSBtb6j+wAALKSTJhFYAMCUjCqw7unoPgAAC+mkSboKrLs7ug+UufHGG6sn9MY3v/nN6glL9rWvfa16Qm8M8esHS9BJk3QVWOs6ug+U2LRpU2644YbqGb1x1113VU9Ykk2bNuWaa66pntEbd955Z/UEWE6dNMnKLm4SgcXI7bLLLrnuuuuyYcOG7LTT8vx3y1lnnZUPf/jDc/mz3v72t+fEE0/Mpk3z/0iue++9N3vsscfc/9zl1MXX7zWveU0+9KEPzeXPeutb35onP/nJvn6wfUYVWP5ziFFbuXJlHvawhy3rPfbZZ5+5/VkPe9jDln3vkOy8887L/s9j3333nduf5esHO6STJunqR4R3dHQfGK2vf/3rc/uz7r7b2yK7tn79/H5xydcPdkgnTSKwAIApGVVg3dbRfQAAFtJJk3QVWP/b0X0AABbSSZMILABgSkYVWLd2dB8AgIV00iQCCwCYklEF1i0d3QcAYCGdNElXgfW1JBs6uhcAwP3ZkNYky66rwEqSmzu8FwDAljprkS4D66sd3gsAYEudtUiXgXVTh/cCANhSZy3SZWDd2OG9AAC21FmLdBlYX+nwXgAAW+qsRQQWADAVowysGzq8FwDAljprkS4D68sd3gsAYEudtYjAAgCmYpSBdUuSOzq8HwDAZnekw4/u6zKwkuT6ju8HAJB03CBdB9Z/dXw/AICk4wYRWADAFIw6sK7r+H4AAEnHDdJ1YF3b8f0AAJKOG0RgAQBTMOrA+lKSDR3fEwCYtg1pDdKZrgOr8/+DAMDkdf4CT9eBlST/UXBPAGC6Om8PgQUAjN0kAuvqgnsCANPVeXtUBNYXCu4JAExX5+0hsACAsZtEYN0Zv0kIAHTjS2nt0amKwEqSzxfdFwCYlpLmEFgAwJhNKrCuLLovADAtJc0hsACAMZtUYF2T5NaiewMA03BrWnN0riqwkuTfCu8NAIxfWWtUBta/Ft4bABi/staoDKx/Kbw3ADB+Za1RGVj/XHhvAGD8ylqjMrCuSXJj4f0BgPG6MUVvcE9qAytJ/qn4/gDAOJU2RnVgrS2+PwAwTqWNIbAAgDGadGBdUXx/AGCcShujOrBuj1exAID5WpvWGGWqAytJPlc9AAAYlfK26ENgfbZ6AAAwKuVtIbAAgLEpb4s+BNYNSa6sHgEAjMKVaW1Rqg+BlSR/Xz0AABiFXjSFwAIAxqQXTdGXwPpU9QAAYBR60RR9Cawb43lYAMCOWZvWFOX6ElhJ8snqAQDAoPWmJfoUWH9XPQAAGLTetETfAuvu6hEAwCDdHYF1v9Ynuax6BAAwSJeltUQv9CmwkuTS6gEAwCD1qiH6FliXVA8AAAapVw3Rt8D6fJKrqkcAAINyVVpD9EbfAitJLq4eAAAMSu/aoY+BdVH1AABgUHrXDn0MrAuT3Fw9AgAYhJvT2qFX+hhYSfKJ6gEAwCD0shkEFgAwZL1shr4G1gXp0cPCAIBeWp/WDL3T18C6LcnfVo8AAHrtb9OaoXf6GlhJ8jfVAwCAXuttK/Q5sD6eZEP1CACglzaktUIv9Tmwbk7yseoRAEAvfSw9fqxTnwMrEVgAwP3rdSP0PbD+OsnXq0cAAL3y9bRG6K2+B9YtSf6qegQA0Ct/ldYIvdX3wEqSv6weAAD0Su/bYCiB1etKBQA6c0sE1lzck+QvqkcAAL3wF2lt0GtDCKwk+Wj1AACgFwbRBEMJrE8k+WL1CACg1BfT0w933tJQAitJ/rx6AABQajAtILAAgKEYTAsMKbCuTHJh9QgAoMSFaS0wCEMKrCQ5v3oAAFBiUA0wxMDq7Qc7AgDL4uYIrGW1LsmfVo8AADr1p2kNMBhDC6wk+ZPqAQBApwZ39g8xsD6b5LLqEQBAJy5LO/sHZYiBlSQfrh4AAHRikGf+UAPrvCQ3VI8AAJbVDWln/uAMNbDuTnJu9QgAYFmdm3bmD85QAysRWAAwdoM964ccWFdlYM/EAAAW7fy0s36QhhxYSfKh6gEAwLIY9Bk/9MD6eJLPVI8AAObqM2ln/GANPbCS5IPVAwCAuRr82T6WwLq2egQAMBfXRmD1wvokH6geAQDMxQfSzvZBG0NgJe2LcVv1CABgh9yWkbxoMpbAuiHJ+6tHAAA75P0ZySe1jCWwkvZF2VQ9AgDYLpsyohdLxhRYVyV5X/UIAGC7vC8DfrDolsYUWEnyR9UDAIDtMqozfGyB9bkM+HOLAGCizk07w0djbIGVJH9YPQAAWJLRnd1jDKzL40OgAWAozk87u0dljIGVJO+tHgAALMooz+yxBtYlSf6segQAsKA/SzuzR2esgZUkf1A9AABY0GjP6jEH1qVJzqseAQDcr/PSzupRGnNgJSMuYwAYuFGf0WMPrE9mJB8aCQAj8oG0M3q0xh5YSfKeJBurRwAASdqZ/J7qEcttCoG1Nsm7q0cAAEnamby2esRym0JgJe2LeVv1CACYuNsykRc9phJYX0zyruoRADBx70o7k0dvKoGVJO9Mcm31CACYqGvTzuJJmFJg3ZQJfWEBoGfemXYWT8KUAitpX9zPVY8AgIn5XCb2IsfUAuubSd5RPQIAJuYdaWfwZEwtsJL2aP6PVI8AgIn4SCb40XVTDKwkeXs8fBQAltvGtDN3cqYaWJ9K8rbqEQAwcm9LO3MnZ6qBlbQvusc2AMDyuDYTfjFjyoF1fSb8hQeAZfa2tLN2kqYcWEn7rYYLq0cAwMhcmIn/1v7UAytJzqkeAAAjM/mzVWC1yvajQgCYj7fFT4cE1sw5Sa6uHgEAA3d1vHqVRGBtdn2St1SPAICBe0sm/Mb2/0tgfct7k5xfPQIABur8tLOUCKwtvTnJrdUjAGBgbk07Q5kRWPe1NsnZ1SP6brfddqueMEmrVq2a25/la9i9eX79dt1117n9WWybvy+LcnbaGcrMyuoBPXR2kqOSHF+8o7euuOKKPOhBD8qmTZuqp0zKf/7nf87tz7riiiuy6667+hp26Jprrpnbn7V27drsvvvuvn4dWLFiRa644orqGX13Ybw48W1W+At6v45O8rEkq6uHzMsZZ5yRt771rdUzACYh2yBSAAAMe0lEQVTtV3/1V3POOaP6Jbt7kjwpyaXVQ/rGjwjv36VJ3lQ9AgB67k0RV/dLYG3d78U3DQBszaVpZyX3Q2Bt3V1pZX539RAA6Jm7087Iu6qH9JXAWthF8aNCANjSm9LOSLZCYG3bG5NcUD0CAHrigrSzkQUIrG1bn/aNdEv1EAAodkvambi+ekjfCazF+WTUOgC8Me1MZBsE1uKdneS86hEAUOS8eKDoogmspXlDkqurRwBAx65OOwNZJIG1NFfGNxgA0/OGtDOQRRJYS/fHSd5SPQIAOvKWtLOPJRBY2+f1SS6uHgEAy+zitDOPJRJY2+eWJL+b5CvVQwBgmXwl7azzmKLtILC23+Vp33gAMEa/m3bWsR0E1o551+wCgDFxvu0ggbXjfifJJdUjAGBOLkk729gBAmvH3Zj2jXh99ZCF3HTTTdUTACZvAP8uvj7tTLuxesjQraweMBKXp31D/r/iHVt18MEH5/jjj6+eATBpBx98cPWEbfmdeN/VXKzYtGlT9YYxeUOSl1ePAIDt8MYkr6geMRYCa752S/K+JCdXDwGAJTg/yalJ1lUPGQvvwZqvdUl+O8na6iEAsEhr084ucTVHAmv+rkryuiS9fycjAJN3U9qZdVX1kLERWMvj42nfsADQZ69LO7OYM4G1fN4dn98EQH+9Pu2sYhl4k/vyWp3k95M8s3oIAPwfH0zyK0nuqR4yVl7BWl73JPmtJBdVDwGAmYvSziZxtYwE1vK7Nu1n3P9ePQSAyfv3tDPp2uohYyewuvHptG9oHz0AQJUb086iT1cPmQKB1Z2PpL0ke2/1EAAm5960M+gj1UOmQmB16/eTvLZ6BACT89q0M4iO+C3CGm9Jckb1CAAm4ZwkL6keMTVewarx2iTvrx4BwOi9P35yUkJg1bg97WfhH60eAsBofTTtrLm9esgUCaw6/532XxWXFO8AYHwuSTtj/rt4x2QJrFpXpv0F+IfqIQCMxj+knS1XVg+ZMoFV79PxFwGA+dj8H+6edVVMYPXDJ9L+QnypeggAg/WltLPkE9VDEFh98tG0vxhfrh4CwOB8Oe0M8ctTPSGw+uXctL8gX60eAsBgfDXt7Di3egjfIrD6531pf1H+p3oIAL33P2lnxvuqh3BfAquf3pP2F+aO6iEA9NYdaWfFe6qH8O0EVn+9Pclrkqwr3gFA/6xLOyPeXryDrRBY/XZORBYA97U5rs4p3sECBFb/vTntJWCRBcC6tDPhzdVDWJjAGoaz45UsgKnb/MrV2cU7WASBNRxvTvKb8cZ3gCm6I+0M8MrVQAisYTknyVnxCAeAKfmftH/3e8/VgKzYtGlT9QaW7rQkr07y4OohACyrzQ8R9SiGgRFYw3VqWmQ9tHoIAMti88ffeIjoAAmsYXtGWmQdVD0EgLna/MHNPv5moATW8J2UFlmHVQ8BYC6ujA9uHjyBNQ5PTIusH6seAsAO+Ye0uPpE9RB2jMAajyPTIuuY6iEAbJdL0uLq09VD2HECa1wOS4usk6qHALAkH02LqyurhzAfAmt8vjftYXTPLt4BwOK8P8lvJfnv4h3MkcAapz3SXsk6o3oIAAs6J+2Vq9urhzBfAmvcXpUWWg+oHgLAfdybFla/Uz2E5SGwxu9X0n5kuF/1EACSJDem/Ujw96uHsHwE1jQ8Le1zrA6vHgIwcf+e5HVJPlI9hOUlsKbjyLTIOq56CMBEXZQWVx7DMAECa1oOTPtx4TOrhwBMzAfTfix4bfUQuiGwpmd12itZr6weAjARr0975eqe6iF0R2BN1/PTQmvf6iEAI3VTWli9u3oI3RNY03ZiWmStqR4CMDJr0+Lq49VDqCGwODTJbyQ5uXoIwEicn+S3k1xVPYQ6Aosk2S0tsl5ePQRg4N6YFlfrqodQS2Dxfz0n7envB1QPARiY69Oeyv7e6iH0g8BiS0elRdYxxTsAhuKStLi6vHgHPSKwuD/7pUXWC6qHAPTcu9Li6sbqIfSLwGIhL0jy60keUj0EoGe+kuR30wILvo3AYluOSousY4t3APTFxWlxdXnxDnpMYLEYe6c9+f0l1UMAir0l7cnst1QPod8EFkvxi0lekeSR1UMAOnZ1kjck+ePqIQyDwGKpDkuLrFOqhwB05Ly0uLqyegjDIbDYXmemPZh07+ohAMvklrQHh55dPYThEVjsiMenRdYJ1UMA5uyCtLj6ZPUQhklgsaNWpUXWy5LsUrwFYEfdneRNaXG1vngLAyawmJfj0iLr6OohANvp0rS4uqh6CMMnsJinXZP8WlporS7eArBY96SF1e8luat4CyMhsFgOR6eF1vHVQwC24cK0sLq0egjjIrBYLivTftPwzCR7FW8B2NKtab8deHaSbxZvYYQEFsttTZKXJjm5egjAzPlJ3pxkbfUQxktg0ZXnpH3UjqfAA1WuTvuom/dWD2H8BBZdOiDJGUleXD0EmJy3JTknyfXVQ5gGgUWF49NCy5vggeV2YVpYXVg9hGkRWFR6YdqrWQdWDwFG59q0V63eUT2EaRJYVDsgLbJenGSn4i3A8G1MC6u3xY8DKSSw6IvHJXlRkqdVDwEG6yNJ3p7kU9VDQGDRN6ek/ejwiOohwGB8Lu1HgedVD4HNBBZ9tDLJ6bPL+7OArbk2yTtnl4eF0isCiz7bNy2yXpBkz+ItQH/cluRdaWF1U/EWuF8CiyE4JMnzZ5c3wsN0bUzy7tn1xeItsCCBxZCsSXJakmcV7wC694Ek74mPt2EgBBZD9Pgkz0t7Qzwwbucl+YMkn6weAkshsBiyo9NC62eqhwBz92dpYXVp9RDYHgKLMTgm7cOkT64eAuyw89M+jPmS6iGwIwQWY3JUkl9O8oziHcDSnZvkD5NcXrwD5kJgMUZHJPmlJKcmWVG8Bdi6TUnel+SP0h4WCqMhsBizQ5M8e3Z5jhb0x21J3j+7rireAstCYDEF+6c92uFZ8WR4qHRt2uMWPpDkhtIlsMwEFlOyKskzZ9djirfAlHwmyQdn1/riLdAJgcVUnZjkF+I3D2E5nZ/kQ0k+Xj0EuiawmLpD037r8BlpP0oEdswNab8ReG68v4oJE1jQ7JL2ZPinJ3lC8RYYosuSfDjtyet3F2+BcgILvt2jk/xckp9Nsk/xFuizm5P8aZI/SfLZ4i3QKwILtm63tPdonZzk+OIt0CcXpr2/6vwk64q3QC8JLFicw5L89Ow6pHgLVPhikj+fXVcWb4HeE1iwdE9MclKSpybZu3gLLKdbkvxFko8m+UTxFhgUgQXbb3WSn5pdT0nyHbVzYC6+nuSvkvzl7Lqndg4Mk8CC+dg7yZOTPGl27Vw7B5ZkQ5KPza6/TnvlCtgBAgvmb5+0B5n+ZJKfSHuCPPTN+iR/m+Rv0h4EenPtHBgXgQXLa88kJ6S9b+uJ8dgHat2c9l6qTyS5IO1Dl4FlILCgW8cnOS7JsWlPkYfldlWSi5NclPZ4BaADAgvqPCrJMUmOTnt6/C61cxiJu9Oeqn5pkkuSfL52DkyTwIJ+WJXkx2fX45OsqZ3DwKxN8skkfze71tfOAQQW9NN+SR6X5LGz67DaOfTMlUn+fnZ9KsmNtXOALQksGIb90z4j8dFJjohXuKZmbZLPpX3e32eT3FA7B9gWgQXDtEeSH00LrTVJfjjtVS+G78Yk/5QWVWuTXJHk9tJFwJIJLBiPRyT5oSQ/mOQHknx/kr1KF7Ettyb5tyT/muRfkvxzkmtKFwFzIbBg3B6R9v6tw9J+a/FRSQ4qXTRdX0r7jb7Pp72H6sqIKRgtgQXT86Ak3ze7Hpnk4Nl1UHzEz47akBZS/zG7rk7yhdl1Z+EuoGMCC9hs57TIOnB2PTzJw2bXAUl2r5vWK3ckuT7Jf82u65JcO7u+lBZZwMQJLGCx9k7y0Nm1f5KHzK79kuyb5MFpHwU01FfBNqR9lMxXk9yU9mbzr8yuG5J8eXb5IGRgmwQWMG/fnRZje82u75xde6a9CrZ72o8pd5tduyRZnfaw1VVJHji7HpAWazsn2SnJitmfvynJxrQg2pDk3iTfmF3rZ9c9aU80Xze77kx75emOtM/f+9/ZdevsuiXJ1+b+TwKYLIEFADBnO1UPAAAYG4EFADBnAgsAYM4EFgDAnAksAIA5E1gAAHMmsAAA5kxgAQDMmcACAJgzgQUAMGcCCwBgzgQWAMCcCSwAgDkTWAAAcyawAADmTGABAMyZwAIAmDOBBQAwZwILAGDOBBYAwJwJLACAORNYAABzJrAAAOZMYAEAzNn/D+jDOUzOkGEQAAAAAElFTkSuQmCC"""
+
+# -------------------------
+#      Parser Constants
+# -------------------------
+
+# The number of notes a track needs before it is processed with NumPy(if it is installed)
+VECTORIZE_MIN_NOTES = 4096
+
+# The fewest notes a segment of a track needs before it is split in another process
+SEGMENT_MIN_NOTES = 16384
+
+# The version of the output of the parser, change it whenever parse's output changes so cached files aren't reused
+PARSER_VERSION = 3
+
+# The directory converted files are cached in and the most bytes the cached files can take up
+CACHE_DIRECTORY = os.path.join(os.path.expanduser("~"), ".midisplitter", "cache")
+CACHE_MAX_SIZE = 256 * 1000 * 1000
+
+# -------------------------
+#      Service Constants
+# -------------------------
+
+# The address the conversion service listens on by default
+SERVICE_HOST = "127.0.0.1"
+SERVICE_PORT = 8250
+
+# The most conversions that can wait for a worker before new ones are refused
+SERVICE_QUEUE_SIZE = 32
+
+# The number of seconds a conversion can take before its worker is restarted
+SERVICE_TIMEOUT = 60
+
+# The largest MIDI file the service accepts in bytes
+SERVICE_MAX_INPUT_SIZE = 64 * 1000 * 1000
+
+# The number of bytes of a converted file written to the connection at a time
+SERVICE_CHUNK_SIZE = 64 * 1024
+
+# The number of recent conversions the latency stats are calculated from
+SERVICE_LATENCY_SAMPLES = 1000
@@ -5,8 +5,48 @@ import tkinter as tk
 import tkinter.filedialog
 import tkinter.font
 import tkinter.messagebox
+import tkinter.ttk
+import multiprocessing
+import queue
+import traceback
 import midi_parser as mp
 import constants as c
+from cache import ConversionCache
+
+# Convert songs in a worker process as they are sent through a queue, sending their progress and results through another
+def convert_worker(jobs, messages):
+	# Create an object to keep the results of the stages of parse, so converting the same song again with other options is faster
+	memo = mp.StageMemo()
+	# Create the cache of converted files
+	cache = ConversionCache()
+	# Loop until the interface stops the worker
+	while True:
+		# Wait for the kind("convert" or "analyze") and the arguments of a conversion
+		kind, arguments = jobs.get()
+		# Create an object to record the stats of the conversion
+		stats = mp.ParseStats()
+		try:
+			# If the file should only be analyzed
+			if(kind == "analyze"):
+				# Analyze the file, sending the progress of each stage
+				result = mp.analyze_path(*arguments, progress=lambda stage, fraction: messages.put(("progress", stage, fraction)), stats=stats, memo=memo)
+			# Otherwise
+			else:
+				# Convert the file, sending the progress of each stage
+				mp.convert_path(*arguments, progress=lambda stage, fraction: messages.put(("progress", stage, fraction)), stats=stats, cache=cache, memo=memo)
+				result = True
+		except mp.ConversionError as err:
+			# Return the error that stopped the conversion
+			result = err
+		except Exception as err:
+			# Print the error
+			traceback.print_tb(err.__traceback__)
+			# Forget the kept results in case they caused the error
+			memo.clear()
+			# Return the error
+			result = Exception("Conversion failed: " + str(err))
+		# Send the result and the stats
+		messages.put(("result", result, stats))
 
 class Interface(tk.Frame):
 	"""The main interface of the application"""
@@ -28,6 +68,14 @@ class Interface(tk.Frame):
 		# Set these variables to None so we know that the user has not selected a file yet
 		self.input_file_chooser = None
 		self.output_file_chooser = None
+		# Set these variables to None so we know that the worker process hasn't been started
+		self.worker = None
+		self.worker_jobs = None
+		self.worker_messages = None
+		# Create a variable to store if a conversion is running
+		self.converting = False
+		# Set this variable to None so we know that there are no stats from a conversion yet
+		self.stats = None
 		# Add an icon
 		icondata= base64.b64decode(c.ICON_BASE64)
 		tempFile= "icon.ico"
@@ -39,6 +87,8 @@ class Interface(tk.Frame):
 		self.pack()
 		# Create the main gui with widgets
 		self.create_gui()
+		# Stop any running conversion when the window is closed
+		self.master.protocol("WM_DELETE_WINDOW", self.close)
 		# Run the gui
 		tk.mainloop()
 
@@ -78,7 +128,7 @@ class Interface(tk.Frame):
 		index_patches_container = tk.Frame(bottom_options_container, width=80, height=0)
 		normalize_tempo_container = tk.Frame(bottom_options_container, width=80, height=0)
 		# Initialize convert button container
-		convert_container = tk.Frame(self.master, width=0, height=80)
+		convert_container = tk.Frame(self.master, width=0, height=c.CONVERT_HEIGHT)
 		# Create the main title
 		title = tk.Label(header_container, text="MIDI Splitter", font=self.font_large, justify="center", width=10, border=0)
 		# Create an input and output button which brings up a dialog for selecting files
@@ -86,6 +136,16 @@ class Interface(tk.Frame):
 		output_file_button = tk.Button(output_container, text="Output MIDI File", font=self.font_small, command=self.select_output, relief="groove", borderwidth=2)
 		# Create the main convert button
 		self.convert_button = tk.Button(convert_container, text="Convert", font=self.font_medium, command=self.convert_song, relief="groove", borderwidth=2)
+		# Create a button to see what the input file would be split into without converting it
+		self.analyze_button = tk.Button(convert_container, text="Analyze", font=self.font_small, command=self.analyze_song, relief="groove", borderwidth=2)
+		# Initialize Frame object for containing the progress of the conversion
+		progress_container = tk.Frame(convert_container, width=0, height=30)
+		# Create a progress bar, a label for the current stage and a button to cancel the conversion
+		self.progress_value = tk.DoubleVar()
+		self.progress_string = tk.StringVar()
+		progress_bar = tk.ttk.Progressbar(progress_container, variable=self.progress_value, maximum=1)
+		progress_label = tk.Label(progress_container, font=self.font_small, textvariable=self.progress_string, width=20, anchor="w")
+		self.cancel_button = tk.Button(progress_container, text="Cancel", font=self.font_small, command=self.cancel_conversion, relief="groove", borderwidth=2, state="disabled")
 		# Create string variables so that values can be accessed that are typed into entries
 		self.input_file_string = tk.StringVar()
 		self.output_file_string = tk.StringVar()
@@ -172,6 +232,12 @@ class Interface(tk.Frame):
 		output_container.pack(side=tk.RIGHT, expand=1, fill='both')
 		# Pack the title
 		title.pack(side=tk.TOP, expand=1, fill='y', pady=(10, 10))
+		# Pack the progress of the conversion below the convert button
+		progress_container.pack(side=tk.BOTTOM, fill='x', padx=(10, 10), pady=(0, 10))
+		self.cancel_button.pack(side=tk.RIGHT, padx=(10, 0))
+		progress_label.pack(side=tk.RIGHT, padx=(10, 0))
+		progress_bar.pack(side=tk.LEFT, fill='x', expand=1)
+		self.analyze_button.pack(side=tk.RIGHT, fill='y', padx=(0, 10), pady=(10, 10))
 		self.convert_button.pack(side=tk.TOP, fill='both', expand=1, padx=(10, 10), pady=(10, 10))
 		# Pack the file selection buttons
 		input_file_button.pack(side=tk.TOP, fill='both', padx=(10, 10), pady=(10, 10))
@@ -198,11 +264,122 @@ class Interface(tk.Frame):
 		normalize_tempo_entry.pack(side=tk.TOP, pady=(0, 5))
 
 	def convert_song(self):
-		# Parse the file
-		result = mp.parse(self.input_file_string.get(), self.output_file_string.get(), self.note_velocity_string.get(), self.aligning_margin_string.get(), self.track_export_order_string.get() == "Collated", self.normalize_tempo_string.get(), self.create_channels_int.get(), self.index_patches_int.get())
+		# Convert the file with the arguments of the conversion
+		self.start_job("convert", (self.input_file_string.get(), self.output_file_string.get(), self.note_velocity_string.get(), self.aligning_margin_string.get(), self.track_export_order_string.get() == "Collated", self.normalize_tempo_string.get(), self.create_channels_int.get(), self.index_patches_int.get()))
+
+	# Find what the input file would be split into without converting it
+	def analyze_song(self):
+		# Analyze the file with the options that change how it is split
+		self.start_job("analyze", (self.input_file_string.get(), self.aligning_margin_string.get(), self.normalize_tempo_string.get(), self.create_channels_int.get()))
+
+	# Send a conversion or an analysis to the worker process
+	def start_job(self, kind, arguments):
+		# If a conversion is already running, don't start another one
+		if(self.converting):
+			return
+		# If the worker process isn't running, start it(it is kept between conversions so it can reuse their results)
+		if(self.worker == None):
+			self.worker_jobs = multiprocessing.Queue()
+			self.worker_messages = multiprocessing.Queue()
+			self.worker = multiprocessing.Process(target=convert_worker, args=(self.worker_jobs, self.worker_messages), daemon=True)
+			self.worker.start()
+		# Parse the file in the worker process so the window keeps responding
+		self.worker_jobs.put((kind, arguments))
+		self.converting = True
+		# Reset the progress and the buttons
+		self.progress_value.set(0)
+		self.progress_string.set("Starting")
+		self.convert_button.config(bg="SystemButtonFace", state="disabled")
+		self.analyze_button.config(state="disabled")
+		self.cancel_button.config(state="normal")
+		# Check on the conversion later
+		self.after(c.PROGRESS_POLL_INTERVAL, self.poll_conversion)
+
+	# Check the messages of the conversion
+	def poll_conversion(self):
+		# If the conversion was cancelled
+		if(not self.converting):
+			return
+		# Check if the worker has stopped before reading the messages, so none are missed
+		stopped = not self.worker.is_alive()
+		# Loop through the messages that have been sent
+		while True:
+			try:
+				message = self.worker_messages.get_nowait()
+			except queue.Empty:
+				break
+			# If this is the progress of a stage
+			if(message[0] == "progress"):
+				# Show it
+				self.progress_string.set(message[1])
+				self.progress_value.set(message[2])
+			# If this is the result
+			elif(message[0] == "result"):
+				# Store the stats and finish the conversion
+				self.stats = message[2]
+				self.finish_conversion(message[1])
+				return
+		# If the worker stopped without a result
+		if(stopped):
+			# Forget the worker and finish the conversion with an error
+			self.stop_worker()
+			self.stats = None
+			self.finish_conversion(Exception("The conversion stopped unexpectedly"))
+			return
+		# Check again later
+		self.after(c.PROGRESS_POLL_INTERVAL, self.poll_conversion)
+
+	# Show the result of a conversion
+	def finish_conversion(self, result):
+		# Let the user start another conversion
+		self.converting = False
+		self.convert_button.config(state="normal")
+		self.analyze_button.config(state="normal")
+		self.cancel_button.config(state="disabled")
+		# If the file was analyzed
+		if isinstance(result, mp.SongAnalysis):
+			# Show the analysis(without changing the convert button, nothing was converted)
+			self.progress_string.set("Analyzed in %.2fs" % self.stats.wall_time if self.stats != None else "Analyzed")
+			tkinter.messagebox.showinfo(title="Analysis", message=result.summary(c.ANALYSIS_MAX_TRACKS))
+			return
+		# Show the result on the convert button
+		self.progress_string.set(("Done in %.2fs" % self.stats.wall_time) + (" (cached)" if self.stats.cached else "") if self.stats != None and not isinstance(result, Exception) else "Failed")
 		self.convert_button.config(bg="green" if not isinstance(result, Exception) else "red")
 		if isinstance(result, Exception):
 			tkinter.messagebox.showerror(title="Conversion Error", message=result)
+
+	# Stop the running conversion
+	def cancel_conversion(self):
+		# If there is a conversion running
+		if(self.converting):
+			# Stop the worker(the next conversion starts a new one)
+			self.stop_worker()
+			# Let the user start another conversion
+			self.converting = False
+			self.convert_button.config(state="normal")
+			self.analyze_button.config(state="normal")
+			self.cancel_button.config(state="disabled")
+			# Reset the progress
+			self.progress_value.set(0)
+			self.progress_string.set("Cancelled")
+
+	# Stop the worker process and forget it
+	def stop_worker(self):
+		# If the worker is running, stop it
+		if(self.worker != None):
+			self.worker.terminate()
+			self.worker.join()
+		self.worker = None
+		self.worker_jobs = None
+		self.worker_messages = None
+
+	# Close the window
+	def close(self):
+		# Stop any running conversion and the worker process
+		self.cancel_conversion()
+		self.stop_worker()
+		# Close the window
+		self.master.destroy()
 	
 	def path_color(self, filepath, save):
 		if(filepath == ""):
@@ -1,4 +1,22 @@
-import gui as gui
+import sys
+import multiprocessing
 
-# Create the main interface
-interface = gui.Interface()
\ No newline at end of file
+# Only start when run directly(worker processes import this file too)
+if(__name__ == "__main__"):
+	# Let worker processes start if the application is frozen into an executable
+	multiprocessing.freeze_support()
+	# If the conversion service should be run
+	if(len(sys.argv) > 1 and sys.argv[1] == "serve"):
+		import server as server
+		# Run it until it is interrupted
+		sys.exit(server.main(sys.argv[2:]))
+	# If there are command line arguments
+	if(len(sys.argv) > 1):
+		import cli as cli
+		# Convert the files without the interface
+		sys.exit(cli.main())
+
+	import gui as gui
+
+	# Create the main interface
+	interface = gui.Interface()
\ No newline at end of file
@@ -1,13 +1,115 @@
 import mido
-from mido import MetaMessage, Message, MidiFile, MidiTrack
 import constants as c
-from decimal import Decimal, ROUND_UP, getcontext
-import copy
+import smf
+from fractions import Fraction
+import math
+import os
+import sys
+import hashlib
 import traceback
+import time
+from bisect import bisect_left, bisect_right
+from array import array
+from itertools import repeat, accumulate
+from concurrent.futures import ProcessPoolExecutor
+
+# NumPy is optional, it is only used to process large tracks faster
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+# resource is only available on Unix, it is only used to measure the peak memory of parse
+try:
+	import resource
+except ImportError:
+	resource = None
+
+# An error that stopped a MIDI file from being converted
+class ConversionError(Exception):
+	pass
+
+# An error in the options of a conversion
+class OptionError(ConversionError):
+	pass
+
+# An error loading or reading the input file
+class InputError(ConversionError):
+	pass
+
+# An error writing the output file
+class OutputError(ConversionError):
+	pass
+
+# Convert a MIDI file to another file, returning True or the error that stopped it
+def parse(input_file, output_file, new_velocity, align_margin, collated, normalized_tempo, create_channels, index_patches, workers=1, progress=None, stats=None, cache=None, memo=None, low_memory=False):
+	try:
+		# Convert the file
+		convert_path(input_file, output_file, new_velocity, align_margin, collated, normalized_tempo, create_channels, index_patches, workers, progress, stats, cache, memo, low_memory)
+	except ConversionError as err:
+		# If it was caused by another error, print that error
+		if(err.__cause__ != None):
+			traceback.print_tb(err.__cause__.__traceback__)
+		# Return the error
+		return err
+	# Return true if it was converted
+	return True
+
+# Convert a MIDI file to another file, raising a ConversionError if it can't be converted
+def convert_path(input_file, output_file, new_velocity="", align_margin="", collated=True, normalized_tempo="", create_channels=True, index_patches=True, workers=1, progress=None, stats=None, cache=None, memo=None, low_memory=False):
+	# Check if the input file wasn't given
+	if(input_file == ""):
+		# If the input file weren't given, raise an error
+		raise OptionError("Input file not specified")
+
+	# Check if the input file wasn't given
+	if(output_file == ""):
+		# If the input file weren't given, raise an error
+		raise OptionError("Output file not specified")
+
+	# Write the chunks of the converted file to the output file
+	def write(chunks):
+		with open(output_file, "wb") as file:
+			for chunk in chunks:
+				file.write(chunk)
+
+	# Map the input file into memory and convert it(the file is identified by its path, size and modification time)
+	convert_song(lambda: file_identity(input_file), lambda: smf.MidiReader(input_file), write, new_velocity, align_margin, collated, normalized_tempo, create_channels, index_patches, workers, progress, stats, cache, memo, low_memory)
+
+# Convert a MIDI file in memory(bytes, a memory view or anything else with the buffer protocol) and return the converted file as bytes
+def convert_bytes(data, **options):
+	# Create a list to store the converted file
+	output = []
+	# Convert the data(it is identified by its hash)
+	convert_song(lambda: ("bytes", hashlib.sha256(data).digest()), lambda: smf.MidiReader(data=data), output.extend, **options)
+	# Return the converted file
+	return b"".join(output)
+
+# Convert a MIDI file read from a binary file object and write the converted file to another
+def convert_stream(input_stream, output_stream, **options):
+	# Read the input and write the converted file
+	output_stream.write(convert_bytes(input_stream.read(), **options))
+
+# Find what converting a MIDI file would give without converting it, raising a ConversionError if it can't be analyzed
+def analyze_path(input_file, align_margin="", normalized_tempo="", create_channels=True, workers=1, progress=None, stats=None, memo=None):
+	# Check if the input file wasn't given
+	if(input_file == ""):
+		# If the input file weren't given, raise an error
+		raise OptionError("Input file not specified")
 
-def parse(input_file, output_file, new_velocity, align_margin, collated, normalized_tempo, create_channels, index_patches):
+	# Map the input file into memory and split its tracks(the file is identified by its path, size and modification time)
+	return convert_song(lambda: file_identity(input_file), lambda: smf.MidiReader(input_file), None, align_margin=align_margin, normalized_tempo=normalized_tempo, create_channels=create_channels, index_patches=False, workers=workers, progress=progress, stats=stats, memo=memo, analysis=SongAnalysis())
+
+# Find what converting a MIDI file in memory would give without converting it
+def analyze_bytes(data, align_margin="", normalized_tempo="", create_channels=True, workers=1, progress=None, stats=None, memo=None):
+	# Split the tracks of the data(it is identified by its hash)
+	return convert_song(lambda: ("bytes", hashlib.sha256(data).digest()), lambda: smf.MidiReader(data=data), None, align_margin=align_margin, normalized_tempo=normalized_tempo, create_channels=create_channels, index_patches=False, workers=workers, progress=progress, stats=stats, memo=memo, analysis=SongAnalysis())
+
+# Convert a MIDI file, given functions to identify it, load it as a MidiReader and write the converted file from an iterable of bytes chunks
+# With low_memory, the tracks are split one at a time and moved to a temporary file once they are finished, then written one at a time
+# With an analysis, the tracks are only split and the SongAnalysis is filled in and returned instead of writing anything
+def convert_song(identify, load, write, new_velocity="", align_margin="", collated=True, normalized_tempo="", create_channels=True, index_patches=True, workers=1, progress=None, stats=None, cache=None, memo=None, low_memory=False, analysis=None):
 
-	# TODO: Extract parts of parse function into other functions
 	# TODO: Options for merging tracks
 	# TODO: Align notes in different tracks
 	# TODO: Use channels to split tracks
@@ -16,23 +118,33 @@ def parse(input_file, output_file, new_velocity, align_margin, collated, normali
 	#    Initialization
 	# =====================
 
-	# Check if the input file wasn't given
-	if(input_file == ""):
-		# If the input file weren't given, return an exception
-		return Exception("Input file not specified")
+	# If the stats of parsing shouldn't be recorded
+	if(stats == None):
+		# Record them in an object that ignores them
+		stats = ParseStats(enabled=False)
 
-	# Check if the input file wasn't given
-	if(output_file == ""):
-		# If the input file weren't given, return an exception
-		return Exception("Output file not specified")
+	# If the results of the stages shouldn't be kept for later parses(they take up memory)
+	if(memo == None or low_memory):
+		# Compute them with an object that doesn't keep them
+		memo = StageMemo(enabled=False)
+
+	# Start timing the whole parse
+	stats.start()
+
+	# Report the stage parsing is at and the fraction of the work that is done
+	def report(stage, fraction):
+		# If there is a function to report progress to
+		if(progress != None):
+			# Report it
+			progress(stage, fraction)
 
 	# If index_patches is selected but not create_channels
 	if(index_patches and not create_channels):
-		return Exception("Patches cannot be indexed without creating channels")
+		stats.stop()
+		raise OptionError("Patches cannot be indexed without creating channels")
 
-	# Create lists for storing notes and meta messages
+	# Create a list for storing notes
 	track_notes = []
-	track_meta = []
 
 	# Create a list for storing final tracks
 	output_tracks = []
@@ -40,24 +152,25 @@ def parse(input_file, output_file, new_velocity, align_margin, collated, normali
 	# Create a list to store which output tracks are only meta
 	meta_track_indices = []
 
-	# Create a dictionary to store the patch of each track
-	patch_dictionary = {}
-
 	# Create a list to store which indices tracks are split into
 	split_indices = []
 
+	# Create a variable to store the number of indices given to tracks so far(a track can be split into no tracks)
+	split_count = 0
+
 	# Try to load the input file
 	try:
-		# Load the input MIDI file
-		input_song = mido.MidiFile(input_file)
+		# Get the identity of the input file so the results of earlier parses of it can be reused(only if they are kept)
+		identity = identify() if memo.enabled else None
+		# Load the input MIDI file and find its tracks(or reuse the ones an earlier parse found)
+		input_song = memo.get(identity, "Load", None, load)
 	except Exception as err:
-		# Print the error
-		traceback.print_tb(err.__traceback__)
-		# If it couldn't be loaded, return an error
-		return Exception("Input file could not be loaded, try checking the input file path")
+		stats.stop()
+		# If it couldn't be loaded, raise an error
+		raise InputError("Input file could not be loaded, try checking the input file path") from err
 
 	# Create a new MIDI file for the final song
-	output_song = mido.MidiFile(ticks_per_beat=input_song.ticks_per_beat)
+	output_song = smf.MidiWriter(input_song.ticks_per_beat)
 	
 	# Check if we should override the note velocity
 	try:
@@ -93,9 +206,6 @@ def parse(input_file, output_file, new_velocity, align_margin, collated, normali
 	# Cast the parameter to a boolean
 	index_patches = bool(index_patches)
 
-	# Create a dictionary to serve as a look up table for tempo
-	tempo_dict = {}
-
 	# Create a aligning margin variable
 	alignment_margin = 0
 
@@ -105,34 +215,165 @@ def parse(input_file, output_file, new_velocity, align_margin, collated, normali
 	except:
 		pass
 
+	# If it isn't a finite number, ignore it
+	if(not math.isfinite(alignment_margin)):
+		alignment_margin = 0
 
-	# ============================
-	#    Extract Tempo Messages
-	# ============================
-	
-	# Loop through all tracks
-	for i, track in enumerate(input_song.tracks):
+	try:
+		# See if the user has input an integer number of worker processes
+		workers = int(workers)
+	except:
+		# If not, process the tracks in this process
+		workers = 1
+
+	# If memory should be saved, process one track at a time and don't use the cache(it holds the whole converted file in memory)
+	if(low_memory):
+		workers = 1
+		cache = None
+
+	# If there is a cache of converted files
+	if(cache != None):
+		# Get the key of the input file converted with these options(workers doesn't change the output)
+		cache_key = cache.key(input_song.get_data(), (new_velocity, float(alignment_margin), bool(collated), normalized_tempo, create_channels, index_patches))
+		# Get the converted file if it was converted before
+		output = cache.get(cache_key)
+		# If it was
+		if(output != None):
+			# Unmap the input file
+			input_song.close()
+			stats.cached = True
+			# Write the converted file like a conversion
+			return write_song([output], write, stats, report)
+
+
+	# Try to read the tempo and patch changes(or reuse the ones an earlier parse read)
+	try:
+		has_notes, tempo_map, patch_map = memo.get(identity, "Maps", None, lambda: read_maps(input_song, stats, report))
+	except smf.MidiFileError as err:
+		stats.stop()
+		# If it couldn't be read, raise the same error as if it couldn't be loaded
+		raise InputError("Input file could not be loaded, try checking the input file path") from err
+
+	# If memory should be saved
+	if(low_memory):
+		# Drop the pages of the input file that were read(each track is read again when it is split)
+		for track in input_song.tracks:
+			track.release()
+
+	# If we should not normalize the tempo
+	if(normalized_tempo < 0):
+		# Convert the notes back to ticks with the original tempos
+		output_tempo_map = tempo_map
+	# If we should normalize the tempo
+	else:
+		# Convert the notes back to ticks with a single tempo
+		output_tempo_map = TempoMap({0: normalized_tempo}, input_song.ticks_per_beat)
 
-		# Create a time variable for storing absolute time and set it to 0
-		tick_time = 0
-		
-		# Loop through all notes in the track
-		for j, msg in enumerate(track):
+	# ==========================
+	#     Split Note Tracks
+	# ==========================
 
-			# If there is a change in time then add that to the absolute time
-			tick_time += msg.time
+	# Get the tracks that have any notes(or other non-meta messages)
+	note_tracks = [track for i, track in enumerate(input_song.tracks) if has_notes[i]]
+
+	# Get the options splitting depends on(the margin in time units and the tempo the notes are converted back with)
+	split_options = (tempo_map.second2time(alignment_margin), normalized_tempo)
+
+	# Get the split tracks and the converted notes of each track if an earlier parse kept them
+	kept_results = memo.lookup(identity, "Track Splitting", split_options)
+	converted_notes = memo.lookup(identity, "Convert Note Format", None)
+
+	# If there is only one track, its segments are split in parallel instead of the tracks
+	segment_workers = workers if len(note_tracks) == 1 else 1
+
+	# Get the arguments to split each track with(keeping the converted notes if they aren't kept yet)
+	split_arguments = (note_tracks, repeat(tempo_map), repeat(output_tempo_map), repeat(split_options[0]), repeat(patch_map), repeat(stats.enabled), converted_notes if converted_notes != None else repeat(None), repeat(memo.enabled and converted_notes == None), repeat(segment_workers))
+
+	# The stages of splitting are timed inside each track
+	stats.end()
+
+	# If an earlier parse split the tracks with the same options
+	if(kept_results != None):
+		# Reuse its results(without stats, since nothing is processed)
+		split_results = [(notes, new_tracks, ParseStats(enabled=False), None) for notes, new_tracks in kept_results]
+	# If there are multiple workers and multiple tracks to split
+	elif(workers > 1 and len(note_tracks) > 1):
+		# Report that the tracks are being split
+		report("Splitting tracks", 0.15)
+		# Split the tracks in parallel(the results are in the same order as the tracks)
+		with ProcessPoolExecutor(min(workers, len(note_tracks))) as executor:
+			split_results = list(executor.map(process_track, *split_arguments))
+	# Otherwise
+	else:
+		# Split the tracks one at a time as they are needed
+		split_results = map(process_track, *split_arguments)
+
+	# Get an iterator over the results in the order of the tracks
+	split_results = iter(split_results)
+
+	# Create lists to store the results of splitting each track and their converted notes, to keep for later parses
+	new_split_results = []
+	new_converted_notes = []
+
+	# ======================
+	#     Song Analysis
+	# ======================
+
+	# If the song is only being analyzed
+	if(analysis != None):
+		# Loop through the tracks
+		for i, track in enumerate(input_song.tracks):
+			# Report which track is being analyzed
+			report("Analyzing track " + str(i + 1) + " of " + str(len(input_song.tracks)), 0.15 + 0.8 * i / len(input_song.tracks))
+			# If this is just a meta track
+			if(not has_notes[i]):
+				# Add this track index to the list recording which tracks are only meta
+				meta_track_indices.append(i)
+				# It would be copied as one track without notes
+				analysis.add_track(track.name, 0, 1, 0)
+				continue
+			# Get the notes of the track and the rows of the notes in each new track
+			notes, new_tracks, track_stats, converted = next(split_results)
+			stats.merge(track_stats)
+			# If the results are kept for later parses, collect them
+			if(memo.enabled):
+				new_split_results.append((notes, new_tracks))
+				new_converted_notes.append(converted)
+			# Add the notes and the number of tracks it would be split into
+			analysis.add_track(track.name, len(notes), len(new_tracks), max_polyphony(notes))
+
+		# Every track has been read, so unmap the input file
+		input_song.close()
+
+		# Keep the results of splitting the tracks for later parses(the converted notes are only kept the first time)
+		memo.store(identity, "Track Splitting", split_options, new_split_results)
+		if(converted_notes == None and kept_results == None):
+			memo.store(identity, "Convert Note Format", None, new_converted_notes)
+
+		# If there are no meta only tracks and the tempo isn't normalized, an empty track would be added for the tempo changes
+		if(len(meta_track_indices) == 0 and normalized_tempo < 0):
+			meta_track_indices.append(0)
+			analysis.output_tracks += 1
 
-			# If we found a set_tempo message
-			if(msg.is_meta and msg.type == "set_tempo"):
-				# Add it to the look up table
-				tempo_dict[tick_time] = msg.tempo
+		# If we are creating output channels
+		if(create_channels):
+			# Get the meta only tracks, they don't have channel messages so they can't share a channel
+			meta_tracks = set(meta_track_indices)
+			# Count the other tracks that would get an index past the last channel(the same way as when they are finished)
+			analysis.channel_overflow = sum(1 for i in range(analysis.output_tracks) if i not in meta_tracks and i - bisect_left(meta_track_indices, i) > 15)
 
+		# Stop timing and return the analysis
+		stats.output_tracks = analysis.output_tracks
+		stats.stop()
+		report("Done", 1)
+		return analysis
 
-	# If there are no tempo messages
-	if(len(tempo_dict) == 0):
-		# Set the tempo to the default of 120bpm
-		tempo_dict[0] = mido.bpm2tempo(120)
+	# If memory should be saved, create a temporary file to move the finished tracks to
+	spill = smf.TrackSpill() if low_memory else None
 
+	# Keep a finished track(in the temporary file if there is one)
+	def keep(finished_track):
+		return spill.add(finished_track) if spill != None else finished_track
 
 	# ==========================
 	#     Loop Through Tracks
@@ -140,349 +381,58 @@ def parse(input_file, output_file, new_velocity, align_margin, collated, normali
 
 	for i, track in enumerate(input_song.tracks):
 
-		# ===================================
-		#    Program/Patch Change Messages
-		# ===================================
-		
-		# Create a time variable for storing absolute time and set it to 0
-		tick_time = 0
-
-		# Create a list of channels
-		channel_list = []
-
-		# Loop through all messages
-		for msg in track:
-
-			# If this message is not a meta message
-			if not msg.is_meta:
-				try:
-					# If this message's channel isn't in the no_patches dictionary
-					if not msg.channel in channel_list:
-						# Add it
-						channel_list.append(msg.channel)
-				except Exception:
-					pass
-			
-			# If there is a change in time then add that to the absolute time
-			tick_time += msg.time
-
-			# If this message is a patch change message
-			if(msg.type == "program_change"):
-				# If this channel doesn't have a dictionary entry
-				if not msg.channel in patch_dictionary:
-					# Make an entry
-					patch_dictionary[msg.channel] = {}
-				# Add a patch entry for the current channel at the current time
-				patch_dictionary[msg.channel][tick_time] = msg.program
-
-		# Loop through all channels
-		for channel in channel_list:
-			# If this channel doesn't have a dictionary entry
-			if not channel in patch_dictionary:
-				# Make an entry
-				patch_dictionary[channel] = {}
-			
-			# If this channel doesn't have a patch at the beginning
-			if not 0 in patch_dictionary[channel]:
-				# Add the default patch at the beginning
-				patch_dictionary[channel][0] = 0
+		# Report which track is being processed
+		report("Processing track " + str(i + 1) + " of " + str(len(input_song.tracks)), 0.15 + 0.65 * i / len(input_song.tracks))
+		stats.begin("Track Output")
 
 		# ==============================
 		#     Raw Message Extraction
 		# ==============================
 
-		# Store all meta messages in a list
-		meta_messages = [msg for msg in track if msg.is_meta]
-
-		# Reset tick_time to zero
-		tick_time = 0
-
-		# Create a new empty list inside the main list for all tracks to append notes to
-		track_meta.append([])
-
-		# Create a new empty list inside the main list for all tracks to append meta messages to
-		track_notes.append([])
-		
-		# Loop through all meta messages
-		for msg in meta_messages:
-			# Append the message to the meta list for this track
-			track_meta[i].append(msg)
+		# Create a new empty table inside the main list for all tracks to append notes to
+		track_notes.append(NoteTable())
 
 		# ======================
 		#    Meta-only tracks
 		# ======================
 
 		# If this is just a meta track
-		if(len(meta_messages) == len(track)):
-			# We'll first assume the split index is 0
-			split_index = 0
-			# If this is not the first track
-			if(i != 0):
-				# Get the indices the previous track was split into
-				previous_track = split_indices[len(split_indices) - 1]
-				# Set the split index as the previous maximum index plus one
-				split_index = previous_track[len(previous_track) - 1] + 1
-			# Append this index to the list
-			split_indices.append([split_index])
+		if(not has_notes[i]):
+			# Append the next index to the list
+			split_indices.append([split_count])
+			split_count += 1
 			
 			# Add this track index to the list recording which tracks are only meta
 			meta_track_indices.append(len(output_tracks))
 			# Add sub-list where this track will be stored
 			output_tracks.append([])
 			# Create a new track
-			finished_track = MidiTrack()
-			# Append this track to the sub-list
-			output_tracks[len(output_tracks) - 1].append(finished_track)
-			# Create a new variable to keep track of skipped delta time
-			skipped_ticks = 0
+			finished_track = smf.EventTrack()
+			# Create a variable to store the time of the last message added(the time of skipped messages is added to the next one)
+			last_time = 0
 			# Loop through all messages
-			for msg in track_meta[i]:
+			for tick_time, status, meta_type, data in track:
 				# If this is a tempo message
-				if(msg.type == "set_tempo"):
-					# Increase the skipped time by the amount of this message
-					skipped_ticks += msg.time
+				if(meta_type == smf.SET_TEMPO):
 					# Don't append it
 					continue
-				# Increase this message's time by the amount of skipped ticks
-				msg.time += skipped_ticks
-				# Reset the amount of skipped time
-				skipped_ticks = 0
-				# Append message to the finished track
-				finished_track.append(msg)
+				# Append message to the finished track with the time since the last message
+				finished_track.append(tick_time - last_time, status, meta_type, payload=data)
+				last_time = tick_time
+			# Append this track to the sub-list
+			output_tracks[len(output_tracks) - 1].append(keep(finished_track))
 			# Skip everything below
 			continue
 
-		# ===========================
-		#     Convert Note Format
-		# ===========================
-
-		# Create a variable to store the state of the sustain controller
-		sustain = False
-		# Create a variable to store the state of the sustain controller last loop
-		sustain_last = False
-		# Create a variable to store the state of the sostenuto controller
-		sostenuto = False
-		# Create a variable to store the state of the sostenuto controller last loop
-		sostenuto_last = False
-		# Create a variable to store all notes being sustained by the sostenuto controller
-		sostenuto_notes = []
-		# Create a variable to turn all notes off 
-		off = False
-
-		# Loop through all notes in the track
-		for j, msg in enumerate(track):
-
-			# If this is the last message
-			if(j == len(track) - 1):
-				# Turn all notes off
-				off = True
-
-			# If there is a change in time then add that to the absolute time
-			tick_time += msg.time
-
-			# If this is a note on message
-			if(msg.type == "note_on"):
-				# If the note has a nonzero velocity
-				if(msg.velocity != 0):
-					# Create a new entry with the format of [TIME ON, TIME OFF, NOTE, VELOCITY, ALIGNED, TRACK INDEX, CHANNEL, PATCH]
-					track_notes[i].append([tick_time, None, msg.note, msg.velocity, 0, None, msg.channel, get_patch(patch_dictionary, msg.channel, tick_time)])
-					# If this channel doesn't already have a patch
-					if(patch_dictionary[msg.channel] == None):
-						# Assume that it is has a default patch of 1
-						patch_dictionary[msg.channel] = 1
-				# If the note has a zero velocity
-				else:
-					# Loop through the notes list backwards
-					for j in reversed(range(len(track_notes[i]))):
-						if(msg.note in sostenuto_notes):
-							break
-						# Check if there is a note that is the same note and doesn't end yet
-						if(track_notes[i][j][2] == msg.note and track_notes[i][j][1] == None):
-							# Set the current time as its end time
-							track_notes[i][j][1] = tick_time
-			# If this is a note off message and sustain is not active
-			if(msg.type == "note_off" and not sustain):
-				# If this note is being sustained by sostenuto
-				if(msg.note in sostenuto_notes):
-					# Don't stop it
-					break
-				# Loop through the notes list backwards
-				for j in reversed(range(len(track_notes[i]))):
-					# Check if there is an active note that doesn't end yet
-					if(track_notes[i][j][2] == msg.note and track_notes[i][j][1] == None):
-						# Add the current time as its end time
-						track_notes[i][j][1] = tick_time
-			# If this message is a controller change
-			if(msg.type == "control_change"):
-				# If it is a sustain message
-				if(msg.control == 64):
-					# Set it on/off
-					sustain = not msg.value < 64
-				# If it is a sostenuto message 
-				if(msg.control == 66):
-					# Set it on/off
-					sostenuto = not msg.value < 64
-				# If this is a controller message to turn all notes off
-				if(msg.control == 120):
-					# Turn on the flag
-					off = True
-				# If this is a reset controllers message
-				if(msg.control == 121):
-					# Turn off sustain and sostenuto
-					sustain = False
-					sostenuto = False
-
-			# If sostenuto just turned on
-			if(sostenuto and not sostenuto_last):
-				# Remove the notes it was holding down
-				sostenuto_notes.clear()
-				# Check which notes are being pressed
-				notes_on = list(filter(lambda e: e[1] == None, track_notes[i]))
-				# Loop through the notes
-				for note in notes_on:
-					# Add their pitch to the list
-					sostenuto_notes.append(note[2])
-
-			# If sustain has changed to off
-			if(sustain_last and not sustain):
-				# Check which notes are on and aren't being sustained by sostenuto
-				notes_on = list(filter(lambda e: e[1] == None and e[2] not in sostenuto_notes, track_notes[i]))
-				# Loop through them
-				for note in notes_on:
-					# Set their end time to now
-					note[1] = tick_time
-
-			# If sostenuto has been released
-			if(sostenuto_last and not sostenuto):
-				# Loop through all notes
-				for note in track_notes[i]:
-					# Loop through all notes being sustained by sostenuto
-					for sostenuto_note in sostenuto_notes:
-						# If they have the same pitch and the note has no end time
-						if(note[2] == sostenuto_note and note[1] == None):
-							# Set its end time to now
-							note[1] = tick_time
-
-			# If there is an all notes off message
-			if(off):
-				# Loop through all notes
-				for note in track_notes[i]:
-					# If the note doesn't have an end time
-					if(note[1] == None):
-						# Set its end time to now
-						note[1] = tick_time
-				# Clear all sostenuto notes
-				sostenuto_notes.clear()
-				# Turn off sostenuto
-				sostenuto = False
-				sostenuto_last = False
-				# Turn the all notes off flag off
-				off = False
-
-			# Set the current value of sustain to the last variable for the next loop
-			sustain_last = sustain
-			# Set the current value of sostenuto to the last variable for the next loop
-			sostenuto_last = sostenuto
-
-		# =====================
-		#    Note Processing
-		# =====================
-
-		# If there are any notes that have the same end and start time(0 duration), delete them
-		track_notes[i] = [note for note in track_notes[i] if note[0] != note[1]]
-
-		# Remove duplicate notes
-		track_notes[i] = [list(new_note) for new_note in set(tuple(note) for note in track_notes[i])]
-
-		# Convert the note time to second
-		track_notes[i] = notes2second(track_notes[i], tempo_dict, input_song.ticks_per_beat)
-
-		# Sort the notes by their end time
-		track_notes[i].sort(key=lambda e: e[1])
-
-		# Loop through notes
-		for note in track_notes[i]:
-			# Find the minimum time the note must begin/end at
-			min_time = note[1] - Decimal(alignment_margin)
-			# Find the maximum time the note must begin/end at
-			max_time = note[1] + Decimal(alignment_margin)
-			# Create a variable to store the mean time of all overlapping notes
-			mean_time = Decimal(0)
-			# Create a variable to store how many notes are within the margin
-			overlap_notes = 0
-			# If the note's end has already been aligned
-			if(bool(note[4] & 0b01)):
-				# Skip the rest of the loop
-				continue
-			# Loop through all notes
-			for overlap in track_notes[i]:
-				# If the note starts within the margin and its start has not been aligned
-				if(overlap[0] >= min_time and overlap[0] <= max_time and not bool(overlap[4] & 0b10)):
-					# Add the note's time to the mean time
-					mean_time += overlap[0]
-					# Add one to the note count
-					overlap_notes += 1
-				# If the note ends within the margin and its end has not been aligned
-				if(overlap[1] >= min_time and overlap[1] <= max_time and not bool(overlap[4] & 0b01)):
-					# Add the note's time to the mean time
-					mean_time += overlap[1]
-					# Add one to the note count
-					overlap_notes += 1
-			# If is no other note
-			if(overlap_notes < 2):
-				# Skip the rest of the loop
-				continue
-			# Average the mean time
-			mean_time /= overlap_notes
-			# Loop through all notes
-			for overlap in track_notes[i]:
-				# If the note starts within the margin and its start has not been aligned
-				if(overlap[0] >= min_time and overlap[0] <= max_time and not bool(overlap[4] & 0b10)):
-					# Set the note's time to the mean
-					overlap[0] = mean_time
-					# Turn the bit that signifies the start has been aligned on
-					overlap[4] = overlap[4] | 0b10
-				# If the note ends within the margin and its end has not been aligned
-				if(overlap[1] >= min_time and overlap[1] <= max_time and not bool(overlap[4] & 0b01)):
-					# Set the note's time to the mean
-					overlap[1] = mean_time
-					# Turn the bit that signifies the end has been aligned on
-					overlap[4] = overlap[4] | 0b01
-
-		# If we should not normalize the tempo
-		if(normalized_tempo < 0):
-			# Convert the note time back to ticks with the original tempos
-			track_notes[i] = notes2tick(track_notes[i], tempo_dict, input_song.ticks_per_beat)
-		# If we should normalize the tempo
-		else:
-			# Convert the note time back to ticks with a single tempo
-			track_notes[i] = notes2tick(track_notes[i], {0: normalized_tempo}, input_song.ticks_per_beat)
-
-
-		# Only keep notes that do not have the same start and end time(nonzero duration)
-		track_notes[i] = [note for note in track_notes[i] if note[0] != note[1]]
-		
-		# Sort the notes by their start time
-		track_notes[i].sort(key=lambda e: e[0])
-
-		# ======================
-		#    Track Splitting
-		# ======================
-
-		# Create a new list for new(split) tracks
-		new_tracks = []
-
-		# Iterate through all notes in the current track
-		for note in track_notes[i]:
-			# Calculate the track index of the note
-			track_index = get_track_index(note, track_notes[i])
-
-			# If we need more tracks, add them
-			for j in range(1 + track_index - len(new_tracks)):
-				new_tracks.append([])
-
-			# Add the note to its track
-			new_tracks[track_index].append(note)
+		# Get the notes of the track, the rows of the notes in each new track and the stats of splitting it
+		stats.end()
+		track_notes[i], new_tracks, track_stats, converted = next(split_results)
+		stats.merge(track_stats)
+		# If the results are kept for later parses, collect them
+		if(memo.enabled):
+			new_split_results.append((track_notes[i], new_tracks))
+			new_converted_notes.append(converted)
+		stats.begin("Track Output")
 
 		# ==================
 		#      Indexing
@@ -503,7 +453,7 @@ def parse(input_file, output_file, new_velocity, align_margin, collated, normali
 				# Loop through the notes
 				for note in new_track:
 					# Set the patch to a clamped index value between 0 and 127
-					note[7] = min(max(0, initial_index + j), 127)
+					track_notes[i].patches[note] = min(max(0, initial_index + j), 127)
 
 		# ======================
 		#      Track Output
@@ -517,74 +467,55 @@ def parse(input_file, output_file, new_velocity, align_margin, collated, normali
 		for j, new_track in enumerate(new_tracks):
 
 			# Create a new track to append to the MIDI file that will be exported
-			finished_track = MidiTrack()
-
-			# Use tick_time to represent absolute time and set it to 0
-			tick_time = 0
+			finished_track = smf.EventTrack()
 
 			# Set the finished track name to the old track name concatenated with an index starting with 1
-			finished_track.name = track.name + " " + str(j + 1)
-
-			# Loop through all of the notes in the new track
-			for note in new_track:
-				# Add a note_on message for the note
-				finished_track.append(Message("note_on", note=note[2], velocity=new_velocity if new_velocity >= 0 else note[3], time=(note[0] - tick_time), channel=note[6]))
-				# Add a note_off message for the note
-				finished_track.append(Message("note_off", note=note[2], velocity=0, time=(note[1] - note[0]), channel=note[6]))
-				# Set the absolute time counter to the last message added(the note_off message)
-				tick_time = note[1]
+			finished_track.append(0, smf.META, smf.TRACK_NAME, payload=(track.name + " " + str(j + 1)).encode("latin1"))
 
-			# Use tick_time to represent absolute time and set it to 0
-			tick_time = 0
+			# Get the notes of the current track
+			notes = track_notes[i]
 
-			# Create a variable to store the previous patch
-			last_patch = None
+			# Add a note_on and note_off message for each of the notes in the new track
+			finished_track.append_notes(new_track, notes.starts, notes.ends, notes.pitches, notes.velocities, notes.channels, new_velocity)
 
 			# If we are creating channels and not indexing patches
 			if(create_channels and not index_patches):
-				# We can now reasonably make the assumption that each channel has a one-to-one correspondence with each track
-
-				# Loop through all messages
-				for k, msg in enumerate(finished_track):
-					# Update tick_time
-					tick_time += msg.time
-					# If this is a meta message
-					if(msg.is_meta):
-						# Skip this loop iteration
-						continue
-					# If the patch has changed
-					if(not get_patch(patch_dictionary, msg.channel, tick_time) == last_patch):
-						# Insert a patch change message
-						finished_track.insert(k, Message("program_change", channel=msg.channel, program=get_patch(patch_dictionary, msg.channel, tick_time), time=(tick_time-get_patch_time(patch_dictionary, msg.channel, tick_time))))
-						# Update the preceding note's time
-						msg.time -= (tick_time-get_patch_time(patch_dictionary, msg.channel, tick_time))
-
-					# Update last_patch
-					last_patch = get_patch(patch_dictionary, msg.channel, tick_time)
+				# We can now reasonably make the assumption that each channel has a one-to-one correspondence with each track, so add the patch changes of the notes' channels
+				finished_track = add_program_changes(finished_track, patch_map)
 
 			# Append the finished track to the list of tracks to be output
-			output_tracks[i].append(finished_track)
+			output_tracks[i].append(keep(finished_track))
 		
-		# We'll first assume the starting index is 0
-		starting_index = 0
-		# If this is not the first track
-		if(i != 0):
-			# Get the indices the previous track was split into
-			previous_track = split_indices[len(split_indices) - 1]
-			
-			# Set the starting index as the previous maximum index plus one
-			starting_index = previous_track[len(previous_track) - 1] + 1
 		# Append a sub-list to store the indices this track is split into
 		split_indices.append([])
 		# Loop through the number of tracks this track will be split into
 		for j in range(len(output_tracks[i])):
-			# Add the indices to the sub-list
-			split_indices[i].append(starting_index + j)
+			# Add the next indices to the sub-list
+			split_indices[i].append(split_count + j)
+		split_count += len(output_tracks[i])
+
+		# If memory should be saved
+		if(low_memory):
+			# Forget the notes of the track and drop its pages of the input file
+			track_notes[i] = None
+			track.release()
+
+	# Every track has been read, so unmap the input file(it can be overwritten by the output now)
+	input_song.close()
+
+	# Keep the results of splitting the tracks for later parses(the converted notes are only kept the first time)
+	memo.store(identity, "Track Splitting", split_options, new_split_results)
+	if(converted_notes == None and kept_results == None):
+		memo.store(identity, "Convert Note Format", None, new_converted_notes)
 
 	# =======================
 	#     Song Processing
 	# =======================
 
+	# Report that the song is being processed
+	report("Processing song", 0.8)
+	stats.begin("Song Processing")
+
 	# If we are collating the output
 	if(collated):
 		# Create a variable to store the maximum number of times a track was split
@@ -614,128 +545,1070 @@ def parse(input_file, output_file, new_velocity, align_margin, collated, normali
 
 	# If we should normalize the tempo
 	if(normalized_tempo > 0):
-		# Set the tempo at the beginning of the song
-		output_song.tracks[0].insert(0, MetaMessage("set_tempo", tempo=normalized_tempo))
+		# Set the tempo in the first track
+		tempo_track_index = 0
 	# If we are not normalizing the tempo
 	else:
 
 		# If there are no meta only tracks
 		if(len(meta_track_indices) == 0):
 			# Create a new track
-			output_song.tracks.insert(0, MidiTrack())
+			output_song.tracks.insert(0, smf.EventTrack())
 			# Add its index to the list of meta only tracks
 			meta_track_indices.append(0)
 
-		# Create a list to store tempos in
-		tempos = []
-
-		# Convert tempo_dict to a 2d list
-		for time in tempo_dict:
-			tempos.append([time, tempo_dict[time]])
-		
-		# Re-use tick_time to store absolute time
-		tick_time = 0
-
-		# Create a variable to store the index of the last tempo inserted
-		tempo_index = 0
-
-		# Create a variable to store the total length of the track
-		total_time = 0
-
-		# Get the length of the track
-		for msg in output_song.tracks[meta_track_indices[0]]:
-			total_time += msg.time
-		
-		# Create a new variable to store if the first meta track is empty
-		first_meta_empty = len(output_song.tracks[meta_track_indices[0]]) == 0
-
-		# Loop through the first meta track to which we will add tempo messages(which will be the original length + # of tempo messages when done)
-		for i in range(len(output_song.tracks[meta_track_indices[0]]) + len(tempos)):
-			# If we addded all the tempos
-			if(tempo_index == len(tempos)):
-				# Stop adding them
-				break
-			# If the meta track is/was empty
-			if(first_meta_empty):
-				# Insert the message
-				output_song.tracks[meta_track_indices[0]].append(MetaMessage("set_tempo", tempo=tempos[tempo_index][1], time=tempos[tempo_index][0]-tick_time))
-				# Increment tick_time
-				tick_time += output_song.tracks[meta_track_indices[0]][i].time
-				# Increment the tempo index
-				tempo_index += 1
-				# Skip everything below
-				continue
-			# Increment tick_time
-			tick_time += output_song.tracks[meta_track_indices[0]][i].time
-			# If we're at the end of the list
-			if(i == len(output_song.tracks[meta_track_indices[0]]) - 1):
-				# Insert the message
-				output_song.tracks[meta_track_indices[0]].append(MetaMessage("set_tempo", tempo=tempos[tempo_index][1], time=tempos[tempo_index][0]-tick_time))
-				# Increment the tempo index
-				tempo_index += 1
-				# Skip everything below
-				continue
-			# If the tempo is between these messages
-			if(tick_time <= tempos[tempo_index][0] and tempos[tempo_index][0] <= tick_time + output_song.tracks[meta_track_indices[0]][i + 1].time):
-				# Decrease the delta of the message after it
-				output_song.tracks[meta_track_indices[0]][i + 1].time -= tempos[tempo_index][0]-tick_time
-				# Insert the message
-				output_song.tracks[meta_track_indices[0]].insert(i + 1, MetaMessage("set_tempo", tempo=tempos[tempo_index][1], time=tempos[tempo_index][0]-tick_time))
-				# Increment the tempo index
-				tempo_index += 1
-		# If we didn't add all the tempos
-		if(tempo_index < len(tempos) - 1):
-			# Loop through the remaining tempos
-			for i in range(tempo_index, len(tempos)):
-				# Append the remaining messages
-				output_song.tracks[meta_track_indices[0]].append(MetaMessage("set_tempo", tempo=tempos[i][1], time=tempos[i][0]-tick_time))
-				# Set tick_time
-				tick_time = tempos[i][0]
-
-	# If we are assigning patches on the output tracks
-	if(index_patches):
-		# Loop through all the tracks
-		for i, track in enumerate(output_song.tracks):
-			# Start off with a patch index of the current track index
-			patch_index = i
-			# For every meta only track before it, subtract one
-			for index in meta_track_indices:
-				if index < i:
-					patch_index -= 1
-			# Set the patch of each of the track
-			output_song.tracks[i] = set_track_patch(track, patch_index, patch_index)
-
-					
-	# If we are creating output channels
-	if(create_channels):
-		# Loop through all the tracks
+		# Merge the tempo changes into the first meta only track
+		tempo_track_index = meta_track_indices[0]
+
+	# Get a track ready to be written from its index and the track(loading it first if it was moved to the temporary file)
+	def finish_track(i, track):
+		# If the track was moved to the temporary file, load it
+		if(isinstance(track, smf.SpilledTrack)):
+			track = track.load()
+		# If this is the track the tempo is set in
+		if(i == tempo_track_index):
+			# If we should normalize the tempo
+			if(normalized_tempo > 0):
+				# Set the tempo at the beginning of the song
+				track.insert(0, 0, smf.META, smf.SET_TEMPO, payload=normalized_tempo.to_bytes(3, "big"))
+			# If we are not normalizing the tempo
+			else:
+				# Merge the tempo changes into the track
+				track = merge_tempos(track, tempo_map.changes)
+		# If we are creating output channels
+		if(create_channels):
+			# Get the index of the track without the meta only tracks before it(their indices are in order)
+			channel_index = i - bisect_left(meta_track_indices, i)
+			# Set the channel(and the patch if we are assigning them) of the track to the index
+			track = finalize_track(track, channel_index, channel_index if index_patches else None)
+		# Return the track
+		return track
+
+	# If memory doesn't have to be saved
+	if(not low_memory):
+		# Finish every track now(otherwise each one is finished as it is written)
 		for i, track in enumerate(output_song.tracks):
-			# Start off with a channel index of the current track index
-			channel_index = i
-			# For every meta only track before it, subtract one
-			for index in meta_track_indices:
-				if index < i:
-					channel_index -= 1
-			# Set the channel of each of the tracks
-			output_song.tracks[i] = set_channel(track, channel_index)
-	
+			output_song.tracks[i] = finish_track(i, track)
 
 	# ====================
 	#     Song Output
 	# ====================
 
+	# Count the output tracks
+	stats.output_tracks = len(output_song.tracks)
+
+	# Report that the song is being saved
+	report("Saving song", 0.9)
+	stats.begin("Song Output")
+
+	# If memory should be saved
+	if(low_memory):
+		# Write the song while each track is loaded, finished and encoded(it isn't cached, since that would need all of it in memory)
+		try:
+			write_song(output_song.chunks(finish_track), write, stats, report)
+		finally:
+			# Delete the temporary file
+			spill.close()
+		return
 
-	# Try to save the song
+	# Try to encode the song
 	try:
-		# Save the song
-		output_song.save(output_file)
-		# If it saves, return true
-		return True
+		output = output_song.to_bytes()
 	except Exception as err:
-		# Print the error
-		traceback.print_tb(err.__traceback__)
-		# If it fails to save, return an exception
-		return Exception("Could not save file, try checking the output file path")
+		stats.stop()
+		# If it can't be encoded, raise an error
+		raise OutputError("Could not save file, try checking the output file path") from err
+
+	# If there is a cache, store the converted file in it
+	if(cache != None):
+		cache.put(cache_key, output)
+
+	# Write the song
+	write_song([output], write, stats, report)
+
+# Write the chunks of a converted song, stop timing and report that it is done
+def write_song(chunks, write, stats, report):
+	# Try to write the song
+	try:
+		write(chunks)
+	except Exception as err:
+		stats.stop()
+		# If it can't be written, raise an error
+		raise OutputError("Could not save file, try checking the output file path") from err
+	# Stop timing
+	stats.stop()
+	# Report that parsing is done
+	report("Done", 1)
+
+# Read the tempo changes and patch changes of a song, returning (whether each track has notes, tempo map, patch map)
+def read_maps(input_song, stats, report):
+
+	# ============================
+	#    Extract Tempo Messages
+	# ============================
+
+	# Report that the tempo is being extracted
+	report("Extracting tempo", 0.05)
+	stats.begin("Extract Tempo")
+	
+	# Create a list to store whether each track has any notes(or other non-meta messages)
+	has_notes = []
+
+	# Create a dictionary to serve as a look up table for tempo
+	tempo_dict = {}
+
+	# Loop through all tracks(this is the first time the messages are decoded, so broken tracks raise an error here)
+	for i, track in enumerate(input_song.tracks):
+
+		# Assume the track only has meta messages
+		has_notes.append(False)
+
+		# Loop through all messages in the track
+		for tick_time, status, data1, data2 in track:
+
+			# If we found a set_tempo message
+			if(status == smf.META and data1 == smf.SET_TEMPO):
+				# Add it to the look up table
+				tempo_dict[tick_time] = int.from_bytes(data2[:3], "big")
+				# A beat can't take no time(times are divided by the tempo), raise the error of a broken file
+				if(tempo_dict[tick_time] < 1):
+					raise smf.MidiFileError("A tempo must be at least 1 microsecond per beat")
+			# If this isn't a meta message
+			elif(status != smf.META):
+				# The track has notes
+				has_notes[i] = True
+
+
+	# If there are no tempo messages
+	if(len(tempo_dict) == 0):
+		# Set the tempo to the default of 120bpm
+		tempo_dict[0] = mido.bpm2tempo(120)
+
+	# Create a look up table for converting between ticks and seconds with the song's tempos
+	tempo_map = TempoMap(tempo_dict, input_song.ticks_per_beat)
+
+	# ===================================
+	#    Program/Patch Change Messages
+	# ===================================
+
+	# Report that the patch changes are being extracted
+	report("Extracting patch changes", 0.1)
+	stats.begin("Program/Patch Change")
+
+	# Create a look up table to store the patches of each channel
+	patch_map = PatchMap()
+
+	# Loop through all tracks(all of the patch changes are collected before any notes are given a patch)
+	for track in input_song.tracks:
+
+		# Create a list of channels
+		channel_list = []
+
+		# Loop through all messages
+		for tick_time, status, data1, data2 in track:
+
+			# If this message is a channel message(meta, sysex and system messages don't have a channel)
+			if(status < 0xF0):
+				# If this message's channel isn't in the no_patches dictionary
+				if not status & 0x0F in channel_list:
+					# Add it
+					channel_list.append(status & 0x0F)
+
+				# If this message is a patch change message
+				if(status & 0xF0 == 0xC0):
+					# Add a patch entry for the current channel at the current time
+					patch_map.add_patch(status & 0x0F, tick_time, data1)
+
+		# Loop through all channels
+		for channel in channel_list:
+			# If this channel doesn't have a patch at the beginning, add the default patch at the beginning
+			patch_map.add_channel(channel)
+
+	# Return the tracks with notes and the maps
+	return has_notes, tempo_map, patch_map
+
+# Convert the messages of a track to notes, align them and split them into tracks
+def process_track(track, tempo_map, output_tempo_map, margin, patch_map, record_stats=False, converted=None, keep_converted=False, workers=1):
+	# Create an object to store the stats of splitting the track
+	stats = ParseStats(enabled=record_stats)
+
+	# ===========================
+	#     Convert Note Format
+	# ===========================
+
+	# If the notes of the track were converted by an earlier parse
+	if(converted != None):
+		# Process a copy of them
+		notes = converted.copy()
+	# Otherwise
+	else:
+		# Convert the messages to notes
+		stats.begin("Convert Note Format")
+		notes = convert_track(track, patch_map)
+		# If the converted notes should be kept for later parses, copy them before they are processed
+		if(keep_converted):
+			converted = notes.copy()
+
+	# =====================
+	#    Note Processing
+	# =====================
+
+	# Start timing the processing and count the notes
+	stats.begin("Note Processing")
+	stats.notes_in += len(notes)
+
+	# If there are any notes that have the same end and start time(0 duration), delete them
+	stats.count("zero_length_dropped", len(notes), remove_empty_notes(notes))
+
+	# Remove duplicate notes(keeping the first of each so the notes stay sorted by their start time)
+	stats.count("duplicates_dropped", len(notes), remove_duplicates(notes))
+
+	# Convert the note time to second
+	notes2second(notes, tempo_map)
+
+	# If there are multiple workers, cut the track at the silent gaps into segments for each of them
+	segments = find_segments(notes, margin, workers) if workers > 1 else []
+
+	# If the track was cut into multiple segments
+	if(len(segments) > 1):
+		# The segments are timed inside each worker
+		stats.end()
+		# Align and split the segments in parallel(the results are in the same order as the segments)
+		with ProcessPoolExecutor(min(workers, len(segments))) as executor:
+			segment_results = executor.map(process_segment, (notes.slice(first, last) for first, last in segments), repeat(output_tempo_map), repeat(margin), repeat(stats.enabled))
+			# Put the notes and the new tracks of the segments back together
+			notes, new_tracks = join_segments(segment_results, stats)
+		# Return the notes, the rows of the notes in each new track, the stats and the converted notes if they were kept
+		return notes, new_tracks, stats, converted
+
+	# Align and split the notes
+	new_tracks = split_notes(notes, output_tempo_map, margin, stats)
+
+	# Return the notes, the rows of the notes in each new track, the stats and the converted notes if they were kept
+	return notes, new_tracks, stats, converted
+
+# Align notes whose times are in seconds, convert them back to ticks and split them into tracks
+def split_notes(notes, output_tempo_map, margin, stats):
+	# Align the starts and ends of notes that are within the margin of each other
+	align_notes(notes, margin)
+
+	# Convert the note time back to ticks with the original or normalized tempo
+	notes2tick(notes, output_tempo_map)
+
+	# Only keep notes that do not have the same start and end time(nonzero duration)
+	stats.count("zero_length_dropped", len(notes), remove_empty_notes(notes))
+
+	# If the stats are being recorded
+	if(stats.enabled):
+		# Count the times that were aligned and the notes that are left
+		stats.aligned_endpoints += sum((aligned & 1) + (aligned >> 1) for aligned in notes.aligned)
+		stats.notes_out += len(notes)
+		# Find the most notes that are on at once
+		stats.max_polyphony = max(stats.max_polyphony, max_polyphony(notes))
+
+	# ======================
+	#    Track Splitting
+	# ======================
+
+	# Start timing the splitting
+	stats.begin("Track Splitting")
+
+	# Create a new list for new(split) tracks
+	new_tracks = []
+
+	# Calculate the track index of every note in the current track
+	assign_track_indices(notes)
+
+	# Iterate through all notes in the current track
+	for note, track_index in enumerate(notes.track_indices):
+		# If we need more tracks, add them
+		for j in range(1 + track_index - len(new_tracks)):
+			new_tracks.append(array("q"))
+
+		# Add the row of the note to its track
+		new_tracks[track_index].append(note)
+
+	# Stop timing
+	stats.end()
+
+	# Return the rows of the notes in each new track
+	return new_tracks
+
+# Align and split a segment of a track(in another process)
+def process_segment(notes, output_tempo_map, margin, record_stats=False):
+	# Create an object to store the stats of the segment
+	stats = ParseStats(enabled=record_stats)
+	# Align and split the notes of the segment
+	stats.begin("Note Processing")
+	new_tracks = split_notes(notes, output_tempo_map, margin, stats)
+	# Return the notes, the rows of the notes in each new track and the stats
+	return notes, new_tracks, stats
+
+# Find where a track can be cut into segments that can be aligned and split on their own
+def find_segments(notes, margin, count):
+	# Notes can only be aligned with times within the margin and only overlapping notes affect each other's
+	# track, so a gap where no note is sounding that is wider than twice the margin can't be crossed by
+	# either. The notes are sorted by start time, so each segment is a range of rows. Small segments are
+	# joined until each one has enough notes to be worth sending to another process, which gives about
+	# count segments. Returns a list of (first row, row after the last) of each segment.
+
+	# Get the widest gap notes can be aligned across(a negative margin doesn't align anything)
+	width = 2 * max(margin, 0)
+
+	# If the notes should be processed with NumPy
+	if(notes.vectorized()):
+		# Find the latest end of the notes before each note and the notes that start after a wide enough gap
+		ends = np.maximum.accumulate(np.frombuffer(notes.ends, dtype=np.int64))
+		cuts = (np.flatnonzero(np.frombuffer(notes.starts, dtype=np.int64)[1:] - ends[:-1] > width) + 1).tolist()
+	# Otherwise
+	else:
+		# Find the latest end of the notes before each note and the notes that start after a wide enough gap
+		ends = list(accumulate(notes.ends, max))
+		cuts = [j for j in range(1, len(notes)) if notes.starts[j] - ends[j - 1] > width]
+
+	# Get the fewest notes in a segment
+	size = max(c.SEGMENT_MIN_NOTES, len(notes) // count)
+
+	# Create a list to store the segments
+	segments = []
+	# Create a variable to store the first row of the current segment
+	first = 0
+	# Loop through the rows the track can be cut at
+	for j in cuts:
+		# If the current segment has enough notes, cut it here
+		if(j - first >= size):
+			segments.append((first, j))
+			first = j
+	# Add the last segment
+	segments.append((first, len(notes)))
+
+	# Return the segments
+	return segments
+
+# Put the notes and new tracks of segments that were split on their own back together in order
+def join_segments(segment_results, stats):
+	# Create a table for all of the notes and a list for the new tracks
+	notes = NoteTable()
+	new_tracks = []
+	# Loop through the results of the segments
+	for segment_notes, segment_tracks, segment_stats in segment_results:
+		# Add the stats of the segment
+		stats.merge(segment_stats)
+		# Get the row the notes of the segment start at
+		offset = len(notes)
+		# Add the notes of the segment
+		notes.extend(segment_notes)
+		# Loop through the new tracks of the segment
+		for j, rows in enumerate(segment_tracks):
+			# If we need another track, add it
+			if(j == len(new_tracks)):
+				new_tracks.append(array("q"))
+			# Add the rows of the notes to the track
+			new_tracks[j].extend(row + offset for row in rows)
+	# Return the notes and the new tracks
+	return notes, new_tracks
+
+# Convert the messages of a track to a table of notes
+def convert_track(track, patch_map):
+	# Create a variable to store the state of the sustain controller
+	sustain = False
+	# Create a variable to store the state of the sustain controller last loop
+	sustain_last = False
+	# Create a variable to store the state of the sostenuto controller
+	sostenuto = False
+	# Create a variable to store the state of the sostenuto controller last loop
+	sostenuto_last = False
+	# Create a set to store the (channel, pitch) of all notes being sustained by the sostenuto controller
+	sostenuto_notes = set()
+	# Create a dictionary to store the rows of the notes that don't have an end time yet by their (channel, pitch)
+	active_notes = {}
+	# Create a variable to turn all notes off 
+	off = False
+	# Create a time variable for storing absolute time and set it to 0
+	tick_time = 0
+	# Create a table to store the notes of the track
+	notes = NoteTable()
+
+	# Loop through all messages in the track
+	for last, (tick_time, status, data1, data2) in mark_last(track):
+
+		# If this is the last message
+		if(last):
+			# Turn all notes off
+			off = True
+
+		# Split the status into the type of message and its channel
+		kind = status & 0xF0
+		channel = status & 0x0F
+
+		# If this is a note on message
+		if(kind == 0x90):
+			# If the note has a nonzero velocity
+			if(data2 != 0):
+				# Add a new note to the track that doesn't end yet
+				note = notes.append(tick_time, -1, data1, data2, channel, patch_map.get(channel, tick_time)[0])
+				# Add it to the notes that haven't ended
+				active_notes.setdefault((channel, data1), []).append(note)
+			# If the note has a zero velocity and it isn't being sustained by sostenuto
+			elif(not (channel, data1) in sostenuto_notes):
+				# Set the current time as the end time of the notes with this pitch
+				end_notes(notes, active_notes.pop((channel, data1), []), tick_time)
+		# If this is a note off message and sustain is not active
+		if(kind == 0x80 and not sustain):
+			# If this note isn't being sustained by sostenuto
+			if(not (channel, data1) in sostenuto_notes):
+				# Set the current time as the end time of the notes with this pitch
+				end_notes(notes, active_notes.pop((channel, data1), []), tick_time)
+		# If this message is a controller change
+		if(kind == 0xB0):
+			# If it is a sustain message
+			if(data1 == 64):
+				# Set it on/off
+				sustain = not data2 < 64
+			# If it is a sostenuto message 
+			if(data1 == 66):
+				# Set it on/off
+				sostenuto = not data2 < 64
+			# If this is a controller message to turn all notes off
+			if(data1 == 120):
+				# Turn on the flag
+				off = True
+			# If this is a reset controllers message
+			if(data1 == 121):
+				# Turn off sustain and sostenuto
+				sustain = False
+				sostenuto = False
+
+		# If sostenuto just turned on
+		if(sostenuto and not sostenuto_last):
+			# Hold down the notes that are being pressed(instead of the notes it was holding down)
+			sostenuto_notes = set(active_notes)
+
+		# If sustain has changed to off
+		if(sustain_last and not sustain):
+			# Loop through the notes that are on
+			for key in list(active_notes):
+				# If they aren't being sustained by sostenuto
+				if(not key in sostenuto_notes):
+					# Set their end time to now
+					end_notes(notes, active_notes.pop(key), tick_time)
+
+		# If sostenuto has been released
+		if(sostenuto_last and not sostenuto):
+			# Loop through all notes being sustained by sostenuto
+			for key in sostenuto_notes:
+				# Set their end time to now
+				end_notes(notes, active_notes.pop(key, []), tick_time)
+			# Stop holding them down
+			sostenuto_notes.clear()
+
+		# If there is an all notes off message
+		if(off):
+			# Loop through all notes that are on
+			for rows in active_notes.values():
+				# Set their end time to now
+				end_notes(notes, rows, tick_time)
+			# Clear all active notes
+			active_notes.clear()
+			# Clear all sostenuto notes
+			sostenuto_notes.clear()
+			# Turn off sostenuto
+			sostenuto = False
+			sostenuto_last = False
+			# Turn the all notes off flag off
+			off = False
+
+		# Set the current value of sustain to the last variable for the next loop
+		sustain_last = sustain
+		# Set the current value of sostenuto to the last variable for the next loop
+		sostenuto_last = sostenuto
+
+	# Notes that are still on at the end of the track end with it
+	for rows in active_notes.values():
+		end_notes(notes, rows, tick_time)
+
+	# Return the notes
+	return notes
+
+# Get a copy of a track with a set_tempo event for each (absolute time, tempo) of a sorted list merged into it
+def merge_tempos(track, tempos):
+	# Create the merged track
+	merged = smf.EventTrack()
+	# Create variables to store the absolute time of the current event and of the last event added
+	tick_time = 0
+	last_time = 0
+	# Create a variable to store the index of the next tempo to add
+	tempo_index = 0
+	# Loop through the events of the track
+	for k in range(len(track)):
+		tick_time += track.deltas[k]
+		# Add the tempos up to the time of this event(tempos at the same time as the first event go after it)
+		while tempo_index < len(tempos) and (tempos[tempo_index][0] < tick_time or (k > 0 and tempos[tempo_index][0] == tick_time)):
+			merged.append(tempos[tempo_index][0] - last_time, smf.META, smf.SET_TEMPO, payload=tempos[tempo_index][1].to_bytes(3, "big"))
+			last_time = tempos[tempo_index][0]
+			tempo_index += 1
+		# Add the event with the time since the last event added
+		merged.append(tick_time - last_time, track.statuses[k], track.data1[k], track.data2[k], track.payloads[k])
+		last_time = tick_time
+	# Add the tempos after the end of the track
+	for time, tempo in tempos[tempo_index:]:
+		merged.append(time - last_time, smf.META, smf.SET_TEMPO, payload=tempo.to_bytes(3, "big"))
+		last_time = time
+	# Return the merged track
+	return merged
+
+# Get the most memory the process has used in bytes, or None if it can't be measured
+def get_peak_memory():
+	# If resource isn't available, it can't be measured
+	if(resource == None):
+		return None
+	# Get the peak resident set size(macOS measures it in bytes and other systems in kilobytes)
+	peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	return peak if sys.platform == "darwin" else peak * 1024
+
+# Get the identity of a file(its path, size and modification time), which changes if the file is changed
+def file_identity(filepath):
+	status = os.stat(filepath)
+	return (os.path.abspath(filepath), status.st_size, status.st_mtime_ns)
+
+# Iterate over something, yielding (whether this is the last item, item)
+def mark_last(iterable):
+	# Get the first item
+	iterator = iter(iterable)
+	try:
+		item = next(iterator)
+	except StopIteration:
+		return
+	# Yield each item once the one after it is known
+	for next_item in iterator:
+		yield False, item
+		item = next_item
+	# Yield the last item
+	yield True, item
+
+# Set the end time of some rows of a note table
+def end_notes(notes, rows, time):
+	# Loop through the rows
+	for j in rows:
+		# Set its end time
+		notes.ends[j] = time
+
+# The time taken by each stage of parse and counts of what it did
+class ParseStats:
+	"""Wall and CPU time of each stage of parse and counts of the notes and tracks it processed
+
+	Pass one to parse to record its stats. stages maps each stage name to [wall seconds, CPU seconds] in the
+	order they run. The stages that split tracks are added up over every track(or every segment of a single
+	track), so with multiple workers they can add up to more than wall_time, the wall time of the whole
+	parse(including loading the file).
+	peak_memory is the most memory the process had used in bytes when the parse finished(None if it can't be
+	measured). A disabled object ignores everything so parse can always call it.
+	"""
+	# The stages of parse in the order they run
+	STAGES = ("Extract Tempo", "Program/Patch Change", "Convert Note Format", "Note Processing", "Track Splitting", "Track Output", "Song Processing", "Song Output")
+
+	def __init__(self, enabled=True):
+		# Store if the stats are being recorded
+		self.enabled = enabled
+		# Create a dictionary to store the [wall time, CPU time] of each stage
+		self.stages = {stage: [0, 0] for stage in self.STAGES}
+		# Create variables to store the stage being timed and the [wall time, CPU time] it started at
+		self.stage = None
+		self.stage_start = None
+		# Create variables to store the total wall time and CPU time
+		self.wall_time = 0
+		self.cpu_time = 0
+		self.start_time = None
+		# Create the counters
+		self.notes_in = 0
+		self.notes_out = 0
+		self.duplicates_dropped = 0
+		self.zero_length_dropped = 0
+		self.aligned_endpoints = 0
+		self.max_polyphony = 0
+		self.output_tracks = 0
+		# Create a variable to store if the output was copied from a cache
+		self.cached = False
+		# Create a variable to store the peak memory of the process
+		self.peak_memory = None
+
+	# Start timing the whole parse
+	def start(self):
+		# If the stats are being recorded
+		if(self.enabled):
+			self.start_time = (time.perf_counter(), time.process_time())
+
+	# Stop timing the whole parse and the current stage
+	def stop(self):
+		# If the stats are being recorded and the parse is being timed
+		if(self.enabled and self.start_time != None):
+			self.end()
+			self.wall_time += time.perf_counter() - self.start_time[0]
+			self.cpu_time += time.process_time() - self.start_time[1]
+			self.start_time = None
+			self.peak_memory = get_peak_memory()
+
+	# Start timing a stage(ending the current one)
+	def begin(self, stage):
+		# If the stats are being recorded
+		if(self.enabled):
+			self.end()
+			self.stage = stage
+			self.stage_start = (time.perf_counter(), time.process_time())
+
+	# Stop timing the current stage
+	def end(self):
+		# If a stage is being timed
+		if(self.stage != None):
+			# Add the time since it started to its total
+			times = self.stages.setdefault(self.stage, [0, 0])
+			times[0] += time.perf_counter() - self.stage_start[0]
+			times[1] += time.process_time() - self.stage_start[1]
+			self.stage = None
+
+	# Add the number of items that were dropped by a step to a counter
+	def count(self, counter, before, after):
+		# If the stats are being recorded
+		if(self.enabled):
+			setattr(self, counter, getattr(self, counter) + before - after)
+
+	# Add the stats of part of a parse(like a track that was split in another process) to these
+	def merge(self, other):
+		# If the stats are being recorded
+		if(self.enabled):
+			# Add the stage times
+			for stage, times in other.stages.items():
+				total = self.stages.setdefault(stage, [0, 0])
+				total[0] += times[0]
+				total[1] += times[1]
+			# Add the counters
+			for counter in ("notes_in", "notes_out", "duplicates_dropped", "zero_length_dropped", "aligned_endpoints", "output_tracks"):
+				setattr(self, counter, getattr(self, counter) + getattr(other, counter))
+			self.max_polyphony = max(self.max_polyphony, other.max_polyphony)
+
+	# Get the stats as a dictionary(for saving as JSON)
+	def as_dict(self):
+		return {
+			"wall_time": self.wall_time,
+			"cpu_time": self.cpu_time,
+			"stages": {stage: {"wall_time": times[0], "cpu_time": times[1]} for stage, times in self.stages.items()},
+			"notes_in": self.notes_in,
+			"notes_out": self.notes_out,
+			"duplicates_dropped": self.duplicates_dropped,
+			"zero_length_dropped": self.zero_length_dropped,
+			"aligned_endpoints": self.aligned_endpoints,
+			"max_polyphony": self.max_polyphony,
+			"output_tracks": self.output_tracks,
+			"cached": self.cached,
+			"peak_memory": self.peak_memory,
+		}
+
+	# Get the stats as readable lines of text
+	def summary(self):
+		# Add a line with the wall and CPU time of each stage
+		lines = ["%-22s %9s %9s" % ("Stage", "Wall(s)", "CPU(s)")]
+		for stage, times in self.stages.items():
+			lines.append("%-22s %9.3f %9.3f" % (stage, times[0], times[1]))
+		lines.append("%-22s %9.3f %9.3f" % ("Total", self.wall_time, self.cpu_time))
+		# Add a line with the counters
+		lines.append("Notes in: %d, notes out: %d, duplicates dropped: %d, zero length dropped: %d" % (self.notes_in, self.notes_out, self.duplicates_dropped, self.zero_length_dropped))
+		lines.append("Aligned endpoints: %d, max polyphony: %d, output tracks: %d" % (self.aligned_endpoints, self.max_polyphony, self.output_tracks))
+		# If the peak memory was measured, add it
+		if(self.peak_memory != None):
+			lines.append("Peak memory: %.1f MB" % (self.peak_memory / 1000000))
+		# If nothing was processed because the output was in the cache, say so
+		if(self.cached):
+			lines.append("Copied from the cache")
+		# Return the lines
+		return "\n".join(lines)
+
+# What converting a MIDI file would give, found without converting it
+class SongAnalysis:
+	"""The tracks a MIDI file would be split into, found by analyze_path or analyze_bytes
+
+	tracks has a dictionary for every track of the input file with its name, the notes left after processing,
+	the number of tracks it would be split into(a track without notes is copied as one track) and the most
+	notes it has on at once. With create_channels every output track gets the next channel, but there are only
+	16, so channel_overflow is the number of output tracks that would share the last channel with another.
+	"""
+
+	def __init__(self):
+		# Create a list to store the results of each track
+		self.tracks = []
+		# Create the totals
+		self.notes = 0
+		self.max_polyphony = 0
+		self.output_tracks = 0
+		self.channel_overflow = 0
+
+	# Add the results of a track of the input file
+	def add_track(self, name, notes, split_tracks, polyphony):
+		self.tracks.append({"name": name, "notes": notes, "split_tracks": split_tracks, "max_polyphony": polyphony})
+		self.notes += notes
+		self.max_polyphony = max(self.max_polyphony, polyphony)
+		self.output_tracks += split_tracks
+
+	# Get the analysis as a dictionary(for saving as JSON)
+	def as_dict(self):
+		return {
+			"tracks": self.tracks,
+			"notes": self.notes,
+			"max_polyphony": self.max_polyphony,
+			"output_tracks": self.output_tracks,
+			"channel_overflow": self.channel_overflow,
+		}
+
+	# Get the analysis as readable lines of text(listing at most max_tracks tracks)
+	def summary(self, max_tracks=None):
+		# Add a line for each track
+		lines = []
+		for track in self.tracks[:max_tracks]:
+			lines.append("%s: %d notes, %d tracks, max polyphony %d" % (track["name"] or "(unnamed)", track["notes"], track["split_tracks"], track["max_polyphony"]))
+		# If some tracks weren't listed, say how many
+		if(len(self.tracks) > len(lines)):
+			lines.append("... and %d more tracks" % (len(self.tracks) - len(lines)))
+		# Add a line with the totals
+		lines.append("Notes: %d, max polyphony: %d, output tracks: %d" % (self.notes, self.max_polyphony, self.output_tracks))
+		# If some tracks would share the last channel, warn about it
+		if(self.channel_overflow > 0):
+			lines.append("%d output tracks would share the last channel" % self.channel_overflow)
+		# Return the lines
+		return "\n".join(lines)
+
+# The results of the stages of parse, kept so converting the same file again can skip them
+class StageMemo:
+	"""The results of the stages of parse that only depend on the input file and some of the options
+
+	Pass the same object to each parse to reuse the results. Each result is stored under its stage with the
+	options it was computed with, and only the latest result of each stage for the latest input file is kept.
+	The input file is identified by its path, size and modification time, so a changed file is read again.
+	hits and misses count the lookups. A disabled object doesn't keep anything so parse can always call it.
+	"""
+	def __init__(self, enabled=True):
+		# Store if the results are being kept
+		self.enabled = enabled
+		# Create variables to store the identity of the input file and the (options, result) of each stage
+		self.identity = None
+		self.results = {}
+		# Create the counters
+		self.hits = 0
+		self.misses = 0
+
+	# Get the result of a stage computed with some options, or None if it isn't kept
+	def lookup(self, identity, stage, options):
+		# If the results are being kept
+		if(self.enabled):
+			# If this is a different input file, forget the results of the last one
+			if(identity != self.identity):
+				self.identity = identity
+				self.results.clear()
+			# If the stage was computed with the same options
+			if(stage in self.results and self.results[stage][0] == options):
+				# Return the result
+				self.hits += 1
+				return self.results[stage][1]
+			# Count the miss
+			self.misses += 1
+		return None
+
+	# Keep the result of a stage computed with some options
+	def store(self, identity, stage, options, result):
+		# If the results are being kept and they are still for this input file
+		if(self.enabled and identity == self.identity):
+			self.results[stage] = (options, result)
+
+	# Get the result of a stage computed with some options, computing and keeping it if it isn't kept
+	def get(self, identity, stage, options, compute):
+		# Look up the result
+		result = self.lookup(identity, stage, options)
+		# If it isn't kept
+		if(result == None):
+			# Compute and keep it
+			result = compute()
+			self.store(identity, stage, options, result)
+		# Return the result
+		return result
+
+	# Forget every result
+	def clear(self):
+		self.identity = None
+		self.results.clear()
+
+# A compact list of notes that stores each field in its own array
+class NoteTable:
+	"""Notes stored as one typed array per field instead of one list per note
+
+	The fields are those of the [TIME ON, TIME OFF, NOTE, VELOCITY, ALIGNED, TRACK INDEX, CHANNEL, PATCH] note
+	format. Times are 64 bit so that they can also hold times in seconds from a TempoMap. An end time of -1
+	means the note hasn't ended yet and a track index of -1 means it hasn't been given one.
+	"""
+	__slots__ = ("starts", "ends", "pitches", "velocities", "aligned", "track_indices", "channels", "patches")
+
+	def __init__(self):
+		# Create an array for each field
+		self.starts = array("q")
+		self.ends = array("q")
+		self.pitches = array("B")
+		self.velocities = array("B")
+		self.aligned = array("B")
+		self.track_indices = array("i")
+		self.channels = array("B")
+		self.patches = array("B")
+
+	def __len__(self):
+		return len(self.starts)
+
+	# Add a note to the end of the table and return its row
+	def append(self, start, end, pitch, velocity, channel, patch):
+		self.starts.append(start)
+		self.ends.append(end)
+		self.pitches.append(pitch)
+		self.velocities.append(velocity)
+		self.aligned.append(0)
+		self.track_indices.append(-1)
+		self.channels.append(channel)
+		self.patches.append(patch)
+		return len(self.starts) - 1
+
+	# Keep only some rows of the table, in the given order
+	def keep(self, rows):
+		# Loop through the fields
+		for field in self.__slots__:
+			# Get the array
+			column = getattr(self, field)
+			# If the rows are a NumPy array
+			if(np != None and isinstance(rows, np.ndarray)):
+				# Select the rows with NumPy and copy them into a new array
+				kept = array(column.typecode)
+				kept.frombytes(np.frombuffer(column, dtype=column.typecode)[rows].tobytes())
+			# Otherwise
+			else:
+				# Create an array of the rows
+				kept = array(column.typecode, map(column.__getitem__, rows))
+			# Replace the array
+			setattr(self, field, kept)
+
+	# Get a new table with the rows from first up to(but not including) last
+	def slice(self, first, last):
+		# Create the table
+		table = NoteTable()
+		# Copy the rows of every field
+		for field in self.__slots__:
+			setattr(table, field, getattr(self, field)[first:last])
+		# Return the new table
+		return table
+
+	# Add the rows of another table to the end of this one
+	def extend(self, other):
+		# Add the rows of every field
+		for field in self.__slots__:
+			getattr(self, field).extend(getattr(other, field))
+
+	# Get a copy of the table
+	def copy(self):
+		# Create the table
+		table = NoteTable()
+		# Copy every field
+		for field in self.__slots__:
+			column = getattr(self, field)
+			setattr(table, field, array(column.typecode, column))
+		# Return the copy
+		return table
+
+	# Check if the table should be processed with NumPy
+	def vectorized(self):
+		# Only use NumPy if it is installed and there are enough notes for it to be faster
+		return np != None and len(self) >= c.VECTORIZE_MIN_NOTES
+
+	# Get a row of the table in the [TIME ON, TIME OFF, NOTE, VELOCITY, ALIGNED, TRACK INDEX, CHANNEL, PATCH] format
+	def note(self, j):
+		return [self.starts[j], self.ends[j] if self.ends[j] >= 0 else None, self.pitches[j], self.velocities[j], self.aligned[j], self.track_indices[j] if self.track_indices[j] >= 0 else None, self.channels[j], self.patches[j]]
+
+# Align the starts and ends of notes that are within the margin of each other to their mean time
+def align_notes(notes, margin):
+	# Every note end that hasn't been aligned yet(in order of end time) pulls all unaligned starts and ends
+	# within the margin to their mean. Times are only changed when they are aligned, so the unaligned times
+	# can be kept in sorted lists and found with bisect. Aligned entries are skipped with a table of links
+	# to the next unaligned entry, so each one is only passed over once. The notes are expected to be sorted
+	# by their start time and are still sorted by their start time afterwards. The margin is in the same
+	# units as the note times.
+
+	# Get the positions of the notes sorted by their start time(which they already are) and by their end time
+	start_order = range(len(notes))
+	end_order = sorted(start_order, key=notes.ends.__getitem__)
+	# Create sorted lists of the start and end times
+	start_times = notes.starts
+	end_times = array("q", map(notes.ends.__getitem__, end_order))
+	# Get the times by start/end so they can be looked up with the index stored in the overlaps
+	note_times = (notes.starts, notes.ends)
+
+	# Create tables linking each entry to the next unaligned entry(the extra entry marks the end of the list)
+	next_start = [j if not bool(notes.aligned[start_order[j]] & 0b10) else j + 1 for j in range(len(notes))] + [len(notes)]
+	next_end = [j if not bool(notes.aligned[end_order[j]] & 0b01) else j + 1 for j in range(len(notes))] + [len(notes)]
+
+	# Create a variable to store if any times were changed
+	aligned = False
+
+	# Loop through notes in order of their end time
+	for position in end_order:
+		# If the note's end has already been aligned
+		if(bool(notes.aligned[position] & 0b01)):
+			# Skip the rest of the loop
+			continue
+		# Find the minimum time the note must begin/end at
+		min_time = notes.ends[position] - margin
+		# Find the maximum time the note must begin/end at
+		max_time = notes.ends[position] + margin
+		# Create a list to store the (position, start/end, sorted index) of every time within the margin
+		overlaps = []
+		# Loop through the unaligned starts within the margin
+		j = find_next(next_start, bisect_left(start_times, min_time))
+		while j < len(notes) and start_times[j] <= max_time:
+			overlaps.append((start_order[j], 0, j))
+			j = find_next(next_start, j + 1)
+		# Loop through the unaligned ends within the margin
+		j = find_next(next_end, bisect_left(end_times, min_time))
+		while j < len(notes) and end_times[j] <= max_time:
+			overlaps.append((end_order[j], 1, j))
+			j = find_next(next_end, j + 1)
+		# If is no other note
+		if(len(overlaps) < 2):
+			# Skip the rest of the loop
+			continue
+		# Create a variable to store the mean time of all overlapping notes
+		mean_time = 0
+		# Add up the times
+		for position, end, j in overlaps:
+			mean_time += note_times[end][position]
+		# Average the mean time(rounding down gives the same ticks as the exact mean when it is converted back)
+		mean_time //= len(overlaps)
+		# Remember that times were changed
+		aligned = True
+		# Loop through the times
+		for position, end, j in overlaps:
+			# Set the note's time to the mean
+			note_times[end][position] = mean_time
+			# If this is an end time
+			if(end):
+				# Turn the bit that signifies the end has been aligned on
+				notes.aligned[position] |= 0b01
+				# Skip it from now on
+				next_end[j] = j + 1
+			# If this is a start time
+			else:
+				# Turn the bit that signifies the start has been aligned on
+				notes.aligned[position] |= 0b10
+				# Skip it from now on
+				next_start[j] = j + 1
+
+	# If any times were changed
+	if(aligned):
+		# Aligning can move starts past each other, so sort the notes by their start time again
+		notes.keep(sorted(start_order, key=notes.starts.__getitem__))
+
+# Find the next entry in a table of links that links to itself
+def find_next(links, j):
+	# Follow the links until an entry links to itself
+	root = j
+	while links[root] != root:
+		root = links[root]
+	# Point every entry on the way directly at the result so the next search is shorter
+	while links[j] != root:
+		links[j], j = root, links[j]
+	# Return the entry
+	return root
+
+# Remove duplicate notes from a table, keeping the order of the first of each
+def remove_duplicates(notes):
+	# Duplicates start at the same time and the notes are sorted by start time, so only the notes with the
+	# same start as the current note need to be remembered. The other fields are packed into one number
+	# instead of building a tuple for every note.
+
+	# If the notes should be processed with NumPy
+	if(notes.vectorized()):
+		# Get the fields as NumPy arrays, packing the small fields into one number
+		starts = np.frombuffer(notes.starts, dtype=np.int64)
+		ends = np.frombuffer(notes.ends, dtype=np.int64)
+		fields = np.frombuffer(notes.pitches, dtype=np.uint8).astype(np.int64)
+		for column, size in ((notes.velocities, 128), (notes.aligned, 4), (notes.channels, 16), (notes.patches, 128)):
+			fields = fields * size + np.frombuffer(column, dtype=np.uint8)
+		# Find the first row of every unique note
+		rows = np.unique(np.stack((starts, ends, fields), axis=1), axis=0, return_index=True)[1]
+		# If any notes were duplicates
+		if(len(rows) != len(notes)):
+			# Only keep the first of each in their original order
+			rows.sort()
+			notes.keep(rows)
+		# Return the number of notes left
+		return len(notes)
+
+	# Create a set to store the notes with the current start time that have been seen
+	seen = set()
+	# Create a variable to store the current start time
+	start_time = None
+	# Create a list for the rows to keep
+	rows = []
+	# Loop through the notes
+	for j in range(len(notes)):
+		# If the note starts at a new time
+		if(notes.starts[j] != start_time):
+			# Forget the notes of the last start time
+			seen.clear()
+			start_time = notes.starts[j]
+		# Pack the rest of the note into a number(the end comes first since it is the only unbounded field)
+		key = ((((notes.ends[j] * 128 + notes.pitches[j]) * 128 + notes.velocities[j]) * 4 + notes.aligned[j]) * 16 + notes.channels[j]) * 128 + notes.patches[j]
+		# If the note has been seen before
+		if(key in seen):
+			# Skip it
+			continue
+		# Remember the note and keep it
+		seen.add(key)
+		rows.append(j)
+	# If any notes were duplicates
+	if(len(rows) != len(notes)):
+		# Only keep the rows of the first of each
+		notes.keep(rows)
+	# Return the number of notes left
+	return len(notes)
+
+# Remove notes that start and end at the same time(0 duration) from a table
+def remove_empty_notes(notes):
+	# If the notes should be processed with NumPy
+	if(notes.vectorized()):
+		# Compare all of the start and end times at once
+		rows = np.flatnonzero(np.frombuffer(notes.starts, dtype=np.int64) != np.frombuffer(notes.ends, dtype=np.int64))
+	# Otherwise
+	else:
+		# Find the rows of the notes with a nonzero duration
+		rows = [j for j in range(len(notes)) if notes.starts[j] != notes.ends[j]]
+	# If any notes have 0 duration
+	if(len(rows) != len(notes)):
+		# Only keep the other rows
+		notes.keep(rows)
+	# Return the number of notes left
+	return len(notes)
+
+# Find the most notes in a table that are on at the same time
+def max_polyphony(notes):
+	# Get the sorted start and end times
+	starts = sorted(notes.starts)
+	ends = sorted(notes.ends)
+	# Create variables to store the number of notes that are on and the most that were on
+	count = 0
+	most = 0
+	# Create a variable to store the index of the next end
+	j = 0
+	# Loop through the starts
+	for start in starts:
+		# End the notes that end at or before this start(notes are on from their start until before their end)
+		while ends[j] <= start:
+			count -= 1
+			j += 1
+		# Start the note
+		count += 1
+		most = max(most, count)
+	# Return the most notes that were on
+	return most
 
 # Check if two notes overlap
 def check_overlap(start, end, note):
@@ -787,6 +1660,95 @@ def get_track_index(note, notes):
 	# Return it
 	return track_index
 
+# Calculate the track index of every note in a table without recursion
+def assign_track_indices(notes):
+	# This gives the same result as calling get_track_index on every note: notes are visited from the highest
+	# pitch(and for equal pitches the latest start) down, and each one takes the lowest index that isn't used
+	# by a note it overlaps that was visited before it. Instead of filtering the whole list for every note,
+	# the indices in use are kept as bits in a segment tree over the start/end times of the notes.
+
+	# If there are no notes there is nothing to do
+	if(len(notes) == 0):
+		return
+
+	# Collect every time a note starts or ends, these split the song into segments
+	times = sorted(set(notes.starts).union(notes.ends))
+	# Create a look up table for the segment each time starts
+	segment_indices = {time: j for j, time in enumerate(times)}
+
+	# Find the number of leaves in the tree(the smallest power of two that fits every segment)
+	size = 1
+	while size < len(times):
+		size *= 2
+
+	# Create a list to store the indices used by notes covering all segments below each node
+	covered = [0] * (2 * size)
+	# Create a list to store the indices used by notes covering any segment below each node
+	used = [0] * (2 * size)
+
+	# Order the notes from highest to lowest priority, notes that are identical in pitch and start
+	# are ordered by their position so that they are never put on the same track
+	order = sorted(range(len(notes)), key=lambda j: (notes.pitches[j], notes.starts[j], j), reverse=True)
+
+	# Loop through the notes
+	for j in order:
+		# Find the first segment the note covers
+		first = segment_indices[notes.starts[j]] + size
+		# Find the segment after the last segment the note covers
+		last = segment_indices[notes.ends[j]] + size
+
+		# If the note has a stored index
+		if(notes.track_indices[j] >= 0):
+			# Use it
+			track_index = notes.track_indices[j]
+		# Otherwise find the lowest index not used by a note above it
+		else:
+			# Create a variable to store the indices used in the segments the note covers
+			track_indices = 0
+			# Walk up the tree from both ends of the note
+			low, high = first, last
+			while low < high:
+				# If the left node is a right child, it is completely covered by the note
+				if(low & 1):
+					track_indices |= used[low]
+					low += 1
+				# If the right node is a right child, its left sibling is completely covered by the note
+				if(high & 1):
+					high -= 1
+					track_indices |= used[high]
+				low //= 2
+				high //= 2
+			# Notes covering a parent of the outermost segments also cover part of this note
+			for node in ((first // 2, (last - 1) // 2) if first < last else ()):
+				while node > 0:
+					track_indices |= covered[node]
+					node //= 2
+			# Find the lowest bit that isn't set
+			track_index = (~track_indices & (track_indices + 1)).bit_length() - 1
+			# Store the index in the note
+			notes.track_indices[j] = track_index
+
+		# Get the bit that represents this index
+		bit = 1 << track_index
+		# Mark the index as used in every segment the note covers
+		low, high = first, last
+		while low < high:
+			if(low & 1):
+				covered[low] |= bit
+				used[low] |= bit
+				low += 1
+			if(high & 1):
+				high -= 1
+				covered[high] |= bit
+				used[high] |= bit
+			low //= 2
+			high //= 2
+		# Mark the index as used in the parents of the outermost segments
+		for node in ((first // 2, (last - 1) // 2) if first < last else ()):
+			while node > 0:
+				used[node] |= bit
+				node //= 2
+
 # Find the tempo at a specific time with dictionary of tempos
 def get_tempo(d, time, ticks_per_beat=0, seconds=False):
 	# Create a list to store the tempos at different times
@@ -819,7 +1781,7 @@ def get_tempo(d, time, ticks_per_beat=0, seconds=False):
 		# If ticks_per_beat was not specified
 		if(ticks_per_beat < 1):
 			# Throw an error
-			raise Exception("Error: ticks_per_beat cannot be less than 1")
+			raise InputError("ticks_per_beat cannot be less than 1")
 		# Create a new list to store the converted tick times
 		tempo_times = []
 		# Create a variable to store time in
@@ -852,286 +1814,274 @@ def get_tempo(d, time, ticks_per_beat=0, seconds=False):
 	# If we've passed all of them, return the last one
 	return tempos[len(tempos) - 1][1]
 
-def get_patch(patch_dict, channel, time):
-	# Set the default patch to time 0 and patch 0
-	last_patch = (0, 0)
-
-	# If there are no patch messages
-	if len(patch_dict) == 0:
-		# Set it to the default patch of 0
-		return last_patch[1]
-
-	# Loop through all patches for this note's channel
-	for patch_time in patch_dict[channel]:
-		# If the patch starts before the note
-		if(patch_time < time):
-			# Set last_patch equal to (time, patch #)
-			last_patch = (patch_time, patch_dict[channel][patch_time])
-			# Skip this loop iteration
-			continue
-		# If the note is before the past, but after the last
-		if(time < patch_time and last_patch[0] < time):
-			# Return the last patch
-			return last_patch[1]
-	# If the note was after all patches, set it to the last patch
-	return last_patch[1]
-
-
-def get_patch_time(patch_dict, channel, time):
-	# Set the default patch to time 0 and patch 0
-	last_patch = (0, 0)
-
-	# If there are no patch messages
-	if len(patch_dict) == 0:
-		# Return the default time of 0
-		return last_patch[0]
-
-	# Loop through all patches for this note's channel
-	for patch_time in patch_dict[channel]:
-		# If the patch starts before the note
-		if(patch_time < time):
-			# Set last_patch equal to (time, patch #)
-			last_patch = (patch_time, patch_dict[channel][patch_time])
-			# Skip this loop iteration
-			continue
-		# If the note is before the past, but after the last
-		if(time < patch_time and last_patch[0] < time):
-			# Return the last patch time
-			return last_patch[0]
-	# If the note was after all patches, return the last patch time
-	return last_patch[0]
-
+# Find the patch of a channel at a time
+def get_patch(patch_map, channel, time):
+	return patch_map.get(channel, time)[0]
+
+# Find the time the patch of a channel at a time started
+def get_patch_time(patch_map, channel, time):
+	return patch_map.get(channel, time)[1]
+
+# A look up table for the patch of each channel at any time
+class PatchMap:
+	"""The patch changes of each channel sorted by time"""
+	def __init__(self):
+		# Create dictionaries to store the sorted times and patches of each channel
+		self.times = {}
+		self.patches = {}
+
+	# Add a patch change to a channel
+	def add_patch(self, channel, time, patch):
+		# If this channel doesn't have an entry
+		if not channel in self.times:
+			# Make an entry
+			self.times[channel] = []
+			self.patches[channel] = []
+		# Find where the time goes in the sorted list
+		j = bisect_left(self.times[channel], time)
+		# If there already is a patch change at this time
+		if(j < len(self.times[channel]) and self.times[channel][j] == time):
+			# Replace it
+			self.patches[channel][j] = patch
+		# Otherwise
+		else:
+			# Insert it
+			self.times[channel].insert(j, time)
+			self.patches[channel].insert(j, patch)
+
+	# Add the default patch to the beginning of a channel if it doesn't have a patch there
+	def add_channel(self, channel):
+		# If this channel doesn't have a patch at the beginning
+		if not channel in self.times or self.times[channel][0] != 0:
+			# Add the default patch at the beginning
+			self.add_patch(channel, 0, 0)
+
+	# Find the patch of a channel at a time and the time it started as (patch, time)
+	def get(self, channel, time):
+		# If this channel doesn't have any patches
+		if not channel in self.times:
+			# Return the default patch
+			return (0, 0)
+		# Find the last patch that starts before the time
+		j = bisect_left(self.times[channel], time) - 1
+		# If there isn't one
+		if(j < 0):
+			# Return the default patch
+			return (0, 0)
+		# Return it
+		return (self.patches[channel][j], self.times[channel][j])
 
 # Create a more aptly named method that converts the note time from ticks to seconds
-def notes2second(input_notes, tempo_dict, ticks_per_beat):
-	return convert_note_time(input_notes, tempo_dict, ticks_per_beat, True)
+def notes2second(notes, tempo_map):
+	return convert_note_time(notes, tempo_map, True)
 
 # Create a more aptly named method that converts the note time from seconds to ticks
-def notes2tick(input_notes, tempo_dict, ticks_per_beat):
-	return convert_note_time(input_notes, tempo_dict, ticks_per_beat, False)
-
-# Create a method to convert the note time from seconds to ticks or vice versa
-def convert_note_time(input_notes, tempo_dict, ticks_per_beat, to_second):
-	
-	# Create a copy of the notes list
-	notes = copy.deepcopy(input_notes)
-
-	# Round up
-	getcontext().rounding = ROUND_UP
-
-	# Use 12 significant digits
-	getcontext().prec = 12
-
-	# Store a list of times that the tempo changes
-	tempo_changes = [[time, -1] for time in tempo_dict.keys()]
-
-	# Add the tempo change times to the notes list so we know when to change the tempo
-	for time in tempo_changes:
-		notes.append(time)
-
-	# Create a variable to keep track of the current time in the output units
-	total_time = Decimal(0)
-
-	# Create a variable to keep track of the last time in the input units 
-	last_time = Decimal(0)
-
-	# Create a variable to store the current tempo and set it at the starting tempo
-	current_tempo = get_tempo(tempo_dict, 0)
-	
-	# If we are converting from seconds we have to convert the tempo times to seconds
-	if(not to_second):
-		# Loop through all of the tempo changes
-		for i in range(len(tempo_changes)):
-			# If this is the first loop iteration
-			if(i == 0):
-				# Calculate the time before the first tempo message
-				total_time += tick2second(tempo_changes[i][0], ticks_per_beat, current_tempo)
-			# If this is not the first loop iteration
-			else:
-				# Calculate the amount of time since the previous tempo message and convert it
-				total_time += tick2second(tempo_changes[i][0] - last_time, ticks_per_beat, current_tempo)
-			# Update last_time
-			last_time = Decimal(tempo_changes[i][0])
-			# Calculate the tempo for the next loop iteration
-			current_tempo = get_tempo(tempo_dict, tempo_changes[i][0])
-			# Update the tempo message's time
-			tempo_changes[i][0] = total_time
-
-	
-	# Re-sort the list so that the tempo change times are at the right times
-	notes.sort(key=lambda e: (e[0], e[1]))
-
-	# Reset the variable storing the current tempo
-	current_tempo = get_tempo(tempo_dict, 0)
-	
-	# Reset the variable to keep track of the current time in the output units
-	total_time = Decimal(0)
-
-	# Reset the variable to keep track of the last time in the input units 
-	last_time = Decimal(0)
-
-	# Convert note start time
-	for note in notes:
-		# If we are converting to seconds
-		if(to_second):
-			# Add to the converted time to the total time
-			total_time += tick2second(note[0] - last_time, ticks_per_beat, current_tempo)
-		# Otherwise
-		else:
-			# Add to the converted time to the total time
-			total_time += second2tick(note[0] - last_time, ticks_per_beat, current_tempo)
-		# If this is a tempo message
-		if(note[1] == -1):
-			# If we are converting to seconds
-			if(to_second):
-				# Set the tempo
-				current_tempo = get_tempo(tempo_dict, note[0])
-			# If we are converting to ticks
-			else:
-				# Set the tempo
-				current_tempo = get_tempo(tempo_dict, note[0], seconds=True, ticks_per_beat=ticks_per_beat)
+def notes2tick(notes, tempo_map):
+	return convert_note_time(notes, tempo_map, False)
+
+# Create a method to convert the note time from seconds to ticks or vice versa(in place)
+def convert_note_time(notes, tempo_map, to_second):
+	# Times in seconds are stored as whole numbers of the tempo map's time unit, so converting to seconds and
+	# back to ticks gives exactly the same ticks
+
+	# If the notes should be processed with NumPy and the times fit in its 64 bit integers
+	if(notes.vectorized() and fits_int64(notes, tempo_map, to_second)):
+		# Convert all of the notes at once
+		return convert_note_time_vectorized(notes, tempo_map, to_second)
+
+	# Get the times the tempos start at in the input units
+	tempo_times = tempo_map.ticks if to_second else tempo_map.times
+
+	# Create a variable to store the index of the tempo the last note started in
+	tempo_index = 0
+
+	# Get the method that converts a time
+	convert = tempo_map.tick2time if to_second else tempo_map.time2tick
+	# Get the start and end times of the notes
+	starts, ends = notes.starts, notes.ends
+
+	# Loop through the notes
+	for j in range(len(notes)):
+		# Get the note's start and end time
+		start, end = starts[j], ends[j]
+		# If the note starts before the last note(the notes weren't sorted)
+		if(start < tempo_times[tempo_index]):
+			# Search for its tempo
+			tempo_index = bisect_right(tempo_times, start) - 1
+		# Move forward to the last tempo that starts at or before the note
+		while tempo_index + 1 < len(tempo_times) and tempo_times[tempo_index + 1] <= start:
+			tempo_index += 1
+		# Find the tempo the note ends in, looking only after its start if it doesn't end before it
+		end_index = bisect_right(tempo_times, end, tempo_index if end >= start else 0) - 1
+		# Set the note's start and end time to the time in the other unit
+		starts[j] = convert(start, tempo_index)
+		ends[j] = convert(end, end_index)
+
+	# Return the note table
+	return notes
 
-		# Set last_time to the value that the note had
-		last_time = Decimal(note[0])
+# Check if the converted times of a note table and its tempo map fit in 64 bit integers
+def fits_int64(notes, tempo_map, to_second):
+	# Find the largest time the tempo map or the notes can reach
+	largest = max(tempo_map.times[-1], tempo_map.tick2time(max(max(notes.starts), max(notes.ends))) if to_second else 0)
+	# Compare it to the largest 64 bit integer
+	return largest < 2 ** 63
+
+# Convert the note times of a table from seconds to ticks or vice versa(in place) with NumPy
+def convert_note_time_vectorized(notes, tempo_map, to_second):
+	# Get the tempo map as NumPy arrays
+	tempo_ticks = np.array(tempo_map.ticks, dtype=np.int64)
+	tempo_times = np.array(tempo_map.times, dtype=np.int64)
+	tempos = np.array(tempo_map.tempos, dtype=np.int64)
+
+	# Loop through the start and end times
+	for column in (notes.starts, notes.ends):
+		# Get the times as a NumPy array that writes to the table
+		times = np.frombuffer(column, dtype=np.int64)
 		# If we are converting to seconds
 		if(to_second):
-			# Set the note's start time to the current time in the new unit
-			note[0] = total_time
+			# Find the last tempo that starts at or before each time
+			j = np.searchsorted(tempo_ticks, times, side="right") - 1
+			# Add the time since the tempo started to the time the tempo starts at
+			times[:] = tempo_times[j] + (times - tempo_ticks[j]) * tempos[j]
 		# Otherwise
 		else:
-			# Cast the time to an int, then set the note's start time to the current time in the new unit
-			note[0] = int(total_time)
-
-	# Delete the tempo messages
-	notes = [note for note in notes if note[1] >= 0]
-	
-	# Store a list of times that the tempo changes
-	tempo_changes = [[-1, time] for time in tempo_dict.keys()]
-
-	# Reset the variable storing the current tempo
-	current_tempo = get_tempo(tempo_dict, 0)
-
-	# Reset the variable to keep track of the current time in the output units
-	total_time = Decimal(0)
-
-	# Reset the variable to keep track of the last time in the input units 
-	last_time = Decimal(0)
-	
-	# If we are converting to ticks we have to convert the tempo times to seconds
-	if(not to_second):
-		# Loop through all of the tempo changes
-		for i in range(len(tempo_changes)):
-			# If this is the first loop iteration
-			if(i == 0):
-				# Use the default tempo of 120 BPM to calculate the time before the first tempo message
-				total_time += tick2second(tempo_changes[i][1], ticks_per_beat, current_tempo)
-			# If this is not the first loop iteration
-			else:
-				# Calculate the amount of time since the previous tempo message and convert it
-				total_time += tick2second(tempo_changes[i][1] - last_time, ticks_per_beat, current_tempo)
-			# Update last_time
-			last_time = Decimal(tempo_changes[i][1])
-			# Calculate the tempo for the next loop iteration
-			current_tempo = get_tempo(tempo_dict, tempo_changes[i][1])
-			# Update the tempo message's time
-			tempo_changes[i][1] = total_time
-
-	# Add the tempo change times to the notes list so we know when to change the tempo
-	for time in tempo_changes:
-		notes.append(time)
-
-	# Re-sort the list so that the tempo change times are at the right times
-	notes.sort(key=lambda e: (e[1], e[0]))
-	
-	# Reset the variable to keep track of the current time in the output units
-	total_time = Decimal(0)
+			# Find the last tempo that starts at or before each time
+			j = np.searchsorted(tempo_times, times, side="right") - 1
+			# Add the ticks since the tempo started to the tick the tempo starts at(rounded down)
+			times[:] = tempo_ticks[j] + (times - tempo_times[j]) // tempos[j]
 
-	# Reset the variable to keep track of the last time in the input units 
-	last_time = Decimal(0)
+	# Return the note table
+	return notes
 
-	# Reset the variable storing the current tempo
-	current_tempo = get_tempo(tempo_dict, 0)
+# A look up table for converting between ticks and seconds in a song with tempo changes
+class TempoMap:
+	"""The tempo changes of a song sorted by time with the time in seconds each one starts at
 
-	# Convert note end time
-	for note in notes:
-		# If we are converting to seconds
-		if(to_second):
-			# Add to the converted time to the total time
-			total_time += tick2second(note[1] - last_time, ticks_per_beat, current_tempo)
-		# Otherwise
-		else:
-			# Add to the converted time to the total time
-			total_time += second2tick(note[1] - last_time, ticks_per_beat, current_tempo)
-		# If this is a tempo message
-		if(note[0] == -1):
-			# If we are converting to seconds
-			if(to_second):
-				# Set the tempo
-				current_tempo = get_tempo(tempo_dict, note[1])
-			# If we are converting to ticks
+	Time in seconds is stored exactly as a whole number of 1 / (ticks_per_beat * 1000000) seconds, which is a
+	tick multiplied by a tempo in microseconds per beat. Use time2second and second2time to convert it.
+	"""
+	def __init__(self, tempo_dict, ticks_per_beat):
+		# If ticks_per_beat is invalid
+		if(ticks_per_beat < 1):
+			# Throw an error
+			raise InputError("ticks_per_beat cannot be less than 1")
+		# Store the ticks per beat
+		self.ticks_per_beat = ticks_per_beat
+		# Store the number of time units in a second
+		self.time_per_second = ticks_per_beat * 1000000
+		# Store the tempo changes sorted by time as (tick, tempo)
+		self.changes = sorted(tempo_dict.items())
+		# Assume the tempo is initially 120 BPM if it is not specified at the beginning
+		self.ticks = [0]
+		self.tempos = [500000]
+		# Loop through the tempo changes
+		for time, tempo in self.changes:
+			# If this tempo starts at the same time as the last one
+			if(time == self.ticks[-1]):
+				# Replace it
+				self.tempos[-1] = tempo
+			# Otherwise
 			else:
-				# Set the tempo
-				current_tempo = get_tempo(tempo_dict, note[1], seconds=True, ticks_per_beat=ticks_per_beat)
-		# Set last_time to the value that the note had
-		last_time = Decimal(note[1])
-		# If we are converting to seconds
-		if(to_second):
-			# Set the note's start time to the current time in the new unit
-			note[1] = total_time
-		# Otherwise
-		else:
-			# Cast the time to an int, then set the note's start time to the current time in the new unit
-			note[1] = int(total_time)
-
-	# Delete the tempo messages
-	notes = [note for note in notes if note[0] >= 0]
-	
-	# Re-sort the notes
-	notes.sort(key=lambda e: e[0])
-
-	# Return the notes list
-	return notes
-
-# Redefine the tick2second method from mido to use decimals instead of floats
-def tick2second(tick, ticks_per_beat, tempo):
-	# Conversion factor from ticks to seconds
-    scale = Decimal(tempo) * Decimal(1e-6) / Decimal(ticks_per_beat)
-	# Multiply by the scaling factor
-    return Decimal(tick) * scale
-
-# Redefine the second2tick method from mido to use decimals instead of floats
-def second2tick(second, ticks_per_beat, tempo):
-	# Conversion factor from ticks to seconds
-    scale = Decimal(tempo) * Decimal(1e-6) / Decimal(ticks_per_beat)
-	# Divide by the scaling factor
-    return Decimal(second) / scale
-
-# Set the channel of all messages in a track
-def set_channel(track, channel_index):
-	# If the channel_index is out of range
-	if(channel_index < 0 or channel_index > 15):
-		# Force it into range
-		channel_index = min(max(channel_index, 0), 15)
+				# Add it
+				self.ticks.append(time)
+				self.tempos.append(tempo)
+		# Create a list to store the time each tempo starts at
+		self.times = [0]
+		# Loop through the tempos after the first one
+		for j in range(1, len(self.ticks)):
+			# Add the length of the previous tempo to its start time
+			self.times.append(self.times[j - 1] + (self.ticks[j] - self.ticks[j - 1]) * self.tempos[j - 1])
+
+	# Convert a time in ticks to time units(j is the index of the tempo at that time, if it is already known)
+	def tick2time(self, tick, j=None):
+		# If the tempo isn't known
+		if(j == None):
+			# Find the last tempo that starts at or before the time
+			j = bisect_right(self.ticks, tick) - 1
+		# Add the time since the tempo started to the time the tempo starts at
+		return self.times[j] + (tick - self.ticks[j]) * self.tempos[j]
+
+	# Convert a time in time units to ticks, rounded down(j is the index of the tempo at that time, if it is already known)
+	def time2tick(self, time, j=None):
+		# If the tempo isn't known
+		if(j == None):
+			# Find the last tempo that starts at or before the time
+			j = bisect_right(self.times, time) - 1
+		# Add the ticks since the tempo started to the tick the tempo starts at
+		return self.ticks[j] + (time - self.times[j]) // self.tempos[j]
+
+	# Convert a time in seconds to time units, rounded down
+	def second2time(self, second):
+		# Multiply by the number of units in a second
+		return math.floor(Fraction(second) * self.time_per_second)
+
+	# Convert a time in time units to seconds
+	def time2second(self, time):
+		# Divide by the number of units in a second
+		return Fraction(time, self.time_per_second)
+
+	# Convert a time in ticks to seconds
+	def tick2second(self, tick):
+		return self.time2second(self.tick2time(tick))
+
+	# Convert a time in seconds to ticks, rounded down
+	def second2tick(self, second):
+		return self.time2tick(self.second2time(second))
+
+	# Find the tempo at a time in ticks
+	def tempo_at_tick(self, tick):
+		# Return the last tempo that starts at or before the time
+		return self.tempos[bisect_right(self.ticks, tick) - 1]
+
+	# Find the tempo at a time in seconds
+	def tempo_at_second(self, second):
+		# Return the last tempo that starts at or before the time
+		return self.tempos[bisect_right(self.times, self.second2time(second)) - 1]
+
+# Get a copy of a track with a program change before each message whose channel's patch changed since the message before it
+def add_program_changes(track, patch_map):
+	# Create the new track
+	changed_track = smf.EventTrack()
+	# Use tick_time to represent absolute time and set it to 0
+	tick_time = 0
+	# Create a variable to store the previous patch
+	last_patch = None
 	# Loop through all messages
-	for msg in track:
-		# Try to set the channel
-		try:
-			msg.channel = channel_index
-		# If it fails, don't worry about it
-		except:
-			pass
-	# Return the track
-	return track
-
-# Set the patch of a track
-def set_track_patch(track, patch_index, channel):
-	# Force channel into range
-	channel = min(max(channel, 0), 15)
-	# Force the patch number into range
-	patch_index = min(max(patch_index, 0), 127)
-	# Remove all patch change messages
-	track = [msg for msg in track if not msg.type == "program_change"]
-	# Insert a patch change message at the start of the track
-	track.insert(1, Message("program_change", channel=channel, program=patch_index))
+	for delta, status, data1, data2, payload in zip(track.deltas, track.statuses, track.data1, track.data2, track.payloads):
+		# Update tick_time
+		tick_time += delta
+		# If this isn't a meta message
+		if(status != smf.META):
+			# Get the channel of the message
+			channel = status & 0x0F
+			# Get the patch and the time it started at
+			patch, patch_time = patch_map.get(channel, tick_time)
+			# If the patch has changed
+			if(patch != last_patch):
+				# Add a patch change message at the time the patch started(but not before the previous message)
+				change_delta = delta - min(max(tick_time - patch_time, 0), delta)
+				changed_track.append(change_delta, smf.PROGRAM_CHANGE | channel, patch)
+				# Take its time off of the message's time
+				delta -= change_delta
+			# Update last_patch
+			last_patch = patch
+		# Add the message
+		changed_track.append(delta, status, data1, data2, payload)
+	# Return the new track
+	return changed_track
+
+# Set the channel of all messages in a track and, if a patch is given, replace its patch changes with one at the start
+def finalize_track(track, channel_index, patch_index=None):
+	# Force the channel into range(tracks past the 16th share the last channel)
+	channel_index = min(max(channel_index, 0), 15)
+	# If the track should have a single patch
+	if(patch_index != None):
+		# Remove all patch change messages
+		track = track.select([k for k, status in enumerate(track.statuses) if status & 0xF0 != smf.PROGRAM_CHANGE])
+		# Insert a patch change message at the start of the track, with the patch number forced into range
+		track.insert(1, 0, smf.PROGRAM_CHANGE | channel_index, min(max(patch_index, 0), 127))
+	# Set the channel of all channel messages(meta messages don't have one)
+	track.set_channel(channel_index)
 	# Return the track
 	return track
\ No newline at end of file
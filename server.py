@@ -0,0 +1,503 @@
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+import midi_parser as mp
+import constants as c
+
+# The query options of /convert with the keyword of convert_bytes they set
+TEXT_OPTIONS = {"velocity": "new_velocity", "margin": "align_margin", "tempo": "normalized_tempo"}
+BOOL_OPTIONS = {"collated": "collated", "channels": "create_channels", "index_patches": "index_patches", "low_memory": "low_memory"}
+
+# The text of the values a bool option can have
+TRUE_VALUES = ("1", "true", "yes", "on")
+FALSE_VALUES = ("0", "false", "no", "off")
+
+# Create the parser for the command line arguments
+def create_argument_parser():
+	# Create the parser
+	parser = argparse.ArgumentParser(prog="main.py serve", description="Convert MIDI files sent over HTTP with a pool of worker processes that stay running.")
+	# Add the address arguments
+	parser.add_argument("--host", default=c.SERVICE_HOST, help="address to listen on(default: %(default)s)")
+	parser.add_argument("--port", type=int, default=c.SERVICE_PORT, help="port to listen on(default: %(default)s)")
+	parser.add_argument("--unix", default=None, metavar="PATH", help="listen on a Unix socket at this path instead of a port")
+	# Add the pool arguments
+	parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1, help="number of worker processes(default: %(default)s)")
+	parser.add_argument("--queue-size", type=int, default=c.SERVICE_QUEUE_SIZE, help="most conversions that can wait for a worker before new ones are refused(default: %(default)s)")
+	parser.add_argument("--timeout", type=float, default=c.SERVICE_TIMEOUT, help="most seconds a conversion can take, including its time in the queue(default: %(default)s)")
+	# Add the logging argument
+	parser.add_argument("-q", "--quiet", action="store_true", help="don't log each request")
+	# Return the parser
+	return parser
+
+# Convert songs sent through a connection until it is closed, sending back each converted song or its error
+def convert_worker(connection):
+	# Let the service handle interrupts, it stops the workers itself
+	signal.signal(signal.SIGINT, signal.SIG_IGN)
+	# Create an object to keep the results of the stages of parse, so converting the same song again with other options is faster
+	memo = mp.StageMemo()
+	# Tell the pool the parser is imported and the worker is ready
+	connection.send(("ready",))
+	# Loop until the pool stops the worker
+	while True:
+		# Wait for a song and its options
+		try:
+			job = connection.recv()
+		except EOFError:
+			return
+		# If the pool is stopping, stop
+		if(job == None):
+			return
+		data, options = job
+		try:
+			# Convert the song and send it back
+			connection.send(("done", mp.convert_bytes(data, memo=memo, **options)))
+		except mp.ConversionError as err:
+			# Send the error that stopped the conversion(only errors writing the song are the service's fault)
+			connection.send(("error", 500 if isinstance(err, mp.OutputError) else 400, str(err)))
+		except Exception as err:
+			# Print the error
+			traceback.print_tb(err.__traceback__)
+			# Forget the kept results in case they caused the error
+			memo.clear()
+			# Send the error
+			connection.send(("error", 500, "Conversion failed: " + str(err)))
+
+# Summarize a list of seconds as their mean, median, 95th percentile and maximum
+def summarize(samples):
+	# If there aren't any, there is nothing to summarize
+	if(len(samples) == 0):
+		return {"count": 0}
+	# Sort the samples to find the percentiles
+	ordered = sorted(samples)
+	# Return the summary
+	return {
+		"count": len(ordered),
+		"mean": sum(ordered) / len(ordered),
+		"p50": ordered[len(ordered) // 2],
+		"p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+		"max": ordered[-1],
+	}
+
+# A conversion sent to a WorkerPool
+class ConversionJob:
+	"""A song and its options waiting for a worker of a WorkerPool
+
+	The job is finished with an HTTP status and either the converted song or the text of an error. wait blocks
+	until it is finished. The times it was queued, started and finished are kept for the stats of the pool.
+	"""
+	def __init__(self, data, options, timeout):
+		# Store the song and its options
+		self.data = data
+		self.options = options
+		# Store the time it was queued and the time it has to be finished by
+		self.queued_time = time.perf_counter()
+		self.deadline = self.queued_time + timeout
+		# Create variables to store the times it started and finished
+		self.started_time = None
+		self.finished_time = None
+		# Create variables to store the result
+		self.status = None
+		self.output = None
+		self.error = None
+		# Create the event that is set when the job is finished
+		self.event = threading.Event()
+
+	# Finish the job with a status and the converted song or an error
+	def finish(self, status, output=None, error=None):
+		self.status = status
+		self.output = output
+		self.error = error
+		self.finished_time = time.perf_counter()
+		# Wake the thread waiting for it
+		self.event.set()
+
+	# Wait until the job is finished
+	def wait(self):
+		self.event.wait()
+
+# The counts and latencies of the jobs of a WorkerPool
+class ServiceStats:
+	"""Counts of the jobs of a WorkerPool by result with the time recent ones waited in the queue and took in total"""
+	def __init__(self):
+		# Create a lock so the threads of the pool can update the stats together
+		self.lock = threading.Lock()
+		# Create the counters
+		self.accepted = 0
+		self.rejected = 0
+		self.running = 0
+		self.completed = 0
+		self.failed = 0
+		self.timed_out = 0
+		# Create lists of the seconds recent jobs waited in the queue and took from being queued to finishing
+		self.waits = deque(maxlen=c.SERVICE_LATENCY_SAMPLES)
+		self.latencies = deque(maxlen=c.SERVICE_LATENCY_SAMPLES)
+
+	# Count a job that was queued
+	def accept(self):
+		with self.lock:
+			self.accepted += 1
+
+	# Count a job that was refused because the queue was full
+	def reject(self):
+		with self.lock:
+			self.rejected += 1
+
+	# Count a job that a worker started
+	def start(self, job):
+		with self.lock:
+			self.running += 1
+			self.waits.append(job.started_time - job.queued_time)
+
+	# Count a job that was finished
+	def finish(self, job, started=True):
+		with self.lock:
+			# If a worker started it, it isn't running anymore
+			if(started):
+				self.running -= 1
+			# Count its result
+			if(job.status == 200):
+				self.completed += 1
+			elif(job.status == 504):
+				self.timed_out += 1
+			else:
+				self.failed += 1
+			self.latencies.append(job.finished_time - job.queued_time)
+
+	# Get the stats as a dictionary that can be saved as JSON
+	def as_dict(self):
+		with self.lock:
+			return {
+				"accepted": self.accepted,
+				"rejected": self.rejected,
+				"running": self.running,
+				"completed": self.completed,
+				"failed": self.failed,
+				"timed_out": self.timed_out,
+				"wait_seconds": summarize(self.waits),
+				"latency_seconds": summarize(self.latencies),
+			}
+
+# Worker processes that convert the jobs of a bounded queue
+class WorkerPool:
+	"""A pool of worker processes that import the parser when the pool starts and convert songs from a queue
+
+	Each worker has a thread that sends it jobs one at a time. submit raises queue.Full when queue_size jobs are
+	already waiting, so callers can refuse new work instead of falling further behind. A job that isn't finished
+	timeout seconds after it was queued is finished with a 504 status and its worker is restarted.
+	"""
+	def __init__(self, workers=None, queue_size=c.SERVICE_QUEUE_SIZE, timeout=c.SERVICE_TIMEOUT):
+		# Store the size of the pool and the longest a job can take
+		self.workers = workers if workers != None else os.cpu_count() or 1
+		self.timeout = timeout
+		# Create the queue of jobs
+		self.jobs = queue.Queue(queue_size)
+		# Create the stats
+		self.stats = ServiceStats()
+		# Create a list for the threads that send jobs to the workers
+		self.threads = []
+
+	# Start the workers and wait until they are ready
+	def start(self):
+		for j in range(self.workers):
+			# Start a worker and a thread to send it jobs
+			thread = threading.Thread(target=self.dispatch, args=self.start_worker(), daemon=True)
+			thread.start()
+			self.threads.append(thread)
+
+	# Start a worker process, returning it and the connection to it once it is ready
+	def start_worker(self):
+		# Create the connection
+		connection, worker_connection = multiprocessing.Pipe()
+		# Start the process
+		process = multiprocessing.Process(target=convert_worker, args=(worker_connection,), daemon=True)
+		process.start()
+		worker_connection.close()
+		# Wait until it has imported the parser
+		connection.recv()
+		# Return it
+		return process, connection
+
+	# Stop a worker process
+	def stop_worker(self, process, connection):
+		# Ask it to stop
+		try:
+			connection.send(None)
+		except OSError:
+			pass
+		# If it doesn't, kill it
+		process.join(1)
+		if(process.is_alive()):
+			process.terminate()
+			process.join()
+		connection.close()
+
+	# Queue a song to be converted with keyword options of convert_bytes, returning its job(raises queue.Full if the queue is full)
+	def submit(self, data, options, timeout=None):
+		# Create the job(it can't have longer than the pool allows)
+		job = ConversionJob(data, options, self.timeout if timeout == None else min(timeout, self.timeout))
+		# Queue it without waiting
+		try:
+			self.jobs.put_nowait(job)
+		except queue.Full:
+			self.stats.reject()
+			raise
+		# Count it
+		self.stats.accept()
+		# Return it
+		return job
+
+	# Send jobs to a worker until the pool is closed
+	def dispatch(self, process, connection):
+		while True:
+			# Wait for a job
+			job = self.jobs.get()
+			# If the pool is closing, stop the worker
+			if(job == None):
+				self.stop_worker(process, connection)
+				return
+			# Get the time it has left
+			job.started_time = time.perf_counter()
+			remaining = job.deadline - job.started_time
+			# If it ran out of time in the queue, finish it without converting it
+			if(remaining <= 0):
+				job.finish(504, error="Conversion timed out before a worker was free")
+				self.stats.finish(job, started=False)
+				continue
+			self.stats.start(job)
+			# Create a variable to store the reply of the worker
+			reply = None
+			try:
+				# Send the job
+				connection.send((job.data, job.options))
+				# Wait for the worker to reply until the job runs out of time
+				if(connection.poll(remaining)):
+					reply = connection.recv()
+				else:
+					job.finish(504, error="Conversion took longer than %g seconds" % (job.deadline - job.queued_time))
+			except (EOFError, OSError):
+				# If the worker stopped, fail the job
+				job.finish(500, error="The worker converting the file stopped")
+			# If the worker replied, finish the job with its reply
+			if(reply != None):
+				if(reply[0] == "done"):
+					job.finish(200, output=reply[1])
+				else:
+					job.finish(reply[1], error=reply[2])
+			# Otherwise replace the worker(it is still converting or has stopped)
+			else:
+				process.terminate()
+				process.join()
+				connection.close()
+				process, connection = self.start_worker()
+			self.stats.finish(job)
+
+	# Get the stats of the pool as a dictionary that can be saved as JSON
+	def stats_dict(self):
+		stats = self.stats.as_dict()
+		stats["workers"] = self.workers
+		stats["queue_depth"] = self.jobs.qsize()
+		stats["queue_size"] = self.jobs.maxsize
+		return stats
+
+	# Stop the workers once the jobs already queued are finished
+	def close(self):
+		# Tell each thread to stop
+		for thread in self.threads:
+			self.jobs.put(None)
+		# Wait for them
+		for thread in self.threads:
+			thread.join()
+		self.threads = []
+
+# Read the keyword options of convert_bytes from the query of a request(raises ValueError if one isn't valid)
+def read_options(query):
+	# Create a dictionary for the options
+	options = {}
+	# Loop through the query
+	for name, values in query.items():
+		# Use the last value of each option
+		value = values[-1]
+		# If it is a text option, keep the text
+		if(name in TEXT_OPTIONS):
+			options[TEXT_OPTIONS[name]] = value
+		# If it is a bool option, read it
+		elif(name in BOOL_OPTIONS):
+			if(value.lower() in TRUE_VALUES):
+				options[BOOL_OPTIONS[name]] = True
+			elif(value.lower() in FALSE_VALUES):
+				options[BOOL_OPTIONS[name]] = False
+			else:
+				raise ValueError("Option " + name + " must be true or false")
+		# The timeout is read separately
+		elif(name != "timeout"):
+			raise ValueError("Unknown option " + name)
+	# Patches can only be indexed with channels, so they aren't indexed by default without them like the command line
+	if("index_patches" not in options):
+		options["index_patches"] = options.get("create_channels", True)
+	# Return the options
+	return options
+
+# Handles the requests to the conversion service
+class ServiceHandler(BaseHTTPRequestHandler):
+	"""POST a MIDI file to /convert to get it back converted, GET /stats for the queue depth and latencies
+
+	The options of the conversion are read from the query, e.g. /convert?margin=0.02&channels=false&timeout=10.
+	"""
+	# Keep connections open between requests
+	protocol_version = "HTTP/1.1"
+
+	# Send a response with a body
+	def send_body(self, status, content_type, body, headers={}):
+		self.send_response(status)
+		self.send_header("Content-Type", content_type)
+		self.send_header("Content-Length", str(len(body)))
+		for name, value in headers.items():
+			self.send_header(name, value)
+		self.end_headers()
+		# Write the body a piece at a time so large files start arriving before all of it is copied
+		for start in range(0, len(body), c.SERVICE_CHUNK_SIZE):
+			self.wfile.write(body[start:start + c.SERVICE_CHUNK_SIZE])
+
+	# Send an error as text
+	def send_text(self, status, text, headers={}):
+		self.send_body(status, "text/plain; charset=utf-8", (text + "\n").encode("utf-8"), headers)
+
+	def do_GET(self):
+		# If the stats are requested, send them
+		if(urlparse(self.path).path == "/stats"):
+			self.send_body(200, "application/json", json.dumps(self.server.pool.stats_dict(), indent=1).encode("utf-8"))
+		else:
+			self.send_text(404, "Not found")
+
+	def do_POST(self):
+		url = urlparse(self.path)
+		# Only songs can be posted
+		if(url.path != "/convert"):
+			self.close_connection = True
+			return self.send_text(404, "Not found")
+		# Get the size of the song
+		try:
+			length = int(self.headers.get("Content-Length"))
+		except (TypeError, ValueError):
+			self.close_connection = True
+			return self.send_text(411, "Content-Length is required")
+		# Refuse songs that are too large without reading them
+		if(length > c.SERVICE_MAX_INPUT_SIZE):
+			self.close_connection = True
+			return self.send_text(413, "MIDI files can't be larger than %d bytes" % c.SERVICE_MAX_INPUT_SIZE)
+		# Read the song
+		data = self.rfile.read(length)
+		# Read the options
+		query = parse_qs(url.query, keep_blank_values=True)
+		try:
+			options = read_options(query)
+			timeout = float(query["timeout"][-1]) if "timeout" in query else None
+		except ValueError as err:
+			return self.send_text(400, str(err))
+		# Queue the song
+		try:
+			job = self.server.pool.submit(data, options, timeout)
+		except queue.Full:
+			# If there are too many songs waiting, ask the client to try again later
+			return self.send_text(503, "Too many conversions are waiting, try again later", {"Retry-After": "1"})
+		# Wait for it to be converted
+		job.wait()
+		# Get the times it took
+		times = {"X-Queue-Seconds": "%.6f" % (job.started_time - job.queued_time), "X-Total-Seconds": "%.6f" % (job.finished_time - job.queued_time)}
+		# Send the converted song or the error
+		if(job.status == 200):
+			self.send_body(200, "audio/midi", job.output, times)
+		else:
+			self.send_text(job.status, job.error, times)
+
+	# Get the address of the client(clients of Unix sockets don't have one)
+	def address_string(self):
+		return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+	# Log requests unless the server is quiet
+	def log_message(self, format, *args):
+		if(not self.server.quiet):
+			super().log_message(format, *args)
+
+# An HTTP server that sends songs to a WorkerPool
+class ServiceServer(ThreadingHTTPServer):
+	"""An HTTP server with a thread for each connection that converts songs with a WorkerPool"""
+	# Don't wait for connections to close when stopping
+	daemon_threads = True
+
+	def __init__(self, address, pool, quiet=False):
+		# Store the pool and whether to log requests
+		self.pool = pool
+		self.quiet = quiet
+		# Start listening
+		super().__init__(address, ServiceHandler)
+
+# A ServiceServer that listens on a Unix socket
+class UnixServiceServer(ServiceServer):
+	"""A ServiceServer that listens on a Unix socket at a path instead of a port"""
+	address_family = getattr(socket, "AF_UNIX", None)
+
+	def server_bind(self):
+		# Remove the socket of a server that wasn't stopped cleanly
+		if(os.path.exists(self.server_address)):
+			os.remove(self.server_address)
+		# Bind the socket without looking up a host name
+		socketserver.TCPServer.server_bind(self)
+		self.server_name = "localhost"
+		self.server_port = 0
+
+	def server_close(self):
+		super().server_close()
+		# Remove the socket
+		if(os.path.exists(self.server_address)):
+			os.remove(self.server_address)
+
+# Run the conversion service and return the exit code
+def main(args=None):
+	# Parse the arguments
+	arguments = create_argument_parser().parse_args(args)
+	# If a Unix socket isn't available, fail
+	if(arguments.unix != None and UnixServiceServer.address_family == None):
+		print("Unix sockets aren't supported on this platform", file=sys.stderr)
+		return 2
+
+	# Start the workers
+	pool = WorkerPool(max(arguments.workers, 1), max(arguments.queue_size, 1), arguments.timeout)
+	pool.start()
+	try:
+		# Start listening
+		if(arguments.unix != None):
+			server = UnixServiceServer(arguments.unix, pool, arguments.quiet)
+			print("Serving on %s with %d workers" % (arguments.unix, pool.workers))
+		else:
+			server = ServiceServer((arguments.host, arguments.port), pool, arguments.quiet)
+			print("Serving on http://%s:%d with %d workers" % (arguments.host, server.server_port, pool.workers))
+		sys.stdout.flush()
+		# Handle requests until the service is interrupted
+		try:
+			server.serve_forever()
+		except KeyboardInterrupt:
+			pass
+		finally:
+			server.server_close()
+	finally:
+		# Stop the workers
+		pool.close()
+	# Succeed
+	return 0
+
+# Run the service when this file is run directly
+if(__name__ == "__main__"):
+	sys.exit(main())
@@ -0,0 +1,472 @@
+import mmap
+import pickle
+import struct
+import tempfile
+from array import array
+from itertools import chain, repeat
+
+# The number of data bytes of each channel message by the high nibble of its status
+CHANNEL_DATA_LENGTHS = {0x8: 2, 0x9: 2, 0xA: 2, 0xB: 2, 0xC: 1, 0xD: 1, 0xE: 2}
+# The number of data bytes of each system message(meta and sysex messages are read separately)
+SYSTEM_DATA_LENGTHS = {0xF1: 1, 0xF2: 2, 0xF3: 1, 0xF6: 0, 0xF8: 0, 0xFA: 0, 0xFB: 0, 0xFC: 0, 0xFE: 0}
+
+# The status of meta messages
+META = 0xFF
+# The high nibbles of the statuses of the channel messages the parser writes
+NOTE_OFF = 0x80
+NOTE_ON = 0x90
+PROGRAM_CHANGE = 0xC0
+# The types of the meta messages the parser uses
+TRACK_NAME = 0x03
+SET_TEMPO = 0x51
+END_OF_TRACK = 0x2F
+
+# An error in the structure of a MIDI file
+class MidiFileError(Exception):
+	pass
+
+# Read a variable length number from some data, returning (number, position after it)
+def read_variable_int(data, position):
+	# Read bytes until one doesn't have the continue bit set
+	byte = data[position]
+	position += 1
+	number = byte & 0x7F
+	while byte & 0x80:
+		byte = data[position]
+		position += 1
+		number = (number << 7) | (byte & 0x7F)
+	# Return the number and the position after it
+	return number, position
+
+# Encode a number as a variable length number
+def encode_variable_int(number):
+	# Times before the last message can't be written
+	if(number < 0):
+		raise ValueError("Variable length numbers can't be negative")
+	# Most numbers fit in a single byte
+	if(number < 0x80):
+		return bytes((number,))
+	# Split the number into 7 bit groups, setting the continue bit on all but the last
+	groups = [number & 0x7F]
+	number >>= 7
+	while number:
+		groups.append(0x80 | (number & 0x7F))
+		number >>= 7
+	# Return the groups from the most significant
+	return bytes(reversed(groups))
+
+# A Standard MIDI File that is read from a memory map as it is used
+class MidiReader:
+	"""The header and tracks of a Standard MIDI File
+
+	The file is memory mapped(or read from data already in memory) and only the chunk headers are read when it
+	is opened. The events of each track are decoded every time the track is iterated, as (absolute tick, status, data1, data2). For meta messages
+	the status is 0xFF, data1 is the meta type and data2 is the data as bytes. For sysex messages data1 is
+	None and data2 is the data after the length. Channel messages with one data byte have a data2 of 0.
+	"""
+	def __init__(self, filename=None, data=None):
+		# Store the name of the file so it can be opened again in other processes
+		self.filename = filename
+		# If the file is already in memory, use it
+		if(filename == None):
+			self.data = data if data != None else b""
+		# Otherwise map the file into memory
+		else:
+			self.open()
+		# Read the header and find the tracks
+		self.read_chunks()
+
+	# Map the file into memory
+	def open(self):
+		with open(self.filename, "rb") as file:
+			# An empty file can't be mapped, so use empty bytes for it
+			try:
+				self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+			except ValueError:
+				self.data = b""
+
+	# Read the header and the position of each track
+	def read_chunks(self):
+		# Read the header chunk
+		if(len(self.data) < 14 or self.data[0:4] != b"MThd"):
+			raise MidiFileError("MThd not found, probably not a MIDI file")
+		size = struct.unpack(">L", self.data[4:8])[0]
+		if(size < 6):
+			raise MidiFileError("MThd is too short")
+		# Read the format, the number of tracks and the ticks per beat
+		self.type, track_count, self.ticks_per_beat = struct.unpack(">hhh", self.data[8:14])
+		# Only a time division in ticks per beat is supported(a negative one is in SMPTE frames)
+		if(self.ticks_per_beat < 1):
+			raise MidiFileError("The time division must be a positive number of ticks per beat")
+		# Create a list for the tracks
+		self.tracks = []
+		# Find the chunk after the header
+		position = 8 + size
+		# Read chunks until all of the tracks are found
+		while len(self.tracks) < track_count:
+			# If there isn't another chunk
+			if(position + 8 > len(self.data)):
+				raise MidiFileError("The file ended before all of the tracks")
+			# Read the chunk header
+			name = self.data[position:position + 4]
+			size = struct.unpack(">L", self.data[position + 4:position + 8])[0]
+			# If the chunk goes past the end of the file
+			if(position + 8 + size > len(self.data)):
+				raise MidiFileError("The file ended in the middle of a track")
+			# If it is a track, add it(other chunks are skipped)
+			if(name == b"MTrk"):
+				self.tracks.append(TrackReader(self, position + 8, position + 8 + size))
+			# Move to the next chunk
+			position += 8 + size
+
+	# Get the data of the file, mapping it again if it was closed
+	def get_data(self):
+		if(isinstance(self.data, mmap.mmap) and self.data.closed):
+			self.open()
+		return self.data
+
+	# Close the memory map(iterating a track maps the file again)
+	def close(self):
+		if(isinstance(self.data, mmap.mmap)):
+			self.data.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		self.close()
+
+	# Don't send the memory map to other processes(data that was already in memory is sent as bytes)
+	def __getstate__(self):
+		state = self.__dict__.copy()
+		if(self.filename == None):
+			state["data"] = bytes(self.data)
+		else:
+			del state["data"]
+		return state
+
+	# Map the file again in other processes
+	def __setstate__(self, state):
+		self.__dict__.update(state)
+		if(self.filename != None):
+			self.open()
+
+# A track of a MidiReader
+class TrackReader:
+	"""The position of a track in a MidiReader, iterate over it to decode its events"""
+	def __init__(self, reader, start, end):
+		# Store the file and the start and end of the track data
+		self.reader = reader
+		self.start = start
+		self.end = end
+		# Create a variable to store the name of the track once it is found
+		self.track_name = None
+
+	# Decode the events of the track
+	def __iter__(self):
+		# Get the data of the file and the end of the track
+		data = self.reader.get_data()
+		end = self.end
+		# Create variables to store the position, the absolute time and the running status
+		position = self.start
+		tick = 0
+		running_status = None
+		try:
+			# Loop until the end of the track
+			while position < end:
+				# Read the delta time(most are a single byte)
+				byte = data[position]
+				position += 1
+				if(byte & 0x80):
+					delta, position = read_variable_int(data, position - 1)
+					tick += delta
+				else:
+					tick += byte
+				# Read the status
+				status = data[position]
+				# If this is a data byte, use the last status
+				if(status < 0x80):
+					if(running_status == None):
+						raise MidiFileError("Running status without a previous status")
+					status = running_status
+				# Otherwise move past it
+				else:
+					position += 1
+					# Meta messages don't change the running status
+					if(status != META):
+						running_status = status
+				# If this is a channel message
+				if(status < 0xF0):
+					# Read the data bytes
+					if(CHANNEL_DATA_LENGTHS[status >> 4] == 2):
+						data1 = data[position]
+						data2 = data[position + 1]
+						position += 2
+					else:
+						data1 = data[position]
+						data2 = 0
+						position += 1
+					# Data bytes only have 7 bits(like mido, reject the message instead of reading a wrong value)
+					if((data1 | data2) > 0x7F):
+						raise MidiFileError("Data byte 0x%02x is out of range 0..127" % max(data1, data2))
+					yield (tick, status, data1, data2)
+				# If this is a meta message
+				elif(status == META):
+					# Read the type, length and data
+					meta_type = data[position]
+					length, position = read_variable_int(data, position + 1)
+					yield (tick, META, meta_type, bytes(data[position:position + length]))
+					position += length
+				# If this is a sysex message
+				elif(status == 0xF0 or status == 0xF7):
+					# Read the length and data
+					length, position = read_variable_int(data, position)
+					yield (tick, status, None, bytes(data[position:position + length]))
+					position += length
+				# If this is another system message
+				elif(status in SYSTEM_DATA_LENGTHS):
+					# Read the data bytes
+					length = SYSTEM_DATA_LENGTHS[status]
+					data1 = data[position] if length > 0 else 0
+					data2 = data[position + 1] if length > 1 else 0
+					if((data1 | data2) > 0x7F):
+						raise MidiFileError("Data byte 0x%02x is out of range 0..127" % max(data1, data2))
+					yield (tick, status, data1, data2)
+					position += length
+				# Otherwise the status isn't defined
+				else:
+					raise MidiFileError("Undefined status byte 0x%02x" % status)
+		except IndexError:
+			raise MidiFileError("A message goes past the end of the file")
+		# If the last message went past the end of the track
+		if(position > end):
+			raise MidiFileError("A message goes past the end of its track")
+
+	# Get the name of the track(the text of its first track name message)
+	@property
+	def name(self):
+		# If the name hasn't been found yet
+		if(self.track_name == None):
+			# If there isn't a track name message, the name is empty
+			self.track_name = ""
+			# Loop through the events
+			for tick, status, data1, data2 in self:
+				# If this is a track name message
+				if(status == META and data1 == TRACK_NAME):
+					# Decode it
+					self.track_name = data2.decode("latin1")
+					break
+		# Return the name
+		return self.track_name
+
+	# Let the operating system drop the pages of the track from memory(they are read again if the track is used again)
+	def release(self):
+		data = self.reader.data
+		# Only mapped files have pages that can be dropped(madvise isn't available on every platform)
+		if(isinstance(data, mmap.mmap) and not data.closed and hasattr(data, "madvise") and hasattr(mmap, "MADV_DONTNEED")):
+			# The start has to be at the start of a page
+			start = self.start - self.start % mmap.PAGESIZE
+			if(self.end > start):
+				data.madvise(mmap.MADV_DONTNEED, start, self.end - start)
+
+	# Send only the data of this track to other processes if the file isn't on disk
+	def __getstate__(self):
+		state = self.__dict__.copy()
+		if(self.reader.filename == None):
+			# Create a reader that only holds this track
+			reader = MidiReader.__new__(MidiReader)
+			reader.__dict__.update(self.reader.__dict__)
+			reader.data = bytes(self.reader.data[self.start:self.end])
+			reader.tracks = []
+			state["reader"] = reader
+			state["start"] = 0
+			state["end"] = self.end - self.start
+		return state
+
+# A track that is being built to be written
+class EventTrack:
+	"""The events of a track that is being built, stored in columns instead of message objects
+
+	Each event has a delta time, a status and two data bytes(the second is ignored for channel messages with
+	one data byte). For meta events the status is 0xFF, data1 is the meta type and the data is in payloads,
+	which has None for every other event. write encodes the track the same way mido saves one: with running
+	status, and with every end_of_track removed(its delta is added to the next event) and one added at the end.
+	"""
+	__slots__ = ("deltas", "statuses", "data1", "data2", "payloads")
+
+	def __init__(self):
+		# Create a column for each part of the events
+		self.deltas = array("q")
+		self.statuses = array("B")
+		self.data1 = array("B")
+		self.data2 = array("B")
+		self.payloads = []
+
+	# Get the number of events
+	def __len__(self):
+		return len(self.statuses)
+
+	# Add an event to the end of the track
+	def append(self, delta, status, data1, data2=0, payload=None):
+		self.deltas.append(delta)
+		self.statuses.append(status)
+		self.data1.append(data1)
+		self.data2.append(data2)
+		self.payloads.append(payload)
+
+	# Add an event before the event at an index
+	def insert(self, index, delta, status, data1, data2=0, payload=None):
+		self.deltas.insert(index, delta)
+		self.statuses.insert(index, status)
+		self.data1.insert(index, data1)
+		self.data2.insert(index, data2)
+		self.payloads.insert(index, payload)
+
+	# Add a note_on and note_off for each row of some note columns, starting at the absolute time last_time
+	def append_notes(self, rows, starts, ends, pitches, velocities, channels, velocity=-1, last_time=0):
+		# Get the columns of the notes in order
+		note_starts = [starts[row] for row in rows]
+		note_ends = [ends[row] for row in rows]
+		note_channels = [channels[row] for row in rows]
+		note_pitches = [pitches[row] for row in rows]
+		# Each note_on is after the end of the note before it and each note_off is after its note_on
+		self.deltas.extend(chain.from_iterable(zip(map(int.__sub__, note_starts, [last_time] + note_ends[:-1]), map(int.__sub__, note_ends, note_starts))))
+		self.statuses.extend(chain.from_iterable((NOTE_ON | channel, NOTE_OFF | channel) for channel in note_channels))
+		self.data1.extend(chain.from_iterable(zip(note_pitches, note_pitches)))
+		# Use the velocity of every note unless it is overridden
+		self.data2.extend(chain.from_iterable(zip(repeat(velocity) if velocity >= 0 else (velocities[row] for row in rows), repeat(0, len(rows)))))
+		self.payloads.extend(repeat(None, 2 * len(rows)))
+
+	# Get a new track with the events at some indices
+	def select(self, indices):
+		track = EventTrack()
+		track.deltas = array("q", [self.deltas[k] for k in indices])
+		track.statuses = array("B", [self.statuses[k] for k in indices])
+		track.data1 = array("B", [self.data1[k] for k in indices])
+		track.data2 = array("B", [self.data2[k] for k in indices])
+		track.payloads = [self.payloads[k] for k in indices]
+		return track
+
+	# Move every channel message to a channel
+	def set_channel(self, channel):
+		# Map each channel status to the same type of message on the channel(other statuses stay the same)
+		table = bytes((status & 0xF0) | channel if status < 0xF0 else status for status in range(256))
+		self.statuses = array("B", self.statuses.tobytes().translate(table))
+
+	# Encode the track as an MTrk chunk
+	def write(self):
+		# Create a buffer for the data of the chunk
+		data = bytearray()
+		# Create variables to store the running status and the delta of the end_of_track events that were removed
+		running_status = None
+		carry = 0
+		# Loop through the events
+		for delta, status, data1, data2, payload in zip(self.deltas, self.statuses, self.data1, self.data2, self.payloads):
+			# If this is an end_of_track event, skip it and add its delta to the next event
+			if(status == META and data1 == END_OF_TRACK):
+				carry += delta
+				continue
+			delta += carry
+			carry = 0
+			# Write the delta time(most are a single byte)
+			if(0 <= delta < 0x80):
+				data.append(delta)
+			else:
+				data += encode_variable_int(delta)
+			# If this is a meta event
+			if(status == META):
+				# Write the type, length and data
+				data.append(META)
+				data.append(data1)
+				data += encode_variable_int(len(payload))
+				data += payload
+				# Meta events stop the running status
+				running_status = None
+			# Otherwise it is a channel message
+			else:
+				# Only write the status if it changed
+				if(status != running_status):
+					data.append(status)
+					running_status = status
+				# Write the data bytes
+				data.append(data1)
+				if(CHANNEL_DATA_LENGTHS[status >> 4] == 2):
+					data.append(data2)
+		# End the track
+		data += encode_variable_int(carry)
+		data += bytes((META, END_OF_TRACK, 0))
+		# Return the chunk
+		return b"MTrk" + struct.pack(">L", len(data)) + data
+
+# A Standard MIDI File that is being built to be written
+class MidiWriter:
+	"""The header and EventTracks of a Standard MIDI File that is being built, save or to_bytes writes it"""
+	def __init__(self, ticks_per_beat, type=1):
+		# Store the header
+		self.type = type
+		self.ticks_per_beat = ticks_per_beat
+		# Create a list for the tracks
+		self.tracks = []
+
+	# Encode the header chunk and then each track chunk(prepare is called with the index of each track and the track, and the track it returns is written)
+	def chunks(self, prepare=None):
+		yield b"MThd" + struct.pack(">Lhhh", 6, self.type, len(self.tracks), self.ticks_per_beat)
+		for i, track in enumerate(self.tracks):
+			yield (track if prepare == None else prepare(i, track)).write()
+
+	# Encode the file as bytes
+	def to_bytes(self):
+		return b"".join(self.chunks())
+
+	# Write the file
+	def save(self, filename):
+		with open(filename, "wb") as file:
+			for chunk in self.chunks():
+				file.write(chunk)
+
+# A temporary file that finished tracks are moved to until they are written
+class TrackSpill:
+	"""A temporary file of EventTracks, so a song can be built without keeping all of its tracks in memory
+
+	add moves a track to the end of the file and returns a SpilledTrack that loads it again. The file is deleted
+	when the spill is closed.
+	"""
+	def __init__(self):
+		# Create the file
+		self.file = tempfile.TemporaryFile()
+
+	# Move a track to the file, returning a SpilledTrack to load it with
+	def add(self, track):
+		# Write the track at the end of the file
+		self.file.seek(0, 2)
+		position = self.file.tell()
+		pickle.dump(track, self.file, pickle.HIGHEST_PROTOCOL)
+		# Return where it is
+		return SpilledTrack(self, position)
+
+	# Load the track at a position of the file
+	def load(self, position):
+		self.file.seek(position)
+		return pickle.load(self.file)
+
+	# Delete the file
+	def close(self):
+		self.file.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		self.close()
+
+# A track that was moved to a TrackSpill
+class SpilledTrack:
+	"""The position of an EventTrack in a TrackSpill, load reads it back"""
+	def __init__(self, spill, position):
+		# Store the spill and the position of the track in it
+		self.spill = spill
+		self.position = position
+
+	# Read the track
+	def load(self):
+		return self.spill.load(self.position)
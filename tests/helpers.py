@@ -0,0 +1,56 @@
+import io
+import mido
+import midi_parser as mp
+
+# Build a MIDI file from lists of messages(one list per track, with delta times) and return it as bytes
+def midi_bytes(*tracks, ticks_per_beat=480, type=1):
+	# Create the file and add the tracks
+	song = mido.MidiFile(type=type, ticks_per_beat=ticks_per_beat)
+	for messages in tracks:
+		song.tracks.append(mido.MidiTrack(messages))
+	# Save it to bytes
+	buffer = io.BytesIO()
+	song.save(file=buffer)
+	return buffer.getvalue()
+
+# Read a converted file with mido
+def read_song(data):
+	return mido.MidiFile(file=io.BytesIO(data))
+
+# Get the (absolute tick, message) of every message of a track
+def absolute_messages(track):
+	# Create a variable to store the tick of the current message
+	tick = 0
+	# Create a list for the messages
+	messages = []
+	for message in track:
+		tick += message.time
+		messages.append((tick, message))
+	return messages
+
+# Get the (start tick, end tick, pitch, channel) of every note of a track
+def track_notes(track):
+	# Create a dictionary for the notes that are on
+	started = {}
+	# Create a list for the notes
+	notes = []
+	for tick, message in absolute_messages(track):
+		# If a note starts, remember when
+		if(message.type == "note_on" and message.velocity > 0):
+			started[(message.channel, message.note)] = tick
+		# If a note ends, add it
+		elif(message.type == "note_off" or message.type == "note_on"):
+			notes.append((started.pop((message.channel, message.note)), tick, message.note, message.channel))
+	# Return the notes in order
+	return sorted(notes)
+
+# Create a note_on and note_off message for a note(the note_off comes length ticks after the note_on)
+def note(pitch, length, delay=0, channel=0, velocity=64):
+	return [mido.Message("note_on", note=pitch, velocity=velocity, channel=channel, time=delay), mido.Message("note_off", note=pitch, channel=channel, time=length)]
+
+# Create a table of notes from (start, end, pitch) tuples sorted by start
+def note_table(notes):
+	table = mp.NoteTable()
+	for start, end, pitch in sorted(notes, key=lambda note: note[0]):
+		table.append(start, end, pitch, 64, 0, 0)
+	return table
@@ -0,0 +1,35 @@
+import midi_parser as mp
+from helpers import midi_bytes, read_song, track_notes, note, note_table
+
+# Align a table of notes and get its (start, end, pitch, aligned) rows
+def aligned_notes(notes, margin):
+	table = note_table(notes)
+	mp.align_notes(table, margin)
+	return [(table.starts[j], table.ends[j], table.pitches[j], table.aligned[j]) for j in range(len(table))]
+
+# Ends within the margin of each other move to their mean(rounded down)
+def test_ends_align_to_mean():
+	assert aligned_notes([(0, 100, 60), (0, 103, 62)], 5) == [(0, 101, 60, 0b01), (0, 101, 62, 0b01)]
+
+# Starts within the margin of an end move with it
+def test_starts_align_with_ends():
+	assert aligned_notes([(0, 100, 60), (0, 103, 62), (102, 300, 64)], 5) == [(0, 101, 60, 0b01), (0, 101, 62, 0b01), (101, 300, 64, 0b10)]
+
+# Times further apart than the margin don't move
+def test_times_outside_margin():
+	assert aligned_notes([(0, 100, 60), (0, 110, 62)], 5) == [(0, 100, 60, 0), (0, 110, 62, 0)]
+
+# Each time is only aligned once, and the notes stay sorted by their start
+def test_aligned_once_and_sorted():
+	notes = aligned_notes([(0, 100, 60), (95, 200, 62), (96, 150, 64)], 5)
+	assert notes == [(0, 97, 60, 0b01), (97, 200, 62, 0b10), (97, 150, 64, 0b10)]
+
+# Notes of a file that end within the aligning margin end together
+def test_convert_with_margin():
+	# Two notes that end 10 ticks(about 10 milliseconds at 120 BPM and 480 ticks per beat) apart
+	messages = note(60, 100)
+	messages.insert(1, note(64, 0)[0])
+	messages.append(note(64, 10)[1])
+	song = read_song(mp.convert_bytes(midi_bytes(messages), align_margin="0.02", create_channels=False, index_patches=False))
+	ends = set(end for track in song.tracks for start, end, pitch, channel in track_notes(track))
+	assert len(ends) == 1
@@ -0,0 +1,33 @@
+import mido
+import midi_parser as mp
+from helpers import midi_bytes, read_song, note
+
+# Build a file with a track of one note for each channel index and a meta only track after them
+def overflow_song(note_tracks):
+	tracks = [note(60, 100) for i in range(note_tracks)]
+	tracks.append([mido.MetaMessage("track_name", name="Meta")])
+	return midi_bytes(*tracks)
+
+# The tracks past the 16th share the last channel, but the meta only track after them isn't counted
+def test_channel_overflow_skips_meta_tracks():
+	data = overflow_song(18)
+	analysis = mp.analyze_bytes(data)
+	# Count the output tracks with notes on the last channel
+	song = read_song(mp.convert_bytes(data, index_patches=False))
+	last_channel = sum(1 for track in song.tracks if any(message.type == "note_on" and message.channel == 15 for message in track))
+	assert analysis.output_tracks == len(song.tracks)
+	assert analysis.channel_overflow == last_channel - 1 == 2
+
+# Without creating channels nothing is clamped
+def test_no_overflow_without_channels():
+	assert mp.analyze_bytes(overflow_song(18), create_channels=False).channel_overflow == 0
+
+# The analysis counts the notes, polyphony and split tracks of each track
+def test_analysis_counts():
+	# A chord of three notes and then a single note
+	chord = [mido.Message("note_on", note=pitch, velocity=64, time=0) for pitch in (60, 64, 67)]
+	chord += [mido.Message("note_off", note=pitch, time=100 if pitch == 60 else 0) for pitch in (60, 64, 67)]
+	analysis = mp.analyze_bytes(midi_bytes(chord + note(72, 100)))
+	assert analysis.tracks[0]["notes"] == 4
+	assert analysis.tracks[0]["split_tracks"] == 3
+	assert analysis.max_polyphony == 3
@@ -0,0 +1,35 @@
+import mido
+import midi_parser as mp
+from helpers import midi_bytes, read_song, absolute_messages, note
+
+# Get the (tick, program) of the program changes of the tracks of a converted file
+def program_changes(data):
+	return [[(tick, message.program) for tick, message in absolute_messages(track) if message.type == "program_change"] for track in read_song(data).tracks]
+
+# Create the messages of two notes that start and end together
+def chord(length, delay=0):
+	return [mido.Message("note_on", note=60, velocity=64, time=delay), mido.Message("note_on", note=64, velocity=64), mido.Message("note_off", note=60, time=length), mido.Message("note_off", note=64)]
+
+# Program changes are put at the time their patch starts, before the notes that use it
+def test_program_change_at_patch_time():
+	messages = [mido.Message("program_change", program=13, time=46)] + note(60, 21, delay=15)
+	messages += [mido.Message("program_change", program=18, time=4)] + note(60, 38, delay=12)
+	changes = program_changes(mp.convert_bytes(midi_bytes(messages), index_patches=False))
+	# The track starts with the patch at tick 46 and changes at tick 86
+	assert changes[1] == [(46, 13), (86, 18)]
+
+# Each split track gets the program changes of its own notes at the time the patch starts
+def test_program_change_in_split_tracks():
+	# The patch changes while both notes of a chord are on
+	messages = chord(100)
+	messages.insert(2, mido.Message("program_change", program=7, time=50))
+	messages[3].time = 50
+	messages += chord(100, delay=100)
+	changes = program_changes(mp.convert_bytes(midi_bytes(messages), index_patches=False))
+	assert changes[1] == changes[2] == [(0, 0), (50, 7)]
+
+# Indexing patches replaces the program changes with one for the index of each split track
+def test_index_patches():
+	messages = [mido.Message("program_change", program=13)] + chord(100)
+	changes = program_changes(mp.convert_bytes(midi_bytes(messages)))
+	assert changes[1:] == [[(0, 0)], [(0, 1)]]
@@ -0,0 +1,39 @@
+import mido
+import pytest
+import midi_parser as mp
+from helpers import midi_bytes, read_song, note
+
+# A track with only a program change is split into no tracks, which used to break the indices of the next track
+def test_program_change_only_track():
+	data = midi_bytes([mido.Message("program_change", program=5)], note(60, 100))
+	song = read_song(mp.convert_bytes(data))
+	# The note track is still converted
+	assert sum(1 for track in song.tracks for message in track if message.type == "note_on") == 1
+
+# A data byte above 0x7F is rejected like mido rejects it
+def test_data_byte_out_of_range():
+	data = bytearray(midi_bytes(note(60, 100)))
+	data[data.index(bytes([0x90, 60, 64])) + 1] = 0xC0
+	with pytest.raises(mp.InputError):
+		mp.convert_bytes(bytes(data))
+
+# A time division in SMPTE frames or of 0 ticks per beat is an input error
+@pytest.mark.parametrize("division", [0, -7000])
+def test_time_division(division):
+	data = bytearray(midi_bytes(note(60, 100)))
+	data[12:14] = division.to_bytes(2, "big", signed=True)
+	with pytest.raises(mp.InputError):
+		mp.convert_bytes(bytes(data))
+
+# parse returns the error instead of raising it
+def test_parse_returns_error(tmp_path):
+	input_file = tmp_path / "broken.mid"
+	input_file.write_bytes(b"not a MIDI file")
+	result = mp.parse(str(input_file), str(tmp_path / "out.mid"), "", "", True, "", True, True)
+	assert isinstance(result, mp.InputError)
+
+# A tempo of 0 microseconds per beat is an input error instead of a division by zero
+def test_zero_tempo():
+	data = midi_bytes([mido.MetaMessage("set_tempo", tempo=0)] + note(60, 100))
+	with pytest.raises(mp.InputError):
+		mp.convert_bytes(data)
@@ -0,0 +1,43 @@
+import mido
+import midi_parser as mp
+from helpers import midi_bytes, read_song, track_notes
+
+# Convert a track and get the (start, end, pitch, channel) of all of its notes
+def song_notes(messages):
+	song = read_song(mp.convert_bytes(midi_bytes(messages), create_channels=False, index_patches=False))
+	return sorted(note for track in song.tracks for note in track_notes(track))
+
+# Create a message with an absolute tick instead of a delta time
+def at(tick, kind, **fields):
+	return (tick, mido.Message(kind, **fields))
+
+# Turn (tick, message) pairs into messages with delta times
+def delta_messages(*pairs):
+	messages = []
+	last = 0
+	for tick, message in pairs:
+		messages.append(message.copy(time=tick - last))
+		last = tick
+	return messages
+
+# A note off only ends the note with the same pitch on its own channel
+def test_note_off_on_its_channel():
+	messages = delta_messages(at(0, "note_on", note=60, velocity=64, channel=0), at(0, "note_on", note=60, velocity=64, channel=1), at(100, "note_off", note=60, channel=1), at(200, "note_off", note=60, channel=0))
+	assert song_notes(messages) == [(0, 100, 60, 1), (0, 200, 60, 0)]
+
+# Notes held by the sustain pedal end when it is released
+def test_sustain():
+	messages = delta_messages(at(0, "note_on", note=60, velocity=64), at(10, "control_change", control=64, value=127), at(50, "note_off", note=60), at(300, "control_change", control=64, value=0))
+	assert song_notes(messages) == [(0, 300, 60, 0)]
+
+# Notes held by sostenuto ignore their note offs and end when it is released, other notes end normally
+def test_sostenuto():
+	messages = delta_messages(at(0, "note_on", note=60, velocity=64), at(10, "control_change", control=66, value=127), at(20, "note_on", note=64, velocity=64), at(50, "note_off", note=60), at(80, "note_off", note=64), at(300, "control_change", control=66, value=0))
+	# After the release, the same pitch can be played again
+	messages += delta_messages(at(100, "note_on", note=60, velocity=64), at(150, "note_off", note=60))
+	assert song_notes(messages) == [(0, 300, 60, 0), (20, 80, 64, 0), (400, 450, 60, 0)]
+
+# An all notes off message ends every note
+def test_all_notes_off():
+	messages = delta_messages(at(0, "note_on", note=60, velocity=64), at(0, "note_on", note=64, velocity=64, channel=3), at(120, "control_change", control=120, value=0), at(500, "note_off", note=60))
+	assert song_notes(messages) == [(0, 120, 60, 0), (0, 120, 64, 3)]
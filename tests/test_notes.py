@@ -0,0 +1,56 @@
+import random
+import pytest
+import constants as c
+import midi_parser as mp
+from helpers import note_table
+
+# Get the notes of a table in the list format
+def table_notes(table):
+	return [table.note(j) for j in range(len(table))]
+
+# A new note doesn't have an end or a track index until they are set
+def test_append():
+	table = mp.NoteTable()
+	assert table.append(10, -1, 60, 100, 2, 5) == 0
+	assert table_notes(table) == [[10, None, 60, 100, 0, None, 2, 5]]
+
+# Keeping rows reorders every field together
+def test_keep():
+	table = note_table([(0, 10, 60), (5, 15, 62), (7, 20, 64)])
+	table.velocities[1] = 99
+	table.keep([2, 1])
+	assert table_notes(table) == [[7, 20, 64, 64, 0, None, 0, 0], [5, 15, 62, 99, 0, None, 0, 0]]
+
+# Slices, copies and extended tables don't share arrays with the table they came from
+def test_slice_copy_extend():
+	table = note_table([(0, 10, 60), (5, 15, 62), (7, 20, 64)])
+	part = table.slice(1, 3)
+	copy = table.copy()
+	part.extend(table.slice(0, 1))
+	part.starts[0] = 6
+	copy.starts[0] = 1
+	assert table_notes(table) == table_notes(note_table([(0, 10, 60), (5, 15, 62), (7, 20, 64)]))
+	assert [(row[0], row[2]) for row in table_notes(part)] == [(6, 62), (7, 64), (0, 60)]
+
+# Create a table of random notes with duplicates, empty notes and times over a few tempo changes
+def random_table(seed):
+	rng = random.Random(seed)
+	notes = [(start, start + rng.choice([0, 0, 1, 50, 300]), rng.randint(60, 63)) for start in sorted(rng.randint(0, 5000) for j in range(500))]
+	# Repeat some of the notes
+	return note_table(notes + rng.sample(notes, 100))
+
+# The NumPy and Python versions of the note processing give the same notes
+@pytest.mark.skipif(mp.np == None, reason="NumPy isn't installed")
+def test_vectorized_matches_python(monkeypatch):
+	tempo_map = mp.TempoMap({0: 500000, 960: 250000, 2000: 1234567}, 480)
+	results = []
+	for vectorize_min_notes in (c.VECTORIZE_MIN_NOTES, 1):
+		monkeypatch.setattr(c, "VECTORIZE_MIN_NOTES", vectorize_min_notes)
+		table = random_table(1)
+		mp.remove_duplicates(table)
+		mp.remove_empty_notes(table)
+		seconds = table_notes(mp.notes2second(table, tempo_map))
+		results.append((seconds, table_notes(mp.notes2tick(table, tempo_map))))
+	assert results[0] == results[1]
+	# The tables have duplicates and empty notes to remove
+	assert len(results[0][0]) < 500
@@ -0,0 +1,49 @@
+import random
+import mido
+import pytest
+import constants as c
+import midi_parser as mp
+from helpers import midi_bytes
+
+# Create the messages of a track of random phrases separated by gaps(with tempo changes between some of them)
+def phrases(seed, count):
+	rng = random.Random(seed)
+	# Create a list for the (tick, order, message) of the events
+	events = []
+	tick = 0
+	for phrase in range(count):
+		for j in range(rng.randint(1, 20)):
+			start = tick + rng.randint(0, 100)
+			pitch = rng.randint(40, 90)
+			channel = rng.randint(0, 3)
+			events.append((start, 1, mido.Message("note_on", note=pitch, velocity=rng.randint(1, 127), channel=channel)))
+			events.append((start + rng.randint(1, 150), 0, mido.Message("note_off", note=pitch, channel=channel)))
+		# Leave a gap about as wide as the alignment margin before the next phrase
+		tick = max(event[0] for event in events) + rng.choice([0, 1, 10, 18, 19, 20, 21, 40])
+		if(rng.random() < 0.1):
+			events.append((tick, 2, mido.MetaMessage("set_tempo", tempo=rng.randint(300000, 900000))))
+	events.sort(key=lambda event: event[:2])
+	# Turn the ticks into delta times
+	messages = []
+	last = 0
+	for tick, order, message in events:
+		messages.append(message.copy(time=tick - last))
+		last = tick
+	return messages
+
+# Convert a file with the default options and a margin of about 20 ticks
+def convert(data, **options):
+	return mp.convert_bytes(data, align_margin="0.02", normalized_tempo="120", **options)
+
+# Splitting a file in parallel, in segments, with NumPy or with low memory gives the same file as splitting it serially
+@pytest.mark.parametrize("vectorize_min_notes", [c.VECTORIZE_MIN_NOTES, 1])
+def test_paths_match_serial(monkeypatch, vectorize_min_notes):
+	monkeypatch.setattr(c, "VECTORIZE_MIN_NOTES", vectorize_min_notes)
+	tracks = midi_bytes(*[phrases(seed, 40) for seed in range(4)])
+	single = midi_bytes(phrases(4, 150))
+	serial = convert(tracks), convert(single)
+	assert (convert(tracks, workers=2), convert(single, workers=2)) == serial
+	assert (convert(tracks, low_memory=True), convert(single, low_memory=True)) == serial
+	# Cut the single track into as many segments as the gaps allow
+	monkeypatch.setattr(c, "SEGMENT_MIN_NOTES", 1)
+	assert convert(single, workers=4) == serial[1]
@@ -0,0 +1,46 @@
+import random
+import mido
+import midi_parser as mp
+from helpers import midi_bytes, read_song, track_notes, note, note_table
+
+# Get the notes of the split tracks of a converted file without channels
+def split_tracks(messages):
+	song = read_song(mp.convert_bytes(midi_bytes(messages), create_channels=False, index_patches=False))
+	return [track_notes(track) for track in song.tracks if len(track_notes(track)) > 0]
+
+# The highest note of a chord goes in the first track
+def test_highest_pitch_first():
+	messages = [mido.Message("note_on", note=pitch, velocity=64) for pitch in (60, 67, 64)]
+	messages += [mido.Message("note_off", note=pitch, time=100 if pitch == 60 else 0) for pitch in (60, 67, 64)]
+	assert [[pitch for start, end, pitch, channel in notes] for notes in split_tracks(messages)] == [[67], [64], [60]]
+
+# Notes with the same pitch and start(on different channels) get their own tracks instead of sharing one
+def test_identical_notes_get_separate_tracks():
+	messages = [mido.Message("note_on", note=60, velocity=64, channel=0), mido.Message("note_on", note=60, velocity=64, channel=1)]
+	messages += [mido.Message("note_off", note=60, channel=0, time=100), mido.Message("note_off", note=60, channel=1, time=100)]
+	# The later one in the track comes first
+	assert split_tracks(messages) == [[(0, 200, 60, 1)], [(0, 100, 60, 0)]]
+
+# Notes that don't overlap stay in the same track
+def test_sequential_notes_share_a_track():
+	messages = note(60, 100) + note(72, 100) + note(48, 100)
+	assert len(split_tracks(messages)) == 1
+
+# A huge chord doesn't hit the recursion limit
+def test_large_chord():
+	notes = note_table([(0, 100, j % 128) for j in range(5000)])
+	mp.assign_track_indices(notes)
+	assert sorted(notes.track_indices) == list(range(5000))
+
+# The indices are the same as the recursive get_track_index gives(except for notes with the same pitch and start)
+def test_matches_get_track_index():
+	generator = random.Random(1)
+	for k in range(50):
+		# Pick 40 different (start, pitch) pairs
+		starts = generator.sample([(start, pitch) for start in range(200) for pitch in range(60, 73)], 40)
+		notes = note_table([(start, start + generator.randint(1, 50), pitch) for start, pitch in starts])
+		# Find the indices with the recursive function on lists of the notes
+		rows = [notes.note(j) for j in range(len(notes))]
+		expected = [mp.get_track_index(row, rows) for row in rows]
+		mp.assign_track_indices(notes)
+		assert list(notes.track_indices) == expected
@@ -0,0 +1,41 @@
+import mido
+from fractions import Fraction
+import midi_parser as mp
+from helpers import midi_bytes, read_song, track_notes, note
+
+# A tempo map with 120 BPM, then 60 BPM from beat 1 and 200 BPM from beat 3
+def tempo_map():
+	return mp.TempoMap({0: 500000, 480: 1000000, 1440: 300000}, 480)
+
+# Ticks convert to exact seconds across tempo changes
+def test_tick2second():
+	tempos = tempo_map()
+	assert tempos.tick2second(480) == Fraction(1, 2)
+	assert tempos.tick2second(960) == Fraction(3, 2)
+	assert tempos.tick2second(1680) == Fraction(5, 2) + Fraction(3, 20)
+
+# Converting ticks to time units and back gives the same ticks
+def test_round_trip():
+	tempos = tempo_map()
+	for tick in range(3000):
+		assert tempos.time2tick(tempos.tick2time(tick)) == tick
+
+# Seconds convert to ticks rounded down
+def test_second2tick_rounds_down():
+	tempos = tempo_map()
+	assert tempos.second2tick(Fraction(1, 4)) == 240
+	assert tempos.second2tick(Fraction(1, 4) - Fraction(1, 10 ** 9)) == 239
+
+# Notes keep their ticks across tempo changes when nothing is aligned
+def test_convert_keeps_ticks():
+	messages = [mido.MetaMessage("set_tempo", tempo=500000)] + note(60, 333, delay=7)
+	messages += [mido.MetaMessage("set_tempo", tempo=1234567, time=100)] + note(62, 999, delay=11)
+	song = read_song(mp.convert_bytes(midi_bytes(messages), create_channels=False, index_patches=False))
+	assert [notes for notes in map(track_notes, song.tracks) if len(notes) > 0] == [[(7, 340, 60, 0), (451, 1450, 62, 0)]]
+
+# Normalizing the tempo keeps the notes at the same time in seconds
+def test_normalized_tempo():
+	messages = note(60, 480, delay=480)
+	song = read_song(mp.convert_bytes(midi_bytes(messages), normalized_tempo="60", create_channels=False, index_patches=False))
+	# At 60 BPM a beat is twice as long, so the note is at half the ticks
+	assert [notes for notes in map(track_notes, song.tracks) if len(notes) > 0] == [[(240, 480, 60, 0)]]